@@ -0,0 +1,442 @@
+# benchmarks/bench.py
+
+"""
+Micro-benchmarks for the cube engine and the solver.
+
+Run all of them and print JSON::
+
+    python -m benchmarks.bench --output results.json
+    python -m benchmarks.bench --baseline results.json --threshold 0.15
+
+With ``--baseline`` every benchmark is compared with a saved run; the command
+exits with status 1 if any of them got slower (or a cube got bigger) by more
+than the threshold.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from core.algorithm import compile_algorithm
+from core.cube import ENGINES, RubiksCube
+from core.scramble import Scrambler, generate_scrambles
+from solver.cache import SolutionCache
+from solver.kociemba import BACKENDS, Kociemba_Solver
+from utils.faces import Face
+
+# Method of RubiksCube for each move name
+MOVE_METHODS = {
+    move: move[0] + {"": "", "'": "_prime", "2": "2"}[move[1:]]
+    for move in Scrambler.MOVES
+}
+
+SCRAMBLE_LENGTH = 20
+
+# Directory the cold-solve subprocess imports the project from
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Benchmark:
+    """
+    A named benchmark.
+
+    ``run(number, engine, backend)`` performs ``number`` operations and returns
+    the seconds they took, so any per-sample setup stays outside the timing.
+    Without ``warmup`` no untimed sample runs first.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable,
+        number: int,
+        repeat: int = 50,
+        warmup: bool = True,
+    ):
+        self.name = name
+        self.run = run
+        self.number = number
+        self.repeat = repeat
+        self.warmup = warmup
+
+
+# -------- Benchmarks --------
+def _bench_move(method: str):
+    def run(number, engine, backend):
+        cube = RubiksCube(engine)
+        turn = getattr(cube, method)
+        start = time.perf_counter()
+        for _ in range(number):
+            turn()
+        return time.perf_counter() - start
+
+    return run
+
+
+def _bench_hashed_moves(number, engine, backend):
+    cube = RubiksCube(engine)
+    cube.state_hash()  # from here on every move updates the hash
+    moves = [getattr(cube, MOVE_METHODS[move]) for move in Scrambler.MOVES]
+    start = time.perf_counter()
+    for i in range(number):
+        moves[i % 18]()
+    cube.state_hash()
+    return time.perf_counter() - start
+
+
+def _bench_apply_scramble(number, engine, backend):
+    scrambler = Scrambler()
+    scrambles = [scrambler.generate_scramble(SCRAMBLE_LENGTH) for _ in range(number)]
+    cubes = [RubiksCube(engine) for _ in range(number)]
+    start = time.perf_counter()
+    for cube, scramble in zip(cubes, scrambles):
+        scrambler.apply_scramble(cube, scramble)
+    return time.perf_counter() - start
+
+
+def _bench_apply_algorithm(number, engine, backend):
+    algorithm = compile_algorithm("(R U R' U')6")  # 24 moves, compiled once
+    cube = RubiksCube(engine)
+    start = time.perf_counter()
+    for _ in range(number):
+        cube.apply_algorithm(algorithm)
+    return time.perf_counter() - start
+
+
+def _bench_generate_scrambles(number, engine, backend):
+    start = time.perf_counter()
+    generate_scrambles(number, SCRAMBLE_LENGTH, rng=0)
+    return time.perf_counter() - start
+
+
+def _scrambled_cube(engine) -> RubiksCube:
+    cube = RubiksCube(engine)
+    scrambler = Scrambler()
+    scrambler.apply_scramble(cube, scrambler.generate_scramble(SCRAMBLE_LENGTH))
+    return cube
+
+
+def _bench_get_face(number, engine, backend):
+    cube = _scrambled_cube(engine)
+    faces = list(Face)
+    start = time.perf_counter()
+    for i in range(number):
+        cube.get_face(faces[i % 6])
+    return time.perf_counter() - start
+
+
+def _bench_to_string(number, engine, backend):
+    cube = _scrambled_cube(engine)
+    start = time.perf_counter()
+    for _ in range(number):
+        cube.toString()
+    return time.perf_counter() - start
+
+
+def _bench_is_solved(number, engine, backend):
+    cube = _scrambled_cube(engine)
+    start = time.perf_counter()
+    for _ in range(number):
+        cube.is_solved()
+    return time.perf_counter() - start
+
+
+def _bench_construct(number, engine, backend):
+    start = time.perf_counter()
+    for _ in range(number):
+        RubiksCube(engine)
+    return time.perf_counter() - start
+
+
+def _bench_from_string(number, engine, backend):
+    cube_string = _scrambled_cube(engine).toString()
+    start = time.perf_counter()
+    for _ in range(number):
+        RubiksCube.from_string(cube_string, engine)
+    return time.perf_counter() - start
+
+
+def _bench_reset(number, engine, backend):
+    cube = _scrambled_cube(engine)
+    start = time.perf_counter()
+    for _ in range(number):
+        cube.reset()
+    return time.perf_counter() - start
+
+
+def _bench_clone(number, engine, backend):
+    cube = _scrambled_cube(engine)
+    start = time.perf_counter()
+    for _ in range(number):
+        cube.clone()
+    return time.perf_counter() - start
+
+
+def _bench_solve(cached: bool):
+    def run(number, engine, backend):
+        cubes = [_scrambled_cube(engine) for _ in range(number)]
+        # A fresh cache of the same kind as the solver's default
+        caches = Kociemba_Solver.caches
+        saved = caches.get(backend)
+        caches[backend] = SolutionCache(maxsize=4096)
+        try:
+            if cached:
+                for cube in cubes:
+                    Kociemba_Solver(cube, backend).get_solution()
+            start = time.perf_counter()
+            for cube in cubes:
+                Kociemba_Solver(cube, backend).get_solution()
+            return time.perf_counter() - start
+        finally:
+            caches[backend] = saved
+
+    return run
+
+
+# Timed inside the child, so interpreter start-up is left out but imports and
+# table loading are not
+_COLD_SOLVE = """
+import sys, time
+start = time.perf_counter()
+from core.cube import RubiksCube
+from solver.kociemba import Kociemba_Solver
+cube = RubiksCube.from_string(sys.argv[1], sys.argv[2])
+Kociemba_Solver(cube, sys.argv[3]).get_solution()
+print(time.perf_counter() - start)
+"""
+
+
+def _bench_cold_solve(number, engine, backend):
+    total = 0.0
+    for _ in range(number):
+        cube_string = _scrambled_cube(engine).toString()
+        child = subprocess.run(
+            [sys.executable, "-c", _COLD_SOLVE, cube_string, engine, backend],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        total += float(child.stdout)
+    return total
+
+
+BENCHMARKS = [
+    *(
+        Benchmark(f"move.{move}", _bench_move(method), number=1000)
+        for move, method in MOVE_METHODS.items()
+    ),
+    Benchmark("move.hashed", _bench_hashed_moves, number=1000),
+    Benchmark("apply_scramble", _bench_apply_scramble, number=100),
+    Benchmark("generate_scrambles", _bench_generate_scrambles, number=10000),
+    Benchmark("apply_algorithm", _bench_apply_algorithm, number=1000),
+    Benchmark("get_face", _bench_get_face, number=1000),
+    Benchmark("toString", _bench_to_string, number=1000),
+    Benchmark("is_solved", _bench_is_solved, number=1000),
+    Benchmark("construct", _bench_construct, number=200),
+    Benchmark("from_string", _bench_from_string, number=200),
+    Benchmark("reset", _bench_reset, number=200),
+    Benchmark("clone", _bench_clone, number=1000),
+    # Solver tables are loaded by the warm-up sample, so a miss is a full search
+    Benchmark("solve.cache_miss", _bench_solve(cached=False), number=1, repeat=30),
+    Benchmark("solve.cache_hit", _bench_solve(cached=True), number=1, repeat=30),
+    # The first solve of a fresh process, imports and table loading included
+    Benchmark("solve.cold", _bench_cold_solve, number=1, repeat=5, warmup=False),
+]
+
+
+# -------- Measuring --------
+def percentile(samples: list[float], percent: float) -> float:
+    """Return the ``percent`` percentile of ``samples`` (linear interpolation)."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * percent / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def summarize(samples: list[float], batch: int = 1) -> dict:
+    """
+    Summarize per-operation times (seconds).
+
+    :param batch: Operations timed together in each sample; above 1 the
+        percentiles are over per-batch means, not over single calls
+    """
+    p50 = percentile(samples, 50)
+    return {
+        "samples": len(samples),
+        "batch": batch,
+        "mean": sum(samples) / len(samples),
+        "p50": p50,
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "ops_per_sec": 1 / p50 if p50 > 0 else None,
+    }
+
+
+def measure(
+    benchmark: Benchmark,
+    engine: str = "cubie",
+    backend: str = "kociemba",
+    scale: float = 1.0,
+) -> dict:
+    """
+    Run one benchmark and summarize its per-operation times.
+
+    Each sample times a batch of ``number`` operations, so the percentiles
+    describe the mean time per operation within a batch (reported as
+    ``"batch"``), not the spread of single calls. One untimed sample runs
+    first as a warm-up (lazy imports, table loading) unless the benchmark
+    disables it.
+
+    :param scale: Multiplies the number of samples and operations, e.g. 0.1
+        for a quick run
+    """
+    number = max(1, round(benchmark.number * scale))
+    repeat = max(3, round(benchmark.repeat * scale))
+    if benchmark.warmup:
+        benchmark.run(number, engine, backend)
+    samples = [benchmark.run(number, engine, backend) / number for _ in range(repeat)]
+    return summarize(samples, number)
+
+
+def peak_memory_per_cube(engine: str = "cubie", count: int = 200) -> float:
+    """Return the peak bytes allocated per scrambled cube (history included)."""
+    scrambler = Scrambler()
+    scrambles = [scrambler.generate_scramble(SCRAMBLE_LENGTH) for _ in range(count)]
+    tracemalloc.start()
+    try:
+        cubes = []
+        for scramble in scrambles:
+            cube = RubiksCube(engine)
+            scrambler.apply_scramble(cube, scramble)
+            cube.toString()
+            cubes.append(cube)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / count
+
+
+def run_benchmarks(
+    pattern: str = "*",
+    engine: str = "cubie",
+    backend: str = "kociemba",
+    scale: float = 1.0,
+    seed: int | None = 0,
+) -> dict:
+    """
+    Run every benchmark whose name matches the glob ``pattern``.
+
+    :return: A JSON-ready dict with the environment, the per-benchmark
+        summaries (seconds per operation) and the memory per cube
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, must be one of {list(ENGINES)}.")
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {backend!r}, must be one of {list(BACKENDS)}."
+        )
+    if seed is not None:
+        random.seed(seed)
+
+    results = {}
+    for benchmark in BENCHMARKS:
+        if fnmatch.fnmatchcase(benchmark.name, pattern):
+            results[benchmark.name] = measure(benchmark, engine, backend, scale)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "engine": engine,
+            "backend": backend,
+        },
+        "results": results,
+        "memory": {"bytes_per_cube": peak_memory_per_cube(engine)},
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.1) -> list[dict]:
+    """
+    Compare a report with a baseline report.
+
+    A benchmark regressed if its p50 grew by more than ``threshold`` (0.1 =
+    10 %); the memory per cube is checked the same way. Benchmarks missing from
+    either report are skipped.
+
+    :return: One entry per regression, with the old and new values and ratio
+    """
+    pairs = [
+        (f"{name}.p50", result["p50"], baseline["results"][name]["p50"])
+        for name, result in report["results"].items()
+        if name in baseline.get("results", {})
+    ]
+    if "memory" in report and "memory" in baseline:
+        pairs.append(
+            (
+                "memory.bytes_per_cube",
+                report["memory"]["bytes_per_cube"],
+                baseline["memory"]["bytes_per_cube"],
+            )
+        )
+
+    regressions = []
+    for name, new, old in pairs:
+        if old > 0 and new / old > 1 + threshold:
+            regressions.append(
+                {"name": name, "baseline": old, "current": new, "ratio": new / old}
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the cube and solver.")
+    parser.add_argument(
+        "--only", default="*", help="glob of benchmark names, e.g. 'move.*'"
+    )
+    parser.add_argument("--engine", choices=list(ENGINES), default="cubie")
+    parser.add_argument("--backend", choices=list(BACKENDS), default="kociemba")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="fraction of the default run size"
+    )
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown before a regression is reported (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.only, args.engine, args.backend, args.scale)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        report["regressions"] = compare(report, baseline, args.threshold)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+
+    for regression in report.get("regressions", []):
+        print(
+            f"REGRESSION {regression['name']}: {regression['baseline']:.3g} -> "
+            f"{regression['current']:.3g} ({regression['ratio']:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
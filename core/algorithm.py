@@ -0,0 +1,228 @@
+# core/algorithm.py
+
+"""
+Compile move notation into a simplified sequence of face turns.
+
+Besides the 18 face turns the notation may contain slice moves (M, E, S),
+wide moves (r or Rw, ...), whole-cube rotations (x, y, z), any turn count
+(``R3``, ``U2'``) and repeat groups (``(R U R' U')3``; a trailing ``'``
+inverts the group).
+
+The cube state is always kept relative to its centers, so a rotation does not
+change the state; it only changes which face the following moves turn. A
+slice or wide move becomes the matching outer face turns plus a rotation
+(``M`` = ``R L' x'``). The resulting face turns are then simplified: turns of
+one face merge (``R R`` -> ``R2``, ``R R'`` -> nothing), also across a turn of
+the opposite face (``U D U`` -> ``U2 D``).
+"""
+
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+
+from core.cubie import MOVES
+
+# Face at each position after one clockwise rotation, by the position it came
+# from: after x, the face on top is the one that was in front
+# fmt: off
+ROTATIONS = {
+    "x": {"U": "F", "F": "D", "D": "B", "B": "U"},
+    "y": {"F": "R", "R": "B", "B": "L", "L": "F"},
+    "z": {"U": "L", "R": "U", "D": "R", "L": "D"},
+}
+
+# Slice and wide moves as outer face turns (quarter turns) plus a rotation
+LAYER_MOVES = {
+    "M": ([("R", 1), ("L", 3)], ("x", 3)),
+    "E": ([("U", 1), ("D", 3)], ("y", 3)),
+    "S": ([("F", 3), ("B", 1)], ("z", 1)),
+    "r": ([("L", 1)], ("x", 1)),
+    "l": ([("R", 1)], ("x", 3)),
+    "u": ([("D", 1)], ("y", 1)),
+    "d": ([("U", 1)], ("y", 3)),
+    "f": ([("B", 1)], ("z", 1)),
+    "b": ([("F", 1)], ("z", 3)),
+}
+# fmt: on
+
+FACES = "UDFBRL"
+_AXIS = {"U": 0, "D": 0, "F": 1, "B": 1, "R": 2, "L": 2}
+_SUFFIX = {1: "", 2: "2", 3: "'"}
+_TOKEN = re.compile(
+    r"\s*(?:(?P<open>\()|(?P<close>\))(?P<count>\d*)(?P<invert>'?)"
+    r"|(?P<move>[URFDLB]w|[URFDLBMESxyzurfdlb])(?P<turns>\d*)(?P<prime>'?))"
+)
+
+
+class Algorithm:
+    """
+    A simplified sequence of face turns, e.g. ``Algorithm(["R", "U2"])``.
+
+    The sequence is composed into a single transform per engine the first
+    time it is applied to that engine's state, so applying it again costs
+    one step however long it is.
+    """
+
+    def __init__(self, moves: Sequence[str] = ()):
+        for move in moves:
+            if move not in MOVES:
+                raise ValueError(f"Unknown move {move!r}, must be one of {MOVES}.")
+        self.moves = tuple(moves)
+        self._transforms = {}
+
+    def __repr__(self):
+        return f"Algorithm({str(self)!r})"
+
+    def __str__(self):
+        return " ".join(self.moves)
+
+    def __len__(self):
+        return len(self.moves)
+
+    def __iter__(self):
+        return iter(self.moves)
+
+    def __eq__(self, other):
+        if not isinstance(other, Algorithm):
+            return NotImplemented
+        return self.moves == other.moves
+
+    def __hash__(self):
+        return hash(self.moves)
+
+    def inverse(self) -> "Algorithm":
+        """Return the sequence that undoes this one."""
+        return Algorithm([_invert(move) for move in reversed(self.moves)])
+
+    def transform(self, engine: type):
+        """Return (and cache) the composed transform for an engine class."""
+        transform = self._transforms.get(engine)
+        if transform is None:
+            transform = self._transforms[engine] = engine.compose(self.moves)
+        return transform
+
+    def apply_to(self, state):
+        """Apply the whole sequence to a ``CubieCube`` or ``FaceletCube`` in place."""
+        state.apply_transform(self.transform(type(state)))
+
+
+def compile_algorithm(
+    notation: str | Sequence[str], simplify: bool = True
+) -> Algorithm:
+    """
+    Compile notation such as ``"(R U R' U')3 M2 y"`` into an ``Algorithm``.
+
+    Results are cached, so compiling the same notation again is a lookup.
+
+    :param notation: A notation string, or a list of move tokens
+    :param simplify: Merge and cancel turns; without it only slice moves,
+        wide moves and rotations are rewritten
+    :raises ValueError: if the notation cannot be parsed
+    """
+    if not isinstance(notation, str):
+        notation = " ".join(notation)
+    return _compile(notation, simplify)
+
+
+@lru_cache(maxsize=256)
+def _compile(notation: str, simplify: bool) -> Algorithm:
+    frame = {face: face for face in FACES}
+    turns = []
+    for name, quarter in parse(notation):
+        if name in ROTATIONS:
+            for _ in range(quarter):
+                _rotate(frame, name)
+            continue
+        face_turns, rotation = LAYER_MOVES.get(name, ([(name, 1)], None))
+        for _ in range(quarter):
+            for face, face_quarter in face_turns:
+                turns.append((frame[face], face_quarter))
+            if rotation is not None:
+                for _ in range(rotation[1]):
+                    _rotate(frame, rotation[0])
+
+    if simplify:
+        turns = _simplify(turns)
+    else:
+        turns = [(face, quarter % 4) for face, quarter in turns if quarter % 4]
+    return Algorithm([face + _SUFFIX[quarter] for face, quarter in turns])
+
+
+def parse(notation: str) -> list[tuple[str, int]]:
+    """
+    Split notation into ``(move, quarter turns)`` pairs with groups expanded.
+
+    Moves are the face letters, ``M``/``E``/``S``, the lowercase wide moves
+    and ``x``/``y``/``z``; quarter turns are 1 to 3 (3 being a prime).
+    """
+    notation = notation.replace("’", "'")
+    stack = [[]]
+    position = 0
+    while position < len(notation):
+        match = _TOKEN.match(notation, position)
+        if match is None:
+            if not notation[position:].strip():
+                break
+            raise ValueError(f"Cannot parse {notation[position:]!r} in {notation!r}.")
+        position = match.end()
+
+        if match["open"]:
+            stack.append([])
+        elif match["close"] is not None:
+            if len(stack) == 1:
+                raise ValueError(f"Unmatched ')' in {notation!r}.")
+            group = stack.pop()
+            if match["invert"]:
+                group = [(name, 4 - quarter) for name, quarter in reversed(group)]
+            stack[-1].extend(group * int(match["count"] or 1))
+        else:
+            name = match["move"]
+            if name.endswith("w"):
+                name = name[0].lower()
+            quarter = int(match["turns"] or 1) % 4
+            if match["prime"]:
+                quarter = -quarter % 4
+            if quarter:
+                stack[-1].append((name, quarter))
+    if len(stack) != 1:
+        raise ValueError(f"Unmatched '(' in {notation!r}.")
+    return stack[0]
+
+
+# -------- Helper Functions --------
+def _rotate(frame: dict, rotation: str):
+    """Turn the whole cube: ``frame`` maps each position to the face now there."""
+    before = dict(frame)
+    for position, source in ROTATIONS[rotation].items():
+        frame[position] = before[source]
+
+
+def _simplify(turns: list[tuple[str, int]]) -> list[tuple[str, int]]:
+    """Merge turns of the same face, looking past turns of the opposite face."""
+    result = []
+    for face, quarter in turns:
+        axis = _AXIS[face]
+        i = len(result) - 1
+        while i >= 0 and _AXIS[result[i][0]] == axis and result[i][0] != face:
+            i -= 1
+        if i >= 0 and result[i][0] == face:
+            merged = (result[i][1] + quarter) % 4
+            if merged:
+                result[i] = (face, merged)
+            else:
+                del result[i]
+            continue
+
+        result.append((face, quarter % 4))
+        # Opposite faces commute: keep them in FACES order
+        if (
+            len(result) > 1
+            and _AXIS[result[-2][0]] == axis
+            and FACES.index(result[-2][0]) > FACES.index(face)
+        ):
+            result[-2], result[-1] = result[-1], result[-2]
+    return result
+
+
+def _invert(move: str) -> str:
+    return move[0] + {"": "'", "'": "", "2": "2"}[move[1:]]
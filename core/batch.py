@@ -0,0 +1,119 @@
+# core/batch.py
+
+"""Apply moves to many independent cubes at once with NumPy."""
+
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from core.cube import ENGINES, RubiksCube
+from core.cubie import MOVES
+from core.facelet import FACELET_PERMUTATIONS, SOLVED_FACELETS
+
+# Index of each move name in MOVES (and in PERMUTATIONS)
+MOVE_INDEX = {move: i for i, move in enumerate(MOVES)}
+
+# Sticker permutation of every move, shape (18, 54)
+PERMUTATIONS = np.array([FACELET_PERMUTATIONS[move] for move in MOVES], dtype=np.intp)
+
+SOLVED = np.frombuffer(SOLVED_FACELETS, dtype=np.uint8)
+
+
+def _move_index(move: str | int) -> int:
+    """Translate a move name (e.g. ``"U'"``) into its index in MOVES."""
+    if isinstance(move, str):
+        return MOVE_INDEX[move]
+    return int(move)
+
+
+class CubeBatch:
+    """
+    ``N`` cubes stored as one ``(N, 54)`` ``uint8`` array of facelet letters.
+
+    Rows use the same URFDLB sticker order as ``RubiksCube.toString()``.
+    """
+
+    def __init__(self, facelets: np.ndarray):
+        facelets = np.asarray(facelets, dtype=np.uint8)
+        if facelets.ndim != 2 or facelets.shape[1] != 54:
+            raise ValueError("Facelet array must have shape (N, 54).")
+        self.facelets = facelets
+
+    def __len__(self):
+        return self.facelets.shape[0]
+
+    def __repr__(self):
+        """String representation of the batch for debugging."""
+        return f"CubeBatch(size={len(self)})"
+
+    @classmethod
+    def solved(cls, size: int) -> "CubeBatch":
+        """Create ``size`` cubes in the solved state."""
+        return cls(np.tile(SOLVED, (size, 1)))
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "CubeBatch":
+        """Create a batch from Kociemba facelet strings."""
+        data = "".join(strings).encode("ascii")
+        return cls(np.frombuffer(data, dtype=np.uint8).reshape(-1, 54).copy())
+
+    @classmethod
+    def from_cubes(cls, cubes: Iterable[RubiksCube]) -> "CubeBatch":
+        """Create a batch holding the current state of each cube."""
+        return cls.from_strings(cube.toString() for cube in cubes)
+
+    def copy(self) -> "CubeBatch":
+        """Return an independent copy of this batch."""
+        return CubeBatch(self.facelets.copy())
+
+    def apply_move(self, move: str | int):
+        """Apply the same move to every cube."""
+        self.facelets = self.facelets[:, PERMUTATIONS[_move_index(move)]]
+
+    def apply_moves(self, moves: Sequence | np.ndarray):
+        """Apply a different move to each cube (one move per row)."""
+        if len(moves) and isinstance(moves[0], str):
+            moves = [MOVE_INDEX[move] for move in moves]
+        moves = np.asarray(moves, dtype=np.intp)
+        if moves.shape != (len(self),):
+            raise ValueError("Exactly one move per cube is required.")
+        # Gather from the flattened array: row offset plus the row's permutation
+        index = PERMUTATIONS[moves]
+        index += (np.arange(len(self), dtype=np.intp) * 54)[:, None]
+        self.facelets = np.ascontiguousarray(self.facelets).ravel()[index]
+
+    def apply_scrambles(self, scrambles: np.ndarray):
+        """
+        Apply one scramble per cube from a ``(N, length)`` array of move
+        indices, such as ``core.scramble.generate_scrambles`` returns.
+        """
+        scrambles = np.asarray(scrambles)
+        if scrambles.ndim != 2 or scrambles.shape[0] != len(self):
+            raise ValueError("Exactly one scramble per cube is required.")
+        for column in scrambles.T:
+            self.apply_moves(column)
+
+    def apply_sequence(self, sequence: Iterable[str | int]):
+        """Apply the same move sequence to every cube as a single permutation."""
+        perm = np.arange(54, dtype=np.intp)
+        for move in sequence:
+            perm = perm[PERMUTATIONS[_move_index(move)]]
+        self.facelets = self.facelets[:, perm]
+
+    def is_solved(self) -> np.ndarray:
+        """Return a boolean array telling which cubes are solved."""
+        return (self.facelets == SOLVED).all(axis=1)
+
+    def to_strings(self) -> list[str]:
+        """Return the Kociemba facelet string of every cube."""
+        rows = np.ascontiguousarray(self.facelets).view("S54").ravel()
+        return rows.astype("U54").tolist()
+
+    def to_cubes(self, engine: str = "cubie") -> list[RubiksCube]:
+        """Create one ``RubiksCube`` per row, with an empty move history."""
+        cubes = []
+        for string in self.to_strings():
+            cube = RubiksCube(engine)
+            cube.state = ENGINES[engine].from_facelet_string(string)
+            cubes.append(cube)
+        return cubes
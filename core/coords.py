@@ -0,0 +1,158 @@
+# core/coords.py
+
+"""
+Integer coordinates of a ``CubieCube``.
+
+Each ``get_*`` function ranks one part of the state into a dense range that
+starts at 0 for the solved cube, and the matching ``set_*`` function writes
+that part back. They are used to build move and pruning tables.
+"""
+
+from collections.abc import Sequence
+from math import comb, factorial
+
+import numpy as np
+
+from core.cubie import CubieCube
+
+# fmt: off
+N_TWIST         = 3**7          # corner orientations
+N_FLIP          = 2**11         # edge orientations
+N_SLICE         = comb(12, 4)   # positions of the FR, FL, BL, BR edges
+N_SLICE_SORTED  = N_SLICE * 24  # positions and order of the FR, FL, BL, BR edges
+N_CORNERS       = factorial(8)  # corner permutations
+N_UD_EDGES      = factorial(8)  # permutations of the U and D layer edges (phase 2)
+N_EDGES         = factorial(12) # edge permutations
+# fmt: on
+
+# First slice edge (FR); FR, FL, BL, BR are the last four edges
+SLICE_EDGE = 8
+
+
+def rank_permutation(perm: Sequence[int]) -> int:
+    """Return the Lehmer rank (0 for the identity) of a permutation of 0..n-1."""
+    n = len(perm)
+    rank = 0
+    for i in range(n - 1):
+        smaller = 0
+        for j in range(i + 1, n):
+            if perm[j] < perm[i]:
+                smaller += 1
+        rank = rank * (n - i) + smaller
+    return rank
+
+
+def unrank_permutation(rank: int, n: int) -> list[int]:
+    """Return the permutation of 0..n-1 with the given Lehmer rank."""
+    digits = [0] * n
+    for i in range(n - 1, -1, -1):
+        rank, digits[i] = divmod(rank, n - i)
+    remaining = list(range(n))
+    return [remaining.pop(digit) for digit in digits]
+
+
+def rank_permutations(perms: np.ndarray) -> np.ndarray:
+    """Vectorized ``rank_permutation`` of every row of a ``(count, n)`` array."""
+    n = perms.shape[1]
+    rank = np.zeros(len(perms), dtype=np.int64)
+    for i in range(n - 1):
+        smaller = (perms[:, i + 1 :] < perms[:, i : i + 1]).sum(axis=1)
+        rank = rank * (n - i) + smaller
+    return rank
+
+
+# -------- Orientations --------
+def get_twist(cube: CubieCube) -> int:
+    """Corner orientation coordinate (0..2186)."""
+    twist = 0
+    for ori in cube.co[:7]:
+        twist = 3 * twist + ori
+    return twist
+
+
+def set_twist(cube: CubieCube, twist: int):
+    """Set the corner orientations; the last corner keeps the twist sum at 0."""
+    total = 0
+    for i in range(6, -1, -1):
+        twist, cube.co[i] = divmod(twist, 3)
+        total += cube.co[i]
+    cube.co[7] = -total % 3
+
+
+def get_flip(cube: CubieCube) -> int:
+    """Edge orientation coordinate (0..2047)."""
+    flip = 0
+    for ori in cube.eo[:11]:
+        flip = 2 * flip + ori
+    return flip
+
+
+def set_flip(cube: CubieCube, flip: int):
+    """Set the edge orientations; the last edge keeps the flip sum even."""
+    total = 0
+    for i in range(10, -1, -1):
+        flip, cube.eo[i] = divmod(flip, 2)
+        total += cube.eo[i]
+    cube.eo[11] = total % 2
+
+
+# -------- Permutations --------
+def get_slice_sorted(cube: CubieCube) -> int:
+    """
+    Positions and order of the four slice edges (0..11879).
+
+    ``// 24`` gives the phase 1 slice coordinate, which is 0 exactly when the
+    slice edges are in the slice; ``% 24`` then gives their permutation.
+    """
+    combination = 0
+    found = 0
+    order = []
+    for j in range(11, -1, -1):
+        if cube.ep[j] >= SLICE_EDGE:
+            combination += comb(11 - j, found + 1)
+            order.append(cube.ep[j] - SLICE_EDGE)
+            found += 1
+    order.reverse()
+    return 24 * combination + rank_permutation(order)
+
+
+def set_slice_sorted(cube: CubieCube, index: int):
+    """Place the slice edges; the other edges fill the free slots in order."""
+    combination, rank = divmod(index, 24)
+    order = unrank_permutation(rank, 4)
+    ep = [-1] * 12
+    remaining = 4
+    for j in range(12):
+        if remaining and combination >= comb(11 - j, remaining):
+            combination -= comb(11 - j, remaining)
+            ep[j] = SLICE_EDGE + order[4 - remaining]
+            remaining -= 1
+    others = iter(range(SLICE_EDGE))
+    cube.ep = [edge if edge >= 0 else next(others) for edge in ep]
+
+
+def get_corners(cube: CubieCube) -> int:
+    """Corner permutation coordinate (0..40319)."""
+    return rank_permutation(cube.cp)
+
+
+def set_corners(cube: CubieCube, index: int):
+    cube.cp = unrank_permutation(index, 8)
+
+
+def get_ud_edges(cube: CubieCube) -> int:
+    """Permutation of the eight U/D layer edges (0..40319), valid in phase 2."""
+    return rank_permutation(cube.ep[:SLICE_EDGE])
+
+
+def set_ud_edges(cube: CubieCube, index: int):
+    cube.ep[:SLICE_EDGE] = unrank_permutation(index, SLICE_EDGE)
+
+
+def get_edges(cube: CubieCube) -> int:
+    """Edge permutation coordinate (0..479001599)."""
+    return rank_permutation(cube.ep)
+
+
+def set_edges(cube: CubieCube, index: int):
+    cube.ep = unrank_permutation(index, 12)
@@ -1,73 +1,233 @@
 # core/cube.py
 
+from collections.abc import Sequence
+from types import MappingProxyType
+
+from core.algorithm import Algorithm, compile_algorithm
+from core.cubie import (
+    CENTER_FACELET,
+    CORNER_FACELET,
+    CORNERS,
+    EDGE_FACELET,
+    EDGES,
+    FACE_ORDER,
+    CubieCube,
+)
+from core.facelet import FaceletCube
+from core.history import INVERSE_MOVES, MoveHistory
 from core.pieces import Center, Edge, Corner
+from core.timeline import Timeline
+from core.validate import check
+from core.zobrist import move_hash, state_hash
 from utils.faces import Face
 from utils.colors import Color
 
+# Color definitions for each face
+# UP: YELLOW, DOWN: WHITE, FRONT: BLUE, BACK: GREEN, RIGHT: RED, LEFT: ORANGE
+
+# Piece slots of the solved cube (name and position never change, only the
+# piece sitting in them does)
+# fmt: off
+PIECE_DEFINITIONS = [
+    (Center, [
+        ({Color.YELLOW: Face.U},  "U",  (1, 2, 1)),     # Up center
+        ({Color.WHITE: Face.D},   "D",  (1, 0, 1)),     # Down center
+        ({Color.BLUE: Face.F},    "F",  (1, 1, 2)),     # Front center
+        ({Color.GREEN: Face.B},   "B",  (1, 1, 0)),     # Back center
+        ({Color.RED: Face.R},     "R",  (2, 1, 1)),     # Right center
+        ({Color.ORANGE: Face.L},  "L",  (0, 1, 1)),     # Left center
+    ]),
+
+    (Edge, [
+        ({Color.YELLOW: Face.U, Color.BLUE: Face.F},    "UF",   (1, 2, 2)),     # Up-Front edge
+        ({Color.YELLOW: Face.U, Color.ORANGE: Face.L},  "UL",   (0, 2, 1)),     # Up-Left edge
+        ({Color.YELLOW: Face.U, Color.GREEN: Face.B},   "UB",   (1, 2, 0)),     # Up-Back edge
+        ({Color.YELLOW: Face.U, Color.RED: Face.R},     "UR",   (2, 2, 1)),     # Up-Right edge
+
+        ({Color.WHITE: Face.D,  Color.BLUE: Face.F},     "DF",   (1, 0, 2)),    # Down-Front edge
+        ({Color.WHITE: Face.D,  Color.RED: Face.R},      "DR",   (2, 0, 1)),    # Down-Right edge
+        ({Color.WHITE: Face.D,  Color.ORANGE: Face.L},   "DL",   (0, 0, 1)),    # Down-Left edge
+        ({Color.WHITE: Face.D,  Color.GREEN: Face.B},    "DB",   (1, 0, 0)),    # Down-Back edge
+
+        ({Color.BLUE: Face.F,   Color.ORANGE: Face.L},   "FL",   (0, 1, 2)),    # Front-Left edge
+        ({Color.BLUE: Face.F,   Color.RED: Face.R},      "FR",   (2, 1, 2)),    # Front-Right edge
+        ({Color.GREEN: Face.B,  Color.ORANGE: Face.L},   "BL",   (0, 1, 0)),    # Back-Left edge
+        ({Color.GREEN: Face.B,  Color.RED: Face.R},      "BR",   (2, 1, 0)),    # Back-Right edge
+    ]),
+
+    (Corner, [
+        ({Color.YELLOW: Face.U, Color.BLUE: Face.F,  Color.ORANGE: Face.L}, "UFL",  (0, 2, 2)),    # Up-Front-Left corner
+        ({Color.YELLOW: Face.U, Color.BLUE: Face.F,  Color.RED: Face.R},    "UFR",  (2, 2, 2)),    # Up-Front-Right corner
+        ({Color.YELLOW: Face.U, Color.GREEN: Face.B, Color.ORANGE: Face.L}, "UBL",  (0, 2, 0)),    # Up-Back-Left corner
+        ({Color.YELLOW: Face.U, Color.GREEN: Face.B, Color.RED: Face.R},    "UBR",  (2, 2, 0)),    # Up-Back-Right corner
+
+        ({Color.WHITE: Face.D,  Color.BLUE: Face.F,  Color.ORANGE: Face.L}, "DFL",  (0, 0, 2)),    # Down-Front-Left corner
+        ({Color.WHITE: Face.D,  Color.BLUE: Face.F,  Color.RED: Face.R},    "DFR",  (2, 0, 2)),    # Down-Front-Right corner
+        ({Color.WHITE: Face.D,  Color.GREEN: Face.B, Color.ORANGE: Face.L}, "DBL",  (0, 0, 0)),    # Down-Back-Left corner
+        ({Color.WHITE: Face.D,  Color.GREEN: Face.B, Color.RED: Face.R},    "DBR",  (2, 0, 0)),    # Down-Back-Right corner
+    ])
+]
+# fmt: on
+
+# Facelet indices covered by each piece slot, keyed by the slot name above
+SLOT_FACELETS = {face: (index,) for face, index in zip(FACE_ORDER, CENTER_FACELET)}
+for _slot, _facelets in zip(CORNERS + EDGES, CORNER_FACELET + EDGE_FACELET):
+    for _piece_class, _pieces in PIECE_DEFINITIONS:
+        for _colors, _name, _position in _pieces:
+            if set(_name) == set(_slot) and len(_name) == len(_slot):
+                SLOT_FACELETS[_name] = _facelets
+
+# State representations a cube can be backed by
+ENGINES = {"cubie": CubieCube, "facelet": FaceletCube}
+
+# Solved state of each engine, as ``to_bytes()``
+SOLVED_STATES = MappingProxyType(
+    {name: engine().to_bytes() for name, engine in ENGINES.items()}
+)
+
+# Piece colors are listed U/D first, then F/B, then L/R
+AXIS_ORDER = {"U": 0, "D": 0, "F": 1, "B": 1, "L": 2, "R": 2}
+
+# Color name of the stickers of each face
+COLOR_NAMES = {face.name: face.value.name for face in Face}
 
-class RubiksCube:
-    def __init__(self):
-        """Initialize the Rubik's Cube in a solved state and setup move history."""
 
-        # Dictionary to hold all physical pieces (each piece is unique)
-        self.pieces = {}
+class RubiksCube:
+    # Moves between the snapshots kept for ``seek``: larger saves memory,
+    # smaller makes each seek replay fewer moves
+    checkpoint_interval = 64
 
-        # List to hold the pieces in the cube in a 3D grid
-        self.matrix = [[[None for _ in range(3)] for _ in range(3)] for _ in range(3)]
+    # Immutable solved states that construction and ``reset`` start from
+    SOLVED_STATES = SOLVED_STATES
 
-        # Color definitions for each face
-        # UP: YELLOW, DOWN: WHITE, FRONT: BLUE, BACK: GREEN, RIGHT: RED, LEFT: ORANGE
+    def __init__(self, engine: str = "cubie"):
+        """
+        Initialize the Rubik's Cube in a solved state and setup move history.
 
-        # Initializing Pieces
-        # fmt: off
-        piece_definitions = [
-            (Center, [
-                ({Color.YELLOW: Face.U},  "U",  (1, 2, 1)),     # Up center
-                ({Color.WHITE: Face.D},   "D",  (1, 0, 1)),     # Down center
-                ({Color.BLUE: Face.F},    "F",  (1, 1, 2)),     # Front center
-                ({Color.GREEN: Face.B},   "B",  (1, 1, 0)),     # Back center
-                ({Color.RED: Face.R},     "R",  (2, 1, 1)),     # Right center
-                ({Color.ORANGE: Face.L},  "L",  (0, 1, 1)),     # Left center
-            ]),
-
-            (Edge, [
-                ({Color.YELLOW: Face.U, Color.BLUE: Face.F},    "UF",   (1, 2, 2)),     # Up-Front edge
-                ({Color.YELLOW: Face.U, Color.ORANGE: Face.L},  "UL",   (0, 2, 1)),     # Up-Left edge
-                ({Color.YELLOW: Face.U, Color.GREEN: Face.B},   "UB",   (1, 2, 0)),     # Up-Back edge
-                ({Color.YELLOW: Face.U, Color.RED: Face.R},     "UR",   (2, 2, 1)),     # Up-Right edge
-
-                ({Color.WHITE: Face.D,  Color.BLUE: Face.F},     "DF",   (1, 0, 2)),    # Down-Front edge
-                ({Color.WHITE: Face.D,  Color.RED: Face.R},      "DR",   (2, 0, 1)),    # Down-Right edge
-                ({Color.WHITE: Face.D,  Color.ORANGE: Face.L},   "DL",   (0, 0, 1)),    # Down-Left edge
-                ({Color.WHITE: Face.D,  Color.GREEN: Face.B},    "DB",   (1, 0, 0)),    # Down-Back edge
-
-                ({Color.BLUE: Face.F,   Color.ORANGE: Face.L},   "FL",   (0, 1, 2)),    # Front-Left edge
-                ({Color.BLUE: Face.F,   Color.RED: Face.R},      "FR",   (2, 1, 2)),    # Front-Right edge
-                ({Color.GREEN: Face.B,  Color.ORANGE: Face.L},   "BL",   (0, 1, 0)),    # Back-Left edge
-                ({Color.GREEN: Face.B,  Color.RED: Face.R},      "BR",   (2, 1, 0)),    # Back-Right edge
-            ]),
-
-            (Corner, [
-                ({Color.YELLOW: Face.U, Color.BLUE: Face.F,  Color.ORANGE: Face.L}, "UFL",  (0, 2, 2)),    # Up-Front-Left corner
-                ({Color.YELLOW: Face.U, Color.BLUE: Face.F,  Color.RED: Face.R},    "UFR",  (2, 2, 2)),    # Up-Front-Right corner
-                ({Color.YELLOW: Face.U, Color.GREEN: Face.B, Color.ORANGE: Face.L}, "UBL",  (0, 2, 0)),    # Up-Back-Left corner
-                ({Color.YELLOW: Face.U, Color.GREEN: Face.B, Color.RED: Face.R},    "UBR",  (2, 2, 0)),    # Up-Back-Right corner
-
-                ({Color.WHITE: Face.D,  Color.BLUE: Face.F,  Color.ORANGE: Face.L}, "DFL",  (0, 0, 2)),    # Down-Front-Left corner
-                ({Color.WHITE: Face.D,  Color.BLUE: Face.F,  Color.RED: Face.R},    "DFR",  (2, 0, 2)),    # Down-Front-Right corner
-                ({Color.WHITE: Face.D,  Color.GREEN: Face.B, Color.ORANGE: Face.L}, "DBL",  (0, 0, 0)),    # Down-Back-Left corner
-                ({Color.WHITE: Face.D,  Color.GREEN: Face.B, Color.RED: Face.R},    "DBR",  (2, 0, 0)),    # Down-Back-Right corner
-            ])
-        ]
-
-        # Creating Objects
-        for piece_class, pieces in piece_definitions:
-            for colors, name, (x, y, z) in pieces:
-                self.matrix[x][y][z] = self.pieces[name] = piece_class(colors, name,  (x, y, z))
-        # fmt: on
+        :param engine: "cubie" keeps corner/edge permutation and orientation arrays,
+            "facelet" keeps the 54 stickers in Kociemba facelet order
+        """
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown engine {engine!r}, must be one of {list(ENGINES)}."
+            )
 
-        # Record Moves performed on this Cube
-        self.move_history = []
+        # State of the cube in the selected representation. ``version`` goes
+        # up with every change; the views below are built on first use and
+        # kept until the version moves on
+        self.engine = engine
+        self.version = 0
+        self._state = ENGINES[engine].from_bytes(self.SOLVED_STATES[engine])
+        self._drop_views()
+
+        # 64-bit state hash, kept up to date by each move once first asked for
+        self._hash = None
+        self._hash_version = -1
+
+        # Record Moves performed on this Cube (one byte each, undoable)
+        self.move_history = MoveHistory()
+        self._timeline = None
+
+    @classmethod
+    def from_string(
+        cls, cube_string: str, engine: str = "cubie", validate: bool = True
+    ) -> "RubiksCube":
+        """
+        Build a cube showing a Kociemba facelet string, the inverse of
+        ``toString()``. The move history starts empty.
+
+        :param cube_string: 54 face letters in URFDLB order
+        :param engine: State representation, as in ``__init__``
+        :param validate: Reject strings that are not a solvable cube (see
+            ``core.validate``); without it only the length and the letters
+            are checked, and unsolvable states are accepted as long as the
+            engine can hold them
+        :raises ValueError: if the string is not 54 letters of URFDLB, cannot
+            be a cube or, with ``validate``, is not a solvable one
+        """
+        if validate:
+            check(cube_string)
+        elif len(cube_string) != 54:
+            raise ValueError(f"Expected 54 stickers, got {len(cube_string)}.")
+        elif not set(cube_string) <= set(FACE_ORDER):
+            raise ValueError("Some stickers are not one of URFDLB.")
+        cube = cls(engine)
+        cube._state = ENGINES[engine].from_facelet_string(cube_string)
+        if validate:
+            cube._facelets = cube_string  # already what toString() would build
+        return cube
+
+    @classmethod
+    def from_cubies(
+        cls,
+        cp: Sequence[int],
+        co: Sequence[int],
+        ep: Sequence[int],
+        eo: Sequence[int],
+        engine: str = "cubie",
+        validate: bool = True,
+    ) -> "RubiksCube":
+        """
+        Build a cube from corner/edge permutation and orientation arrays, as
+        held by ``CubieCube``. The move history starts empty.
+
+        :raises ValueError: if the arrays are not a (solvable, with
+            ``validate``) cube
+        """
+        state = CubieCube(cp, co, ep, eo)
+        if (
+            sorted(state.cp) != list(range(8))
+            or sorted(state.ep) != list(range(12))
+            or not set(state.co) <= {0, 1, 2}
+            or not set(state.eo) <= {0, 1}
+        ):
+            raise ValueError(
+                "Invalid cube: cp/ep must be permutations of 0..7/0..11 and "
+                "co/eo hold orientations 0..2/0..1."
+            )
+        cube_string = state.to_facelet_string()
+        if validate:
+            check(cube_string)
+        cube = cls(engine)
+        if engine == "cubie":
+            cube._state = state
+        else:
+            cube._state = ENGINES[engine].from_facelet_string(cube_string)
+        cube._facelets = cube_string
+        return cube
+
+    @property
+    def state(self):
+        """
+        The cube state (a ``CubieCube`` or ``FaceletCube``).
+
+        Assigning a new state marks the cached views as stale; after changing
+        the state in place, increment ``version`` yourself.
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state):
+        self._state = state
+        self.version += 1
+
+    @property
+    def pieces(self):
+        """Dictionary of piece slot name to the piece currently in it."""
+        if self._views_version != self.version:
+            self._drop_views()
+        if self._pieces is None:
+            self._pieces = self._build_pieces()
+        return self._pieces
+
+    @property
+    def matrix(self):
+        """The pieces of the cube in a 3D grid, indexed as ``[x][y][z]``."""
+        if self._views_version != self.version:
+            self._drop_views()
+        if self._matrix is None:
+            self._rebuild_matrix()
+        return self._matrix
 
     # ------- Display Functions -------
     def display(self):
@@ -97,8 +257,6 @@ class RubiksCube:
     def print_matrix(self):
         """Convert the cube matrix to a string representation."""
 
-        self._rebuild_matrix()
-
         for y in [2, 1, 0]:
             for z in range(3):
                 for x in range(3):
@@ -111,56 +269,24 @@ class RubiksCube:
             print("\n")
 
     def get_face(self, face: Face):
-        """Return a 3x3 array of color initials for the given face."""
+        """
+        Return a 3x3 array of color initials for the given face.
+
+        The grid is cached until the next move, so it must not be modified.
+        """
         # Validate the face
         if type(face) is not Face:
             raise KeyError(f"Invalid face: {face}. Must be a Face Enum.")
 
-        face_grid = [["" for _ in range(3)] for _ in range(3)]
-        self._rebuild_matrix()  # Ensure the matrix is up to date
-
-        if face == Face.U:
-            y = 2
-            for x in range(3):
-                for z in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[z][x] = self._get_color(piece, face)
-
-        elif face == Face.D:
-            y = 0
-            for x in range(3):
-                for z in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - z][x] = self._get_color(piece, face)
-
-        elif face == Face.F:
-            z = 2
-            for x in range(3):
-                for y in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - y][x] = self._get_color(piece, face)
-
-        elif face == Face.B:
-            z = 0
-            for x in range(3):
-                for y in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - y][2 - x] = self._get_color(piece, face)
-
-        elif face == Face.R:
-            x = 2
-            for y in range(3):
-                for z in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - y][2 - z] = self._get_color(piece, face)
-
-        elif face == Face.L:
-            x = 0
-            for y in range(3):
-                for z in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - y][z] = self._get_color(piece, face)
-        return face_grid
+        if self._views_version != self.version:
+            self._drop_views()
+        grid = self._faces.get(face)
+        if grid is None:
+            start = FACE_ORDER.index(face.name) * 9
+            stickers = self.toString()[start : start + 9]
+            colors = [COLOR_NAMES[sticker] for sticker in stickers]
+            grid = self._faces[face] = [colors[0:3], colors[3:6], colors[6:9]]
+        return grid
 
     def get_face_for_kociemba(self, face: Face):
         """Return a 3x3 array of color initials for the given face."""
@@ -168,380 +294,310 @@ class RubiksCube:
         if type(face) is not Face:
             raise KeyError(f"Invalid face: {face}. Must be a Face Enum.")
 
-        face_grid = [["" for _ in range(3)] for _ in range(3)]
-        self._rebuild_matrix()  # Ensure the matrix is up to date
-
-        if face == Face.U:
-            y = 2
-            for x in range(3):
-                for z in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[z][x] = self._get_color(piece, face)[0]
-
-        elif face == Face.D:
-            y = 0
-            for x in range(3):
-                for z in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - z][x] = self._get_color(piece, face)[0]
-
-        elif face == Face.F:
-            z = 2
-            for x in range(3):
-                for y in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - y][x] = self._get_color(piece, face)[0]
-
-        elif face == Face.B:
-            z = 0
-            for x in range(3):
-                for y in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - y][2 - x] = self._get_color(piece, face)[0]
-
-        elif face == Face.R:
-            x = 2
-            for y in range(3):
-                for z in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - y][2 - z] = self._get_color(piece, face)[0]
-
-        elif face == Face.L:
-            x = 0
-            for y in range(3):
-                for z in range(3):
-                    piece = self.matrix[x][y][z]
-                    face_grid[2 - y][z] = self._get_color(piece, face)[0]
-
         face_string = ""
 
-        for row in face_grid:
-            for c in row:
-                face_string += c
+        for row in self.get_face(face):
+            for color in row:
+                face_string += color[0]
 
         return face_string
 
     # -------- Helper Functions --------
-    def _get_color(self, piece, face) -> str:
-        """Fetch the color of a piece for a specific face."""
-        if piece is None:
-            return "BLACK"  # Return a blank space for empty positions
-        for color, piece_face in piece.get_faces().items():
-            if piece_face == face:
-                return color.name  # Return the color name
-        return "BLACK"  # Return a blank space if no matching face is found
+    def _build_pieces(self) -> dict:
+        """Create the piece objects for the current state."""
+        facelets = self.toString()
+        pieces = {}
+        for piece_class, definitions in PIECE_DEFINITIONS:
+            for _, name, position in definitions:
+                slot = sorted(
+                    SLOT_FACELETS[name], key=lambda i: AXIS_ORDER[facelets[i]]
+                )
+                colors = {
+                    Face[facelets[i]].value: Face[FACE_ORDER[i // 9]] for i in slot
+                }
+                pieces[name] = piece_class(colors, name, position)
+        return pieces
 
     def _rebuild_matrix(self):
         """Rebuild the matrix from the pieces."""
+        self._matrix = [[[None for _ in range(3)] for _ in range(3)] for _ in range(3)]
         for piece in self.pieces.values():
             x, y, z = piece.get_position()
-            self.matrix[x][y][z] = piece
-
-    def _rearrange_pieces(self, keys: list[str]):
-        values = [self.pieces[key] for key in keys]
-
-        values.insert(0, values.pop())
-
-        for key, value in zip(keys, values):
-            self.pieces[key] = value
-
-    def _fetch_components(self, pieces: list[str]) -> list[list]:
-        """Fetch the components of the pieces in the cube."""
-        positions = []
-        faces = []
-        names = []
-        for piece in pieces:
-            if piece not in self.pieces:
-                raise ValueError(f"Piece {piece} not found in cube.")
-            positions.append(self.pieces[piece].get_position())
-            faces.append(self.pieces[piece].get_faces())
-            names.append(self.pieces[piece].get_name())
-        return [positions, faces, names]
-
-    def _apply_components(self, pieces: list[str], components: list[list]):
-        """Apply the positions to the pieces in the cube."""
-        positions = components[0]
-        faces = components[1]
-        names = components[2]
-
-        for piece, position, face, name in zip(pieces, positions, faces, names):
-            self.pieces[piece].set_position(position)
-            self.pieces[piece].set_faces(face)
-            self.pieces[piece].set_name(name)
-
-    def _rotate_components(self, components: list[list], f: str) -> list[list]:
-        """Rotate the positions and faces in the specified direction."""
-        positions = components[0]
-        faces = components[1]
-        names = components[2]
-
-        if f not in ["U", "D", "F", "B", "R", "L"]:
-            raise ValueError(
-                "Invalid face, must be one of 'U', 'D', 'F', 'B', 'R', 'L'."
-            )
-
-        # Rotate positions
-        names.append(names.pop(0))  # Rotate names clockwise
-        positions.append(positions.pop(0))  # Rotate positions clockwise
-
-        # Rotate faces
-        for face_map in faces:
-            rotated_faces = {}
-            for color, face in face_map.items():
-                if f == "U":
-                    if face == Face.F:
-                        rotated_faces[color] = Face.L
-                    elif face == Face.L:
-                        rotated_faces[color] = Face.B
-                    elif face == Face.B:
-                        rotated_faces[color] = Face.R
-                    elif face == Face.R:
-                        rotated_faces[color] = Face.F
-                    else:
-                        rotated_faces[color] = face
-                elif f == "D":
-                    if face == Face.F:
-                        rotated_faces[color] = Face.R
-                    elif face == Face.R:
-                        rotated_faces[color] = Face.B
-                    elif face == Face.B:
-                        rotated_faces[color] = Face.L
-                    elif face == Face.L:
-                        rotated_faces[color] = Face.F
-                    else:
-                        rotated_faces[color] = face
-                elif f == "R":
-                    if face == Face.F:
-                        rotated_faces[color] = Face.U
-                    elif face == Face.U:
-                        rotated_faces[color] = Face.B
-                    elif face == Face.B:
-                        rotated_faces[color] = Face.D
-                    elif face == Face.D:
-                        rotated_faces[color] = Face.F
-                    else:
-                        rotated_faces[color] = face
-                elif f == "L":
-                    if face == Face.F:
-                        rotated_faces[color] = Face.D
-                    elif face == Face.D:
-                        rotated_faces[color] = Face.B
-                    elif face == Face.B:
-                        rotated_faces[color] = Face.U
-                    elif face == Face.U:
-                        rotated_faces[color] = Face.F
-                    else:
-                        rotated_faces[color] = face
-                elif f == "B":
-                    if face == Face.R:
-                        rotated_faces[color] = Face.U
-                    elif face == Face.U:
-                        rotated_faces[color] = Face.L
-                    elif face == Face.L:
-                        rotated_faces[color] = Face.D
-                    elif face == Face.D:
-                        rotated_faces[color] = Face.R
-                    else:
-                        rotated_faces[color] = face
-                elif f == "F":
-                    if face == Face.R:
-                        rotated_faces[color] = Face.D
-                    elif face == Face.D:
-                        rotated_faces[color] = Face.L
-                    elif face == Face.L:
-                        rotated_faces[color] = Face.U
-                    elif face == Face.U:
-                        rotated_faces[color] = Face.R
-                    else:
-                        rotated_faces[color] = face
-            face_map.clear()
-            face_map.update(rotated_faces)
-
-        return [positions, faces, names]
-
-    def _rotate_pieces(self, pieces: list[str], face: str):
-        """Rotate the edge 3x3 grid in the specified direction."""
-        # edges = [edge1, edge2, edge3, edge4] where each edge is a string like "UF", "UL", etc.
-        components = self._fetch_components(pieces)
-        rotated_components = self._rotate_components(
-            components, face
-        )  # Rotate the positions to the right
-        self._apply_components(pieces, rotated_components)
-        self._rearrange_pieces(pieces)
-        self._rebuild_matrix()
+            self._matrix[x][y][z] = piece
+
+    def _drop_views(self):
+        """Forget the facelet string, face grids and pieces of an older version."""
+        self._views_version = self.version
+        self._facelets = None
+        self._faces = {}
+        self._pieces = None
+        self._matrix = None
+
+    def _apply_move(self, move: str):
+        """Apply a precompiled move (e.g. ``"U'"``) and record it in the history."""
+        self._turn(move)
+        self.move_history.append(move)
+
+    def _turn(self, move: str):
+        """Apply a precompiled move to the state without recording it."""
+        state = self._state
+        if self._hash_version == self.version:
+            key = self._hash ^ move_hash(state, move)
+            state.apply_move(move)
+            self._hash = key ^ move_hash(state, move)
+            self._hash_version += 1
+        else:
+            state.apply_move(move)
+        self.version += 1
+
+    def apply_algorithm(self, algorithm):
+        """
+        Apply a whole move sequence in one step.
+
+        The sequence is composed into a single permutation (cached on the
+        ``Algorithm``), and its face turns are added to the move history.
+
+        :param algorithm: An ``Algorithm``, or notation for ``compile_algorithm``
+            such as ``"(R U R' U')6"``
+        """
+        if not isinstance(algorithm, Algorithm):
+            algorithm = compile_algorithm(algorithm)
+        if not algorithm.moves:
+            return
+        algorithm.apply_to(self._state)
+        self.version += 1
+        self.move_history.extend(algorithm.moves)
 
     # ----------- For Solving ------------
 
     def is_solved(self):
         """Check if the cube is in a solved state."""
-        for face in Face:
-            face_colors = self.get_face(face)
-            center_color = face_colors[1][1]  # Center piece color
-            for row in face_colors:
-                for color in row:
-                    if color != center_color:
-                        return False
-        return True
+        return self.state.is_solved()
 
     def get_piece_at_position(self, x, y, z):
         """Get the piece at a specific position in the matrix."""
-        self._rebuild_matrix()
         return self.matrix[x][y][z]
 
     def find_piece_by_colors(self, *colors):
         """Find a piece that has all the specified colors."""
         for piece in self.pieces.values():
-            piece_colors = set(piece.get_faces().keys())
-            if set(colors).issubset(piece_colors):
+            if set(colors).issubset(piece.identity):
                 return piece
         return None
 
-    def toString(self):
-        U = self.get_face_for_kociemba(Face.U)
-        D = self.get_face_for_kociemba(Face.D)
-        F = self.get_face_for_kociemba(Face.F)
-        B = self.get_face_for_kociemba(Face.B)
-        R = self.get_face_for_kociemba(Face.R)
-        L = self.get_face_for_kociemba(Face.L)
-
-        face_map = {"Y": "U", "R": "R", "B": "F", "W": "D", "O": "L", "G": "B"}
-
-        trans_table = str.maketrans(face_map)
+    def state_hash(self) -> int:
+        """
+        Return a 64-bit Zobrist hash of the state (see ``core.zobrist``).
+
+        The first call hashes the whole state; after that every move updates
+        the hash from the pieces it turns. Cubes in the same state hash alike,
+        whatever their engine or move history.
+        """
+        if self._hash_version != self.version:
+            self._hash = state_hash(self._state)
+            self._hash_version = self.version
+        return self._hash
+
+    def __eq__(self, other):
+        """Cubes are equal when their states are, regardless of move history."""
+        if not isinstance(other, RubiksCube):
+            return NotImplemented
+        if self.state_hash() != other.state_hash():
+            return False
+        if self.engine == other.engine:
+            return self._state == other._state
+        return self.toString() == other.toString()
+
+    def __hash__(self):
+        """Hash of the current state; do not move a cube while it is in a set."""
+        return self.state_hash()
 
-        return (U + R + F + D + L + B).translate(trans_table)
+    def toString(self):
+        """Return the facelet string in URFDLB order, as the Kociemba solver expects."""
+        if self._views_version != self.version:
+            self._drop_views()
+        if self._facelets is None:
+            self._facelets = self._state.to_facelet_string()
+        return self._facelets
 
     # -------- Rotation Functions --------
     def U(self):
         """Perform a U rotation (Up face clockwise)."""
-        self._rotate_pieces(["UF", "UL", "UB", "UR"], "U")
-        self._rotate_pieces(["UFL", "UBL", "UBR", "UFR"], "U")
-        self.move_history.append("U")
+        self._apply_move("U")
 
     def D(self):
         """Perform a D rotation (Down face clockwise)."""
-        self._rotate_pieces(["DF", "DR", "DB", "DL"], "D")
-        self._rotate_pieces(["DFL", "DFR", "DBR", "DBL"], "D")
-        self.move_history.append("D")
+        self._apply_move("D")
 
     def F(self):
         """Perform an F rotation (Front face clockwise)."""
-        self._rotate_pieces(["UF", "FR", "DF", "FL"], "F")
-        self._rotate_pieces(["UFL", "UFR", "DFR", "DFL"], "F")
-        self.move_history.append("F")
+        self._apply_move("F")
 
     def B(self):
         """Perform a B rotation (Back face clockwise)."""
-        self._rotate_pieces(["UB", "BL", "DB", "BR"], "B")
-        self._rotate_pieces(["UBL", "DBL", "DBR", "UBR"], "B")
-        self.move_history.append("B")
+        self._apply_move("B")
 
     def R(self):
         """Perform an R rotation (Right face clockwise)."""
-        self._rotate_pieces(["UR", "BR", "DR", "FR"], "R")
-        self._rotate_pieces(["UFR", "UBR", "DBR", "DFR"], "R")
-        self.move_history.append("R")
+        self._apply_move("R")
 
     def L(self):
         """Perform an L rotation (Left face clockwise)."""
-        self._rotate_pieces(["UL", "FL", "DL", "BL"], "L")
-        self._rotate_pieces(["UFL", "DFL", "DBL", "UBL"], "L")
-        self.move_history.append("L")
+        self._apply_move("L")
 
     def U2(self):
         """Perform a U2 rotation (Up face twice)."""
-        self.U()
-        self.U()
-        self.move_history.pop()
-        self.move_history[-1] = "U2"
+        self._apply_move("U2")
 
     def D2(self):
         """Perform a D2 rotation (Down face twice)."""
-        self.D()
-        self.D()
-        self.move_history.pop()
-        self.move_history[-1] = "D2"
+        self._apply_move("D2")
 
     def F2(self):
         """Perform an F2 rotation (Front face twice)."""
-        self.F()
-        self.F()
-        self.move_history.pop()
-        self.move_history[-1] = "F2"
+        self._apply_move("F2")
 
     def B2(self):
         """Perform a B2 rotation (Back face twice)."""
-        self.B()
-        self.B()
-        self.move_history.pop()
-        self.move_history[-1] = "B2"
+        self._apply_move("B2")
 
     def R2(self):
         """Perform an R2 rotation (Right face twice)."""
-        self.R()
-        self.R()
-        self.move_history.pop()
-        self.move_history[-1] = "R2"
+        self._apply_move("R2")
 
     def L2(self):
         """Perform an L2 rotation (Left face twice)."""
-        self.L()
-        self.L()
-        self.move_history.pop()
-        self.move_history[-1] = "L2"
+        self._apply_move("L2")
 
     def U_prime(self):
         """Perform a U' rotation (Up face counter-clockwise)."""
-        self.U()
-        self.U()
-        self.U()
-        self.move_history.pop()
-        self.move_history.pop()
-        self.move_history[-1] = "U'"
+        self._apply_move("U'")
 
     def D_prime(self):
         """Perform a D' rotation (Down face counter-clockwise)."""
-        self.D()
-        self.D()
-        self.D()
-        self.move_history.pop()
-        self.move_history.pop()
-        self.move_history[-1] = "D'"
+        self._apply_move("D'")
 
     def F_prime(self):
         """Perform an F' rotation (Front face counter-clockwise)."""
-        self.F()
-        self.F()
-        self.F()
-        self.move_history.pop()
-        self.move_history.pop()
-        self.move_history[-1] = "F'"
+        self._apply_move("F'")
 
     def B_prime(self):
         """Perform a B' rotation (Back face counter-clockwise)."""
-        self.B()
-        self.B()
-        self.B()
-        self.move_history.pop()
-        self.move_history.pop()
-        self.move_history[-1] = "B'"
+        self._apply_move("B'")
 
     def R_prime(self):
         """Perform an R' rotation (Right face counter-clockwise)."""
-        self.R()
-        self.R()
-        self.R()
-        self.move_history.pop()
-        self.move_history.pop()
-        self.move_history[-1] = "R'"
+        self._apply_move("R'")
 
     def L_prime(self):
         """Perform an L' rotation (Left face counter-clockwise)."""
-        self.L()
-        self.L()
-        self.L()
-        self.move_history.pop()
-        self.move_history.pop()
-        self.move_history[-1] = "L'"
+        self._apply_move("L'")
+
+    def undo(self):
+        """
+        Take back the last move by applying its inverse.
+
+        :return: The move that was undone, or None if there was none
+        """
+        move = self.move_history.undo()
+        if move is not None:
+            self._turn(INVERSE_MOVES[move])
+        return move
+
+    def redo(self):
+        """
+        Apply again the last move taken back by ``undo``.
+
+        :return: The move that was redone, or None if there was none
+        """
+        move = self.move_history.redo()
+        if move is not None:
+            self._turn(move)
+        return move
+
+    def seek(self, index: int):
+        """
+        Jump to the state after the first ``index`` recorded moves.
+
+        Undone moves still count as recorded, so this goes forwards as well
+        as backwards; the moves after ``index`` become redoable. The state is
+        rebuilt from the nearest checkpoint (see ``core.timeline``), so a seek
+        replays fewer than ``checkpoint_interval`` moves.
+        """
+        history = self.move_history
+        codes = history.all_codes
+        if not 0 <= index <= len(codes):
+            raise IndexError(f"Move index {index} out of range 0..{len(codes)}.")
+
+        timeline = self._timeline
+        if timeline is not None and timeline.interval == self.checkpoint_interval:
+            timeline.update(codes)
+            # The state may have been replaced since the timeline was built
+            if timeline.state_at(len(history)) != self._state:
+                timeline = None
+        else:
+            timeline = None
+        if timeline is None:
+            start = self._state.copy()
+            for move in reversed(history):
+                start.apply_move(INVERSE_MOVES[move])
+            timeline = Timeline(start, codes, self.checkpoint_interval)
+            self._timeline = timeline
+
+        history.seek(index)
+        self.state = timeline.state_at(index)
 
     def reset(self):
-        self.__init__()
+        """Return to the solved state and forget the move history."""
+        self.state = ENGINES[self.engine].from_bytes(self.SOLVED_STATES[self.engine])
+        self.move_history = MoveHistory()
+        self._timeline = None
+
+    def clone(self, history: bool = True) -> "RubiksCube":
+        """
+        Return an independent copy of this cube.
+
+        Only the compact state (and, if ``history``, the move history) is
+        copied; the facelet string and face grids are shared until either
+        cube moves, and pieces are rebuilt on demand. Much cheaper than
+        ``copy.deepcopy``, so search code can branch freely.
+
+        :param history: Also copy the move history (otherwise the clone
+            starts with an empty one)
+        """
+        cube = type(self).__new__(type(self))
+        cube.engine = self.engine
+        cube.version = self.version
+        cube._state = self._state.copy()
+        cube._views_version = self._views_version
+        cube._facelets = self._facelets
+        cube._faces = dict(self._faces)
+        cube._pieces = None
+        cube._matrix = None
+        cube._hash = self._hash
+        cube._hash_version = self._hash_version
+        cube.move_history = self.move_history.copy() if history else MoveHistory()
+        cube._timeline = None
+        return cube
+
+    def __copy__(self):
+        return self.clone()
+
+    def __deepcopy__(self, memo):
+        return self.clone()
+
+    def snapshot(self) -> bytes:
+        """Return the state as bytes (40 for "cubie", 54 for "facelet")."""
+        return self._state.to_bytes()
+
+    def restore(self, snapshot: bytes):
+        """
+        Set the state from ``snapshot()`` bytes of a cube with the same engine.
+
+        Like assigning ``state``, this leaves the move history as it is.
+
+        :raises ValueError: if the snapshot has the wrong size for the engine
+        """
+        if len(snapshot) != len(self.SOLVED_STATES[self.engine]):
+            raise ValueError(f"Not a snapshot of a {self.engine!r} cube.")
+        self.state = ENGINES[self.engine].from_bytes(snapshot)
@@ -0,0 +1,244 @@
+# core/cubie.py
+
+"""Cubie-level cube state: corner/edge permutation and orientation arrays."""
+
+from collections.abc import Sequence
+
+# Face order of the 54-character facelet string used by the Kociemba solver
+FACE_ORDER = "URFDLB"
+
+# Corner and edge slots (a cubie's name also lists its colors in facelet order)
+# fmt: off
+CORNERS = ["URF", "UFL", "ULB", "UBR", "DFR", "DLF", "DBL", "DRB"]
+EDGES   = ["UR", "UF", "UL", "UB", "DR", "DF", "DL", "DB", "FR", "FL", "BL", "BR"]
+
+# Facelet indices of each corner slot, clockwise starting with the U/D sticker
+CORNER_FACELET = [
+    (8, 9, 20),     # URF: U9 R1 F3
+    (6, 18, 38),    # UFL: U7 F1 L3
+    (0, 36, 47),    # ULB: U1 L1 B3
+    (2, 45, 11),    # UBR: U3 B1 R3
+    (29, 26, 15),   # DFR: D3 F9 R7
+    (27, 44, 24),   # DLF: D1 L9 F7
+    (33, 53, 42),   # DBL: D7 B9 L7
+    (35, 17, 51),   # DRB: D9 R9 B7
+]
+
+# Facelet indices of each edge slot, starting with the U/D (or F/B) sticker
+EDGE_FACELET = [
+    (5, 10),    # UR: U6 R2
+    (7, 19),    # UF: U8 F2
+    (3, 37),    # UL: U4 L2
+    (1, 46),    # UB: U2 B2
+    (32, 16),   # DR: D6 R8
+    (28, 25),   # DF: D2 F8
+    (30, 43),   # DL: D4 L8
+    (34, 52),   # DB: D8 B8
+    (23, 12),   # FR: F6 R4
+    (21, 41),   # FL: F4 L6
+    (50, 39),   # BL: B6 L4
+    (48, 14),   # BR: B4 R6
+]
+
+# Center facelet of each face
+CENTER_FACELET = [4, 13, 22, 31, 40, 49]
+# fmt: on
+
+# (cubie, twist) of the colors read clockwise from a corner slot's U/D facelet
+CORNER_LOOKUP = {
+    name[ori:] + name[:ori]: (cubie, -ori % 3)
+    for cubie, name in enumerate(CORNERS)
+    for ori in range(3)
+}
+# (cubie, flip) of the colors read from an edge slot's first facelet
+EDGE_LOOKUP = {
+    name[flip:] + name[:flip]: (cubie, flip)
+    for cubie, name in enumerate(EDGES)
+    for flip in range(2)
+}
+
+
+class CubieCube:
+    """
+    Cube state as permutation and orientation arrays.
+
+    ``cp[i]``/``ep[i]`` is the cubie sitting in corner/edge slot ``i`` and
+    ``co[i]``/``eo[i]`` its twist (0..2) or flip (0..1) in that slot.
+    """
+
+    def __init__(
+        self,
+        cp: Sequence[int] | None = None,
+        co: Sequence[int] | None = None,
+        ep: Sequence[int] | None = None,
+        eo: Sequence[int] | None = None,
+    ):
+        self.cp = list(cp) if cp is not None else list(range(8))
+        self.co = list(co) if co is not None else [0] * 8
+        self.ep = list(ep) if ep is not None else list(range(12))
+        self.eo = list(eo) if eo is not None else [0] * 12
+
+    def __repr__(self):
+        """String representation of the state for debugging."""
+        return f"CubieCube(cp={self.cp}, co={self.co}, ep={self.ep}, eo={self.eo})"
+
+    def __eq__(self, other):
+        if not isinstance(other, CubieCube):
+            return NotImplemented
+        return (
+            self.cp == other.cp
+            and self.co == other.co
+            and self.ep == other.ep
+            and self.eo == other.eo
+        )
+
+    @classmethod
+    def from_facelet_string(cls, facelets: str) -> "CubieCube":
+        """Build the state shown by a Kociemba facelet string."""
+        if len(facelets) != 54:
+            raise ValueError("Facelet string must have exactly 54 stickers.")
+        cube = CubieCube.__new__(cls)
+        cube.cp, cube.co, cube.ep, cube.eo = [], [], [], []
+        for i, (a, b, c) in enumerate(CORNER_FACELET):
+            piece = CORNER_LOOKUP.get(facelets[a] + facelets[b] + facelets[c])
+            if piece is None:
+                if not {facelets[a], facelets[b], facelets[c]} & {"U", "D"}:
+                    raise ValueError(f"Corner {CORNERS[i]} has no U or D sticker.")
+                raise ValueError(f"Corner {CORNERS[i]} has an invalid color pair.")
+            cube.cp.append(piece[0])
+            cube.co.append(piece[1])
+        for i, (a, b) in enumerate(EDGE_FACELET):
+            piece = EDGE_LOOKUP.get(facelets[a] + facelets[b])
+            if piece is None:
+                raise ValueError(f"Edge {EDGES[i]} has an invalid color pair.")
+            cube.ep.append(piece[0])
+            cube.eo.append(piece[1])
+        return cube
+
+    def copy(self) -> "CubieCube":
+        """Return an independent copy of this state."""
+        cube = CubieCube.__new__(CubieCube)
+        cube.cp, cube.co = self.cp[:], self.co[:]
+        cube.ep, cube.eo = self.ep[:], self.eo[:]
+        return cube
+
+    def inverse(self) -> "CubieCube":
+        """
+        Return the state that undoes this one; a solution of either, reversed
+        and inverted, solves the other.
+        """
+        cube = CubieCube.__new__(CubieCube)
+        cube.cp, cube.co, cube.ep, cube.eo = [0] * 8, [0] * 8, [0] * 12, [0] * 12
+        for i, (piece, twist) in enumerate(zip(self.cp, self.co)):
+            cube.cp[piece] = i
+            cube.co[piece] = -twist % 3
+        for i, (piece, flip) in enumerate(zip(self.ep, self.eo)):
+            cube.ep[piece] = i
+            cube.eo[piece] = flip
+        return cube
+
+    def to_bytes(self) -> bytes:
+        """Return the state as 40 bytes (cp, co, ep, eo), for ``from_bytes``."""
+        return bytes(self.cp + self.co + self.ep + self.eo)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CubieCube":
+        """Rebuild a state saved by ``to_bytes``."""
+        return cls(data[0:8], data[8:16], data[16:28], data[28:40])
+
+    def multiply(self, other: "CubieCube"):
+        """Apply ``other`` on top of this state (in place)."""
+        cp, co, ep, eo = self.cp, self.co, self.ep, self.eo
+        self.cp = [cp[j] for j in other.cp]
+        self.co = [(co[j] + t) % 3 for j, t in zip(other.cp, other.co)]
+        self.ep = [ep[j] for j in other.ep]
+        self.eo = [(eo[j] + f) % 2 for j, f in zip(other.ep, other.eo)]
+
+    def apply_move(self, move: str):
+        """Apply one of the 18 face turns (e.g. ``"R'"``) in place."""
+        self.multiply(MOVE_TABLE[move])
+
+    @classmethod
+    def compose(cls, moves: Sequence[str]) -> "CubieCube":
+        """Return the state a move sequence produces, for ``apply_transform``."""
+        cube = cls()
+        for move in moves:
+            cube.multiply(MOVE_TABLE[move])
+        return cube
+
+    def apply_transform(self, transform: "CubieCube"):
+        """Apply a sequence composed by ``compose`` in one step."""
+        self.multiply(transform)
+
+    def is_solved(self) -> bool:
+        """Check if every cubie is home and correctly oriented."""
+        return (
+            self.cp == SOLVED.cp
+            and self.co == SOLVED.co
+            and self.ep == SOLVED.ep
+            and self.eo == SOLVED.eo
+        )
+
+    def to_facelets(self) -> list[str]:
+        """Return the 54 sticker face letters in URFDLB order."""
+        facelets = [""] * 54
+        for i, face in enumerate(FACE_ORDER):
+            facelets[CENTER_FACELET[i]] = face
+        for i, (j, ori) in enumerate(zip(self.cp, self.co)):
+            slot, colors = CORNER_FACELET[i], CORNERS[j]
+            for k in range(3):
+                facelets[slot[(k + ori) % 3]] = colors[k]
+        for i, (j, ori) in enumerate(zip(self.ep, self.eo)):
+            slot, colors = EDGE_FACELET[i], EDGES[j]
+            for k in range(2):
+                facelets[slot[(k + ori) % 2]] = colors[k]
+        return facelets
+
+    def to_facelet_string(self) -> str:
+        """Return the Kociemba facelet string (e.g. ``UUUUUUUUURRR...``)."""
+        return "".join(self.to_facelets())
+
+
+SOLVED = CubieCube()
+
+# Clockwise quarter turn of each face, as the state it produces from solved
+# fmt: off
+MOVE_CUBES = {
+    "U": CubieCube(cp=[3, 0, 1, 2, 4, 5, 6, 7], co=[0, 0, 0, 0, 0, 0, 0, 0],
+                   ep=[3, 0, 1, 2, 4, 5, 6, 7, 8, 9, 10, 11], eo=[0] * 12),
+    "R": CubieCube(cp=[4, 1, 2, 0, 7, 5, 6, 3], co=[2, 0, 0, 1, 1, 0, 0, 2],
+                   ep=[8, 1, 2, 3, 11, 5, 6, 7, 4, 9, 10, 0], eo=[0] * 12),
+    "F": CubieCube(cp=[1, 5, 2, 3, 0, 4, 6, 7], co=[1, 2, 0, 0, 2, 1, 0, 0],
+                   ep=[0, 9, 2, 3, 4, 8, 6, 7, 1, 5, 10, 11],
+                   eo=[0, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0]),
+    "D": CubieCube(cp=[0, 1, 2, 3, 5, 6, 7, 4], co=[0, 0, 0, 0, 0, 0, 0, 0],
+                   ep=[0, 1, 2, 3, 5, 6, 7, 4, 8, 9, 10, 11], eo=[0] * 12),
+    "L": CubieCube(cp=[0, 2, 6, 3, 4, 1, 5, 7], co=[0, 1, 2, 0, 0, 2, 1, 0],
+                   ep=[0, 1, 10, 3, 4, 5, 9, 7, 8, 2, 6, 11], eo=[0] * 12),
+    "B": CubieCube(cp=[0, 1, 3, 7, 4, 5, 2, 6], co=[0, 0, 1, 2, 0, 0, 2, 1],
+                   ep=[0, 1, 2, 11, 4, 5, 6, 10, 8, 9, 3, 7],
+                   eo=[0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 1]),
+}
+# fmt: on
+
+# All 18 face turns, in the same order as Scrambler.MOVES
+MOVES = [face + turn for face in "UDFBRL" for turn in ("", "'", "2")]
+
+
+def _compile_moves() -> dict:
+    """Compose the quarter turns into one table per move (X, X' and X2)."""
+    tables = {}
+    for face in "UDFBRL":
+        quarter = MOVE_CUBES[face]
+        double = quarter.copy()
+        double.multiply(quarter)
+        prime = double.copy()
+        prime.multiply(quarter)
+        tables[face] = quarter
+        tables[face + "'"] = prime
+        tables[face + "2"] = double
+    return tables
+
+
+# Precompiled permutation/orientation table of every move in MOVES
+MOVE_TABLE = _compile_moves()
@@ -0,0 +1,107 @@
+# core/facelet.py
+
+"""Facelet-level cube state: the 54 stickers as a ``bytes`` string."""
+
+from collections.abc import Sequence
+from operator import itemgetter
+
+from core.cubie import (
+    CENTER_FACELET,
+    CORNER_FACELET,
+    EDGE_FACELET,
+    FACE_ORDER,
+    MOVE_TABLE,
+    CubieCube,
+)
+
+SOLVED_FACELETS = "".join(face * 9 for face in FACE_ORDER).encode("ascii")
+
+
+def _facelet_permutation(move: CubieCube) -> list[int]:
+    """Return ``perm`` such that the sticker at ``i`` after the move was at ``perm[i]``."""
+    perm = [0] * 54
+    for i in CENTER_FACELET:
+        perm[i] = i
+    for i, (j, ori) in enumerate(zip(move.cp, move.co)):
+        for k in range(3):
+            perm[CORNER_FACELET[i][(k + ori) % 3]] = CORNER_FACELET[j][k]
+    for i, (j, ori) in enumerate(zip(move.ep, move.eo)):
+        for k in range(2):
+            perm[EDGE_FACELET[i][(k + ori) % 2]] = EDGE_FACELET[j][k]
+    return perm
+
+
+# 54-index sticker permutation of every move, derived from the cubie tables
+FACELET_PERMUTATIONS = {
+    name: _facelet_permutation(move) for name, move in MOVE_TABLE.items()
+}
+_FACELET_GETTERS = {
+    name: itemgetter(*perm) for name, perm in FACELET_PERMUTATIONS.items()
+}
+
+
+class FaceletCube:
+    """
+    Cube state as 54 sticker face letters in URFDLB order.
+
+    This is the layout of the Kociemba facelet string, so exporting the state
+    is a decode and reading a face is a slice.
+    """
+
+    def __init__(self, facelets: bytes = SOLVED_FACELETS):
+        if len(facelets) != 54:
+            raise ValueError("Facelet state must have exactly 54 stickers.")
+        self.facelets = bytes(facelets)
+
+    def __repr__(self):
+        """String representation of the state for debugging."""
+        return f"FaceletCube({self.to_facelet_string()!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, FaceletCube):
+            return NotImplemented
+        return self.facelets == other.facelets
+
+    @classmethod
+    def from_facelet_string(cls, facelets: str) -> "FaceletCube":
+        """Build the state shown by a Kociemba facelet string."""
+        return cls(facelets.encode("ascii"))
+
+    def copy(self) -> "FaceletCube":
+        """Return an independent copy of this state."""
+        cube = FaceletCube.__new__(FaceletCube)
+        cube.facelets = self.facelets  # bytes are immutable, so can be shared
+        return cube
+
+    def to_bytes(self) -> bytes:
+        """Return the state as its 54 sticker bytes, for ``from_bytes``."""
+        return self.facelets
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FaceletCube":
+        """Rebuild a state saved by ``to_bytes``."""
+        return cls(data)
+
+    def apply_move(self, move: str):
+        """Apply one of the 18 face turns (e.g. ``"R'"``) in place."""
+        self.facelets = bytes(_FACELET_GETTERS[move](self.facelets))
+
+    @classmethod
+    def compose(cls, moves: Sequence[str]) -> itemgetter:
+        """Return the sticker permutation of a move sequence, for ``apply_transform``."""
+        perm = list(range(54))
+        for move in moves:
+            perm = [perm[i] for i in FACELET_PERMUTATIONS[move]]
+        return itemgetter(*perm)
+
+    def apply_transform(self, transform: itemgetter):
+        """Apply a sequence composed by ``compose`` in one step."""
+        self.facelets = bytes(transform(self.facelets))
+
+    def is_solved(self) -> bool:
+        """Check if every face shows a single color."""
+        return self.facelets == SOLVED_FACELETS
+
+    def to_facelet_string(self) -> str:
+        """Return the Kociemba facelet string (e.g. ``UUUUUUUUURRR...``)."""
+        return self.facelets.decode("ascii")
@@ -0,0 +1,133 @@
+# core/history.py
+
+"""Compact record of the moves applied to a cube, with undo and redo."""
+
+from collections.abc import Iterable
+
+from core.cubie import MOVES
+
+# Index of each move name in MOVES, the byte stored per move
+MOVE_CODES = {move: code for code, move in enumerate(MOVES)}
+
+# Code of the move that undoes each move (X <-> X', X2 undoes itself)
+INVERSE_CODES = [code + (1, -1, 0)[code % 3] for code in range(len(MOVES))]
+INVERSE_MOVES = {move: MOVES[INVERSE_CODES[code]] for move, code in MOVE_CODES.items()}
+
+
+class MoveHistory:
+    """
+    The moves applied so far, one byte each, plus the moves undone since.
+
+    Reads like the list of move names it replaces: it can be iterated,
+    indexed, sliced and compared with a list such as ``["F", "R", "U2"]``.
+    Recording a new move discards the moves that could be redone.
+    """
+
+    def __init__(self, moves: Iterable[str] = ()):
+        self._codes = bytearray(map(MOVE_CODES.__getitem__, moves))
+        self._redo = bytearray()  # undone moves, the next to redo last
+
+    def __repr__(self):
+        return f"MoveHistory({list(self)!r})"
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        return map(MOVES.__getitem__, self._codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [MOVES[code] for code in self._codes[index]]
+        return MOVES[self._codes[index]]
+
+    def __eq__(self, other):
+        if isinstance(other, MoveHistory):
+            return self._codes == other._codes
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # mutable
+
+    @property
+    def codes(self) -> bytes:
+        """The moves as bytes, each the index of the move in ``MOVES``."""
+        return bytes(self._codes)
+
+    @property
+    def undone(self) -> list[str]:
+        """The moves that can be redone, in the order they were first made."""
+        return [MOVES[code] for code in reversed(self._redo)]
+
+    @property
+    def all_codes(self) -> bytes:
+        """Codes of every recorded move, the undone ones included."""
+        return bytes(self._codes + self._redo[::-1])
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._codes)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def copy(self) -> "MoveHistory":
+        """Return an independent copy, redoable moves included."""
+        history = MoveHistory.__new__(MoveHistory)
+        history._codes = self._codes[:]
+        history._redo = self._redo[:]
+        return history
+
+    def append(self, move: str):
+        """Record a new move."""
+        self._codes.append(MOVE_CODES[move])
+        if self._redo:
+            self._redo.clear()
+
+    def extend(self, moves: Iterable[str]):
+        """Record several new moves."""
+        self._codes.extend(MOVE_CODES[move] for move in moves)
+        if self._redo:
+            self._redo.clear()
+
+    def clear(self):
+        """Forget every move, including the ones that could be redone."""
+        self._codes.clear()
+        self._redo.clear()
+
+    def undo(self) -> str | None:
+        """
+        Move the last move to the redo list.
+
+        :return: That move, or None if there is nothing to undo
+        """
+        if not self._codes:
+            return None
+        code = self._codes.pop()
+        self._redo.append(code)
+        return MOVES[code]
+
+    def redo(self) -> str | None:
+        """
+        Move the last undone move back to the history.
+
+        :return: That move, or None if there is nothing to redo
+        """
+        if not self._redo:
+            return None
+        code = self._redo.pop()
+        self._codes.append(code)
+        return MOVES[code]
+
+    def seek(self, index: int):
+        """
+        Make the first ``index`` recorded moves (undone ones included) the
+        history, and the rest redoable.
+        """
+        moves = self._codes + self._redo[::-1]
+        if not 0 <= index <= len(moves):
+            raise IndexError(f"Move index {index} out of range 0..{len(moves)}.")
+        self._codes = moves[:index]
+        self._redo = moves[index:][::-1]
@@ -0,0 +1,114 @@
+# core/loader.py
+
+"""
+Read and write files of facelet strings, one state per line.
+
+A line holds exactly what ``RubiksCube.toString()`` returns, so saving and
+loading round-trips. Blank lines and lines starting with ``#`` are skipped.
+Files are read lazily: ``load_cubes`` yields one cube at a time and
+``load_batches`` fixed-size ``CubeBatch`` blocks, so memory stays flat
+however long the file is.
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import IO
+
+import numpy as np
+
+from core.batch import CubeBatch
+from core.cube import RubiksCube
+from core.validate import describe, validate_many
+
+Source = str | Iterable[str]  # a path, or lines such as an open file
+
+
+def read_cube_strings(source: Source) -> Iterator[tuple[int, str]]:
+    """
+    Yield ``(line_number, cube_string)`` for every state line.
+
+    :param source: A file path, or any iterable of lines
+    """
+    if isinstance(source, str):
+        with open(source, encoding="ascii") as file:
+            yield from read_cube_strings(file)
+        return
+    for number, line in enumerate(source, start=1):
+        text = line.strip()
+        if text and not text.startswith("#"):
+            yield number, text
+
+
+def load_cubes(
+    source: Source, engine: str = "cubie", validate: bool = True
+) -> Iterator[RubiksCube]:
+    """
+    Yield a ``RubiksCube`` for every state in ``source``.
+
+    :param validate: Reject states that are not a solvable cube
+    :raises ValueError: at the first bad line, naming its line number
+    """
+    for number, cube_string in read_cube_strings(source):
+        try:
+            yield RubiksCube.from_string(cube_string, engine, validate)
+        except ValueError as error:
+            raise ValueError(f"Line {number}: {error}") from None
+
+
+def load_batches(
+    source: Source, batch_size: int = 65536, validate: bool = True
+) -> Iterator[CubeBatch]:
+    """
+    Yield the states of ``source`` as ``CubeBatch`` blocks of up to
+    ``batch_size`` cubes, validated in bulk with NumPy.
+
+    :raises ValueError: at the first bad line, naming its line number and
+        problems
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1.")
+    lines = read_cube_strings(source)
+    while True:
+        block = list(islice(lines, batch_size))
+        if not block:
+            return
+        numbers, strings = zip(*block)
+        if validate:
+            masks = validate_many(strings)
+            bad = np.flatnonzero(masks)
+            if len(bad):
+                first = bad[0]
+                problems = ", ".join(describe(masks[first]))
+                raise ValueError(f"Line {numbers[first]}: invalid cube ({problems}).")
+        elif any(len(text) != 54 for text in strings):
+            first = next(i for i, text in enumerate(strings) if len(text) != 54)
+            raise ValueError(f"Line {numbers[first]}: expected 54 stickers.")
+        yield CubeBatch.from_strings(strings)
+
+
+def save_cubes(
+    states: CubeBatch | Iterable[RubiksCube | str],
+    target: str | IO[str],
+) -> int:
+    """
+    Write one facelet string per line.
+
+    :param states: A ``CubeBatch``, or cubes and/or facelet strings
+    :param target: A file path (overwritten) or an open text file
+    :return: Number of states written
+    """
+    if isinstance(target, str):
+        with open(target, "w", encoding="ascii") as file:
+            return save_cubes(states, file)
+    if isinstance(states, CubeBatch):
+        strings = states.to_strings()
+    else:
+        strings = (
+            state.toString() if isinstance(state, RubiksCube) else state
+            for state in states
+        )
+    count = 0
+    for cube_string in strings:
+        target.write(cube_string + "\n")
+        count += 1
+    return count
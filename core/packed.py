@@ -0,0 +1,255 @@
+# core/packed.py
+
+"""
+Pack cube states into 9-byte records and store them in memory-mapped files.
+
+A record holds the four ``core.coords`` coordinates of a state:
+
+- ``edges``: edge permutation rank, 0..12!-1 (4 bytes)
+- ``corners``: corner permutation rank, 0..8!-1 (2 bytes)
+- ``orientation``: ``twist * 2048 + flip``, 0..2187*2048-1 (3 bytes, little
+  endian)
+
+so ``RECORD_DTYPE`` arrays take 9 bytes per state against 54 for a facelet
+string. A state file is an 8-byte magic header followed by the records; it
+is written in bulk with ``write_states`` and read without copying with
+``open_states``, which returns a ``numpy.memmap`` of records. The
+``*_batch`` functions convert whole arrays with NumPy.
+"""
+
+import os
+import struct
+from collections.abc import Iterable
+from itertools import islice
+
+import numpy as np
+
+from core import coords
+from core.batch import CubeBatch
+from core.cube import RubiksCube
+from core.cubie import (
+    CENTER_FACELET,
+    CORNER_FACELET,
+    CORNERS,
+    EDGE_FACELET,
+    EDGES,
+    FACE_ORDER,
+    CubieCube,
+)
+from core.validate import decode_pieces, describe, validate_many
+
+RECORD_DTYPE = np.dtype(
+    [("edges", "<u4"), ("corners", "<u2"), ("orientation", "u1", (3,))]
+)
+RECORD_SIZE = RECORD_DTYPE.itemsize  # 9
+
+MAGIC = b"CUBEREC1"
+
+_HEAD = struct.Struct("<IH")
+
+# Sticker bytes of each corner/edge (cubie * n + orientation) in its slot's
+# facelet order, the inverse of ``decode_pieces``
+_CORNER_STICKERS = np.array(
+    [
+        [ord(name[(k - ori) % 3]) for k in range(3)]
+        for name in CORNERS
+        for ori in range(3)
+    ],
+    dtype=np.uint8,
+)
+_EDGE_STICKERS = np.array(
+    [
+        [ord(name[(k - ori) % 2]) for k in range(2)]
+        for name in EDGES
+        for ori in range(2)
+    ],
+    dtype=np.uint8,
+)
+_CORNER_INDEX = np.array(CORNER_FACELET)
+_EDGE_INDEX = np.array(EDGE_FACELET)
+_CENTER_BYTES = np.frombuffer(FACE_ORDER.encode("ascii"), dtype=np.uint8)
+
+
+# -------- Single states --------
+def pack(state: RubiksCube | CubieCube) -> bytes:
+    """Return the 9-byte record of a cube or ``CubieCube``."""
+    if isinstance(state, RubiksCube):
+        state = CubieCube.from_facelet_string(state.toString())
+    orientation = coords.get_twist(state) * coords.N_FLIP + coords.get_flip(state)
+    return _HEAD.pack(
+        coords.get_edges(state), coords.get_corners(state)
+    ) + orientation.to_bytes(3, "little")
+
+
+def unpack(record: bytes) -> CubieCube:
+    """Return the ``CubieCube`` of a record from ``pack``."""
+    if len(record) != RECORD_SIZE:
+        raise ValueError(f"A record has {RECORD_SIZE} bytes, got {len(record)}.")
+    edges, corners = _HEAD.unpack_from(record)
+    twist, flip = divmod(int.from_bytes(record[6:9], "little"), coords.N_FLIP)
+    if (
+        edges >= coords.N_EDGES
+        or corners >= coords.N_CORNERS
+        or twist >= coords.N_TWIST
+    ):
+        raise ValueError("Record coordinates out of range.")
+    state = CubieCube()
+    coords.set_edges(state, edges)
+    coords.set_corners(state, corners)
+    coords.set_twist(state, twist)
+    coords.set_flip(state, flip)
+    return state
+
+
+def unpack_cube(record: bytes, engine: str = "cubie") -> RubiksCube:
+    """Return a ``RubiksCube`` (empty move history) for a record."""
+    state = unpack(record)
+    return RubiksCube.from_cubies(state.cp, state.co, state.ep, state.eo, engine)
+
+
+# -------- Arrays --------
+def pack_batch(batch: CubeBatch) -> np.ndarray:
+    """
+    Return the records of every cube of a batch, as a ``RECORD_DTYPE`` array.
+
+    :raises ValueError: if a row is not a solvable cube (see
+        ``core.validate.validate_many``); a record only keeps the twist and
+        flip of the first 7 corners and 11 edges, so it cannot hold one
+    """
+    masks = validate_many(batch.facelets)
+    if masks.any():
+        row = int(np.flatnonzero(masks)[0])
+        problems = ", ".join(describe(int(masks[row])))
+        raise ValueError(f"Row {row} is not a solvable cube ({problems}).")
+
+    corners, edges = decode_pieces(batch.facelets)
+    cp, co = corners // 3, corners % 3
+    ep, eo = edges // 2, edges % 2
+    twist = _digits_value(co[:, :7], 3)
+    flip = _digits_value(eo[:, :11], 2)
+    orientation = twist * coords.N_FLIP + flip
+    records = np.empty(len(batch), dtype=RECORD_DTYPE)
+    records["edges"] = coords.rank_permutations(ep)
+    records["corners"] = coords.rank_permutations(cp)
+    records["orientation"] = (orientation[:, None] >> np.array([0, 8, 16])) & 0xFF
+    return records
+
+
+def unpack_batch(records: np.ndarray) -> CubeBatch:
+    """Return a ``CubeBatch`` with the state of every record."""
+    records = np.asarray(records, dtype=RECORD_DTYPE)
+    orientation = records["orientation"].astype(np.int64)
+    orientation = orientation[:, 0] | orientation[:, 1] << 8 | orientation[:, 2] << 16
+    twist, flip = np.divmod(orientation, coords.N_FLIP)
+    if (
+        (records["edges"] >= coords.N_EDGES).any()
+        or (records["corners"] >= coords.N_CORNERS).any()
+        or (twist >= coords.N_TWIST).any()
+    ):
+        raise ValueError("Record coordinates out of range.")
+
+    cp = _unrank(records["corners"].astype(np.int64), 8)
+    ep = _unrank(records["edges"].astype(np.int64), 12)
+    co = _value_digits(twist, 3, 7)
+    eo = _value_digits(flip, 2, 11)
+
+    facelets = np.empty((len(records), 54), dtype=np.uint8)
+    facelets[:, CENTER_FACELET] = _CENTER_BYTES
+    facelets[:, _CORNER_INDEX] = _CORNER_STICKERS[cp * 3 + co]
+    facelets[:, _EDGE_INDEX] = _EDGE_STICKERS[ep * 2 + eo]
+    return CubeBatch(facelets)
+
+
+# -------- State files --------
+def write_states(
+    path: str,
+    states: CubeBatch | np.ndarray | Iterable[RubiksCube],
+    append: bool = False,
+    chunk: int = 65536,
+) -> int:
+    """
+    Write states to a state file.
+
+    :param states: A ``CubeBatch``, a ``RECORD_DTYPE`` array, or cubes (read
+        ``chunk`` at a time, so any iterable works)
+    :param append: Add to an existing file instead of replacing it
+    :return: Number of records written
+    """
+    exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+    with open(path, "ab" if exists else "wb") as file:
+        if exists:
+            _check_header(path)
+        else:
+            file.write(MAGIC)
+        if isinstance(states, CubeBatch):
+            states = pack_batch(states)
+        if isinstance(states, np.ndarray):
+            np.asarray(states, dtype=RECORD_DTYPE).tofile(file)
+            return len(states)
+
+        states = iter(states)
+        count = 0
+        while True:
+            cubes = list(islice(states, chunk))
+            if not cubes:
+                return count
+            pack_batch(CubeBatch.from_cubes(cubes)).tofile(file)
+            count += len(cubes)
+
+
+def open_states(path: str, mode: str = "r") -> np.ndarray:
+    """
+    Map the records of a state file into memory without reading them.
+
+    :param mode: ``numpy.memmap`` mode, "r" (read-only) or "r+" (writable)
+    :return: A ``RECORD_DTYPE`` memmap (a plain empty array for no records)
+    :raises ValueError: if the file is not a state file
+    """
+    _check_header(path)
+    size = os.path.getsize(path) - len(MAGIC)
+    if size % RECORD_SIZE:
+        raise ValueError(f"{path} ends with a partial record.")
+    if size == 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(
+        path,
+        dtype=RECORD_DTYPE,
+        mode=mode,
+        offset=len(MAGIC),
+        shape=(size // RECORD_SIZE,),
+    )
+
+
+# -------- Helper Functions --------
+def _check_header(path: str):
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a cube state file.")
+
+
+def _unrank(ranks: np.ndarray, n: int) -> np.ndarray:
+    """Permutation rows of the given Lehmer ranks."""
+    perms = np.empty((len(ranks), n), dtype=np.int8)
+    for i in range(n - 1, -1, -1):
+        ranks, digit = np.divmod(ranks, n - i)
+        # Going backwards, each value pushes up the later ones it is not above
+        perms[:, i] = digit
+        later = perms[:, i + 1 :]
+        later += later >= perms[:, i : i + 1]
+    return perms
+
+
+def _digits_value(digits: np.ndarray, base: int) -> np.ndarray:
+    value = np.zeros(len(digits), dtype=np.int64)
+    for column in digits.T:
+        value = value * base + column
+    return value
+
+
+def _value_digits(values: np.ndarray, base: int, count: int) -> np.ndarray:
+    """Digits (most significant first) plus a last one making the sum 0 mod base."""
+    digits = np.empty((len(values), count + 1), dtype=np.int64)
+    for i in range(count - 1, -1, -1):
+        values, digits[:, i] = np.divmod(values, base)
+    digits[:, count] = -digits[:, :count].sum(axis=1) % base
+    return digits
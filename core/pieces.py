@@ -1,11 +1,31 @@
 # core/pieces.py
 
+"""
+Pieces of the cube: a fixed set of colors plus a small integer orientation.
+
+A piece's colors never change after it is created. Which face each color is
+on is stored as an index into ``ORIENTATIONS``, a shared table of face
+tuples, so a piece holds no dict of its own and a turn only swaps an integer.
+``Piece.colors`` still returns the color-face map, built on each access.
+"""
+
+from itertools import permutations
 from utils.colors import Color
 from utils.faces import Face
 from typing import Dict, Tuple
 
+# Every ordered tuple of distinct faces: ``ORIENTATIONS[i][k]`` is the face of
+# the k-th color of a piece with orientation ``i``
+ORIENTATIONS = tuple(faces for n in (1, 2, 3) for faces in permutations(Face, n))
+_ORIENTATION_INDEX = {faces: i for i, faces in enumerate(ORIENTATIONS)}
+
+# Color tuples already in use, so pieces with the same colors share one tuple
+_IDENTITIES = {}
+
 
 class Piece:
+    __slots__ = ("identity", "name", "orientation", "position")
+
     def __init__(
         self, colors: Dict[Color, Face], name: str, position: Tuple[int, int, int]
     ):
@@ -13,13 +33,31 @@ class Piece:
         :param colors: A dictionary mapping colors to faces (e.g., {Color.YELLOW: Face.U})
         :param position: 3D tuple (x, y, z) representing the position in the 3x3x3 Rubik's cube grid
         """
-        self.colors = colors  # The color on each face of the piece
+        identity = tuple(colors)
+        # The piece's colors, in order; never changes
+        self.identity = _IDENTITIES.setdefault(identity, identity)
+        self.orientation = _orientation(tuple(colors.values()))
         self.position = position  # Position in 3D space (x, y, z)
         self.name = name
 
     def __repr__(self):
         """String representation of the piece for debugging."""
-        return f"{self.__class__.__name__}(Colors: {self.colors}, Position: {self.position})"
+        return f"{self.__class__.__name__}(Colors: {self.get_faces()}, Position: {self.position})"
+
+    @property
+    def colors(self) -> Dict[Color, Face]:
+        """
+        The color-face map, as passed to the constructor.
+
+        A new dict on each access: changing it does not move the piece, use
+        ``set_faces`` for that.
+        """
+        return dict(zip(self.identity, ORIENTATIONS[self.orientation]))
+
+    @property
+    def faces(self) -> Tuple[Face, ...]:
+        """The face under each color, in the order of ``identity``."""
+        return ORIENTATIONS[self.orientation]
 
     def get_position(self) -> Tuple[int, int, int]:
         """Return the position of the piece."""
@@ -29,15 +67,31 @@ class Piece:
         """Update the position of the piece."""
         self.position = position
 
-    def get_faces(self):
+    def get_faces(self) -> Dict[Color, Face]:
         """Return the color-face map (colors assigned to each face)."""
         return self.colors
 
     def set_faces(self, colors: Dict[Color, Face]):
-        """Update the color-face map."""
-        temp = self.colors.copy()
-        for color, face in zip(temp.keys(), colors.values()):
-            self.colors[color] = face
+        """
+        Update the color-face map.
+
+        The faces are taken in order and assigned to the piece's own colors;
+        the colors of the piece never change.
+
+        :raises ValueError: if the result would put two colors on one face
+        """
+        faces = tuple(colors.values())
+        size = len(self.identity)
+        if len(faces) < size:
+            faces += ORIENTATIONS[self.orientation][len(faces) :]
+        self.orientation = _orientation(faces[:size])
+
+    def get_color(self, face: Face) -> Color | None:
+        """Return the color on ``face``, or None if the piece is not on it."""
+        for color, piece_face in zip(self.identity, ORIENTATIONS[self.orientation]):
+            if piece_face == face:
+                return color
+        return None
 
     def get_name(self) -> str:
         """Return the name of the piece."""
@@ -49,6 +103,8 @@ class Piece:
 
 
 class Center(Piece):
+    __slots__ = ()
+
     def __init__(
         self, colors: Dict[Color, Face], name: str, position: Tuple[int, int, int]
     ):
@@ -59,6 +115,8 @@ class Center(Piece):
 
 
 class Edge(Piece):
+    __slots__ = ()
+
     def __init__(
         self, colors: Dict[Color, Face], name: str, position: Tuple[int, int, int]
     ):
@@ -69,6 +127,8 @@ class Edge(Piece):
 
 
 class Corner(Piece):
+    __slots__ = ()
+
     def __init__(
         self, colors: Dict[Color, Face], name: str, position: Tuple[int, int, int]
     ):
@@ -76,3 +136,16 @@ class Corner(Piece):
         if len(colors) != 3:
             raise ValueError("Corner piece must have exactly 3 colors and 3 faces.")
         super().__init__(colors, name, position)
+
+
+# -------- Helper Functions --------
+def _orientation(faces: tuple) -> int:
+    """
+    Return the index of ``faces`` in ``ORIENTATIONS``.
+
+    :raises ValueError: if ``faces`` is not 1 to 3 distinct faces
+    """
+    index = _ORIENTATION_INDEX.get(faces)
+    if index is None:
+        raise ValueError(f"Invalid faces for a piece: {faces}.")
+    return index
@@ -1,4 +1,10 @@
 import random
+from collections.abc import Iterator
+
+import numpy as np
+
+from core.cubie import CubieCube
+from core.validate import parities
 
 
 class Scrambler:
@@ -47,3 +53,109 @@ class Scrambler:
                 method = getattr(cube, f"{face}2")  # e.g., U2, D2, F2, B2, R2, L2
 
             method()  # Apply the selected move
+
+
+# -------- Bulk Generation --------
+# Move codes index Scrambler.MOVES: code // 3 is the face (U, D, F, B, R, L,
+# so code // 6 is the axis) and code % 3 the turn
+RngLike = None | int | np.random.SeedSequence | np.random.Generator
+
+
+def rng_streams(seed: int | None, count: int) -> list[np.random.Generator]:
+    """
+    Return ``count`` independent generators spawned from one seed.
+
+    Hand one to each worker process: the streams do not overlap, and the same
+    seed always gives the same streams.
+    """
+    children = np.random.SeedSequence(seed).spawn(count)
+    return [np.random.default_rng(child) for child in children]
+
+
+def generate_scrambles(
+    count: int,
+    length: int = 20,
+    rng: RngLike = None,
+    no_opposite_triples: bool = False,
+) -> np.ndarray:
+    """
+    Generate ``count`` random scrambles at once as a ``(count, length)``
+    ``uint8`` array of move codes.
+
+    Like ``Scrambler.generate_scramble`` no face is turned twice in a row.
+
+    :param rng: A ``numpy.random.Generator``, or a seed for one
+    :param no_opposite_triples: Also avoid a face, its opposite face and the
+        first face again (``U D U``), which only repeats the first turn
+    """
+    if count < 0 or length < 0:
+        raise ValueError("Count and length must not be negative.")
+    rng = np.random.default_rng(rng)
+    faces = np.empty((count, length), dtype=np.uint8)
+    if length:
+        faces[:, 0] = rng.integers(0, 6, count)
+    for t in range(1, length):
+        previous = faces[:, t - 1]
+        # Any of the five other faces
+        column = (previous + rng.integers(1, 6, count, dtype=np.uint8)) % 6
+        if no_opposite_triples and t > 1:
+            axis = previous // 2
+            blocked = axis == faces[:, t - 2] // 2
+            # One of the four faces on the two other axes
+            draw = rng.integers(0, 4, int(blocked.sum()), dtype=np.uint8)
+            other_axis = (axis[blocked] + 1 + draw // 2) % 3
+            column[blocked] = other_axis * 2 + draw % 2
+        faces[:, t] = column
+    return faces * 3 + rng.integers(0, 3, (count, length), dtype=np.uint8)
+
+
+def scramble_blocks(
+    count: int,
+    length: int = 20,
+    seed: int | None = None,
+    block_size: int = 65536,
+    no_opposite_triples: bool = False,
+) -> Iterator[np.ndarray]:
+    """
+    Yield ``count`` scrambles in blocks of at most ``block_size`` rows.
+
+    Block ``i`` is drawn from its own stream (the ``i``-th child of ``seed``),
+    so any block can be regenerated, or generated by another process, on its
+    own and the output does not depend on who generates what.
+    """
+    if block_size < 1:
+        raise ValueError("Block size must be at least 1.")
+    entropy = np.random.SeedSequence(seed).entropy
+    for index, start in enumerate(range(0, count, block_size)):
+        stream = np.random.SeedSequence(entropy, spawn_key=(index,))
+        size = min(block_size, count - start)
+        yield generate_scrambles(size, length, stream, no_opposite_triples)
+
+
+def decode_scramble(codes) -> list[str]:
+    """Turn one row of move codes into move names (as ``generate_scramble``)."""
+    return [Scrambler.MOVES[code] for code in codes]
+
+
+# -------- Random-State Scrambles --------
+def random_states(count: int, rng: RngLike = None) -> list[CubieCube]:
+    """
+    Draw ``count`` cube states uniformly from all reachable states.
+
+    Corner and edge permutations, 7 corner twists and 11 edge flips are drawn
+    freely; the last twist and flip are then fixed so the totals are valid,
+    and two edges are swapped where the permutation parities disagree.
+    """
+    rng = np.random.default_rng(rng)
+    cp = rng.permuted(np.tile(np.arange(8), (count, 1)), axis=1)
+    ep = rng.permuted(np.tile(np.arange(12), (count, 1)), axis=1)
+    odd = parities(cp) != parities(ep)
+    ep[odd, :2] = ep[odd, 1::-1]
+    co = rng.integers(0, 3, (count, 8))
+    co[:, 7] = -co[:, :7].sum(axis=1) % 3
+    eo = rng.integers(0, 2, (count, 12))
+    eo[:, 11] = eo[:, :11].sum(axis=1) % 2
+    return [
+        CubieCube(*arrays)
+        for arrays in zip(cp.tolist(), co.tolist(), ep.tolist(), eo.tolist())
+    ]
@@ -0,0 +1,215 @@
+# core/symmetry.py
+
+"""
+The 48 symmetries of the cube and canonical (symmetry-reduced) state keys.
+
+A symmetry is a whole-cube rotation, possibly followed by a mirror image.
+Applying one to a state moves every sticker to its new place and recolors it
+after the face its color now belongs to, so the centers stay in place; the
+result is the same position seen from another side (or in a mirror). The
+states related this way need equally long solutions, and a solution of one
+turns into a solution of another by renaming its moves.
+
+``canonical`` picks the smallest facelet string among the 48 and returns the
+symmetry that produced it, so caches and tables can store one entry for all
+of them; ``translate_moves`` maps a solution of the canonical state back.
+
+``orientation_variants`` gives the state seen along each of the three axes,
+and the inverse of each: six equivalent problems for which a two-phase
+search finds solutions of different lengths. ``variant_moves`` maps a
+solution of any of them back.
+"""
+
+from collections.abc import Sequence
+from itertools import permutations, product
+from operator import itemgetter
+
+from core.algorithm import Algorithm
+from core.cubie import FACE_ORDER, CubieCube
+
+# Outward normal of each face (x points right, y up, z to the front)
+# fmt: off
+FACE_NORMALS = {
+    "U": (0, 1, 0), "R": (1, 0, 0), "F": (0, 0, 1),
+    "D": (0, -1, 0), "L": (-1, 0, 0), "B": (0, 0, -1),
+}
+
+# Position of the first sticker of each face, then the steps to the next
+# column and the next row, in the Kociemba facelet layout
+_FACE_LAYOUT = {
+    "U": ((-1, 1, -1), (1, 0, 0), (0, 0, 1)),
+    "R": ((1, 1, 1), (0, 0, -1), (0, -1, 0)),
+    "F": ((-1, 1, 1), (1, 0, 0), (0, -1, 0)),
+    "D": ((-1, -1, 1), (1, 0, 0), (0, 0, -1)),
+    "L": ((-1, 1, -1), (0, 0, 1), (0, -1, 0)),
+    "B": ((1, 1, -1), (-1, 0, 0), (0, -1, 0)),
+}
+# fmt: on
+
+
+def _sticker_positions() -> list[tuple]:
+    """Return ``(position, normal)`` of each facelet, in facelet order."""
+    stickers = []
+    for face in FACE_ORDER:
+        origin, column, row = _FACE_LAYOUT[face]
+        for i in range(9):
+            r, c = divmod(i, 3)
+            position = tuple(
+                o + c * dc + r * dr for o, dc, dr in zip(origin, column, row)
+            )
+            stickers.append((position, FACE_NORMALS[face]))
+    return stickers
+
+
+def _transform(matrix, vector) -> tuple:
+    return tuple(sum(m * v for m, v in zip(row, vector)) for row in matrix)
+
+
+def _symmetry_matrices() -> list[tuple]:
+    """The 48 signed permutation matrices, the 24 rotations first."""
+    matrices = []
+    for axes in permutations(range(3)):
+        for signs in product((1, -1), repeat=3):
+            matrix = tuple(
+                tuple(signs[i] if j == axes[i] else 0 for j in range(3))
+                for i in range(3)
+            )
+            matrices.append(matrix)
+    matrices.sort(key=lambda matrix: (_determinant(matrix) < 0, matrix != _IDENTITY))
+    return matrices
+
+
+def _determinant(m) -> int:
+    return (
+        m[0][0] * (m[1][1] * m[2][2] - m[1][2] * m[2][1])
+        - m[0][1] * (m[1][0] * m[2][2] - m[1][2] * m[2][0])
+        + m[0][2] * (m[1][0] * m[2][1] - m[1][1] * m[2][0])
+    )
+
+
+_IDENTITY = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+_FACE_OF_NORMAL = {normal: face for face, normal in FACE_NORMALS.items()}
+_STICKERS = _sticker_positions()
+_STICKER_INDEX = {sticker: i for i, sticker in enumerate(_STICKERS)}
+
+# Symmetry 0 is the identity, 1..23 the other rotations, 24..47 the mirrors
+SYMMETRY_MATRICES = _symmetry_matrices()
+N_SYMMETRIES = len(SYMMETRY_MATRICES)
+ROTATIONS = range(24)
+
+# Face each face is carried to by each symmetry, e.g. ``SYMMETRY_FACES[s]["U"]``
+SYMMETRY_FACES = [
+    {face: _FACE_OF_NORMAL[_transform(m, n)] for face, n in FACE_NORMALS.items()}
+    for m in SYMMETRY_MATRICES
+]
+
+# Facelet each facelet comes from: sticker ``i`` of the image is sticker
+# ``SYMMETRY_SOURCES[s][i]`` of the original, recolored by ``_RECOLOR[s]``
+SYMMETRY_SOURCES = []
+for _m in SYMMETRY_MATRICES:
+    _sources = [0] * 54
+    for _i, (_position, _normal) in enumerate(_STICKERS):
+        _target = (_transform(_m, _position), _transform(_m, _normal))
+        _sources[_STICKER_INDEX[_target]] = _i
+    SYMMETRY_SOURCES.append(_sources)
+_GATHER = [itemgetter(*sources) for sources in SYMMETRY_SOURCES]
+_RECOLOR = [
+    str.maketrans("".join(faces), "".join(faces.values())) for faces in SYMMETRY_FACES
+]
+
+# Symmetry that undoes each symmetry
+INVERSE_SYMMETRY = [
+    next(
+        t
+        for t in range(N_SYMMETRIES)
+        if all(SYMMETRY_FACES[t][SYMMETRY_FACES[s][f]] == f for f in FACE_ORDER)
+    )
+    for s in range(N_SYMMETRIES)
+]
+
+
+def _diagonal_rotation(cycle: str) -> int:
+    """The rotation carrying each face of ``cycle`` to the next one."""
+    return next(
+        s
+        for s in ROTATIONS
+        if all(SYMMETRY_FACES[s][a] == b for a, b in zip(cycle, cycle[1:] + cycle[0]))
+    )
+
+
+# The identity and the two rotations about the URF-DBL diagonal, which turn
+# the U-D axis into the R-L and F-B axes
+AXIS_ROTATIONS = (0, _diagonal_rotation("URF"), _diagonal_rotation("UFR"))
+
+
+def conjugate(cube_string: str, symmetry: int) -> str:
+    """Return the facelet string of a state seen through ``symmetry``."""
+    return "".join(_GATHER[symmetry](cube_string)).translate(_RECOLOR[symmetry])
+
+
+def canonical(cube_string: str, symmetries: Sequence[int] = range(48)):
+    """
+    Return the smallest facelet string among the symmetric states, and the
+    symmetry that gives it.
+
+    ``conjugate(cube_string, symmetry)`` is the canonical string, and
+    ``translate_moves(solution, symmetry)`` turns a solution of the canonical
+    state into one of ``cube_string``.
+
+    :param symmetries: Restrict to these symmetries, e.g. ``ROTATIONS``
+    :return: ``(canonical_string, symmetry)``
+    """
+    if len(cube_string) != 54:
+        raise ValueError("Facelet string must have exactly 54 stickers.")
+    best, best_symmetry = None, 0
+    for symmetry in symmetries:
+        image = conjugate(cube_string, symmetry)
+        if best is None or image < best:
+            best, best_symmetry = image, symmetry
+    return best, best_symmetry
+
+
+def map_moves(moves: Sequence[str], symmetry: int) -> list[str]:
+    """
+    Return the moves that do to the image of a state under ``symmetry`` what
+    ``moves`` do to the state itself. Mirrors turn clockwise turns into
+    counter-clockwise ones.
+    """
+    faces = SYMMETRY_FACES[symmetry]
+    mirrored = symmetry >= 24
+    mapped = []
+    for move in moves:
+        turn = move[1:]
+        if mirrored and turn != "2":
+            turn = "" if turn else "'"
+        mapped.append(faces[move[0]] + turn)
+    return mapped
+
+
+def translate_moves(moves: Sequence[str], symmetry: int) -> list[str]:
+    """Turn moves for ``conjugate(state, symmetry)`` into moves for ``state``."""
+    return map_moves(moves, INVERSE_SYMMETRY[symmetry])
+
+
+def orientation_variants(cube_string: str) -> list[tuple[str, int, bool]]:
+    """
+    Return ``(facelets, symmetry, inverted)`` for the state seen along each
+    of the three axes (``AXIS_ROTATIONS``), each followed by its inverse:
+    plain and inverted entries alternate, axis by axis.
+
+    :raises ValueError: if the string is not a cube
+    """
+    variants = []
+    for symmetry in AXIS_ROTATIONS:
+        image = conjugate(cube_string, symmetry)
+        variants.append((image, symmetry, False))
+        inverse = CubieCube.from_facelet_string(image).inverse()
+        variants.append((inverse.to_facelet_string(), symmetry, True))
+    return variants
+
+
+def variant_moves(moves: Sequence[str], symmetry: int, inverted: bool) -> list[str]:
+    """Turn a solution of an ``orientation_variants`` entry into one of the state."""
+    if inverted:
+        moves = Algorithm(moves).inverse().moves
+    return translate_moves(moves, symmetry)
@@ -0,0 +1,85 @@
+# core/timeline.py
+
+"""Jump to any point of a long move sequence using periodic checkpoints."""
+
+from collections.abc import Iterable
+
+from core.cubie import MOVES
+
+
+class Timeline:
+    """
+    The states along a move sequence, with a snapshot every ``interval`` moves.
+
+    The state after any number of moves is rebuilt from the nearest snapshot
+    at or before it plus at most ``interval - 1`` moves. Snapshots are the
+    engine's ``to_bytes()`` (40 bytes for a ``CubieCube``) and are taken the
+    first time they are needed, so a larger ``interval`` saves memory and a
+    smaller one makes each seek cheaper.
+    """
+
+    def __init__(self, start, codes: Iterable[int] = (), interval: int = 64):
+        """
+        :param start: State before the first move (``CubieCube`` or
+            ``FaceletCube``)
+        :param codes: The moves, as indices into ``MOVES``
+        :param interval: Moves between snapshots
+        """
+        if interval < 1:
+            raise ValueError("Checkpoint interval must be at least 1.")
+        self.engine = type(start)
+        self.interval = interval
+        self.codes = bytearray(codes)
+        self._snapshots = [start.to_bytes()]
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def checkpoints(self) -> int:
+        """Number of snapshots currently held."""
+        return len(self._snapshots)
+
+    def state_at(self, index: int):
+        """Return a new state equal to the start state after ``index`` moves."""
+        if not 0 <= index <= len(self.codes):
+            raise IndexError(f"Move index {index} out of range 0..{len(self.codes)}.")
+        checkpoint = index // self.interval
+        while len(self._snapshots) <= checkpoint:
+            self._add_snapshot()
+        start = checkpoint * self.interval
+        state = self.engine.from_bytes(self._snapshots[checkpoint])
+        for code in self.codes[start:index]:
+            state.apply_move(MOVES[code])
+        return state
+
+    def update(self, codes: bytes):
+        """
+        Replace the move sequence, keeping the snapshots of the part that
+        did not change.
+        """
+        common = _common_prefix(self.codes, codes)
+        del self._snapshots[common // self.interval + 1 :]
+        self.codes = bytearray(codes)
+
+    # -------- Helper Functions --------
+    def _add_snapshot(self):
+        start = (len(self._snapshots) - 1) * self.interval
+        state = self.engine.from_bytes(self._snapshots[-1])
+        for code in self.codes[start : start + self.interval]:
+            state.apply_move(MOVES[code])
+        self._snapshots.append(state.to_bytes())
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    """Return the length of the longest common prefix (by binary search)."""
+    low, high = 0, min(len(a), len(b))
+    if a[:high] == b[:high]:
+        return high
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
@@ -0,0 +1,285 @@
+# core/validate.py
+
+"""
+Check that a facelet string is a solvable cube before handing it to a solver.
+
+``validate`` runs the checks in order and reports every problem it finds as an
+``Issue`` with a short code; later checks need the earlier ones to pass (the
+twist of a corner only makes sense once the corner is known), so they are
+skipped when those fail. ``validate_many`` runs the same checks with NumPy on
+many strings at once and returns one bit mask per string.
+
+Codes, in the order they are checked:
+
+- ``length``: the string does not have 54 stickers
+- ``stickers``: a sticker is not one of URFDLB, or a color is not on 9 stickers
+- ``centers``: a center is not the color of its face (order URFDLB)
+- ``corners`` / ``edges``: a piece has an impossible set of colors, or a
+  piece appears twice
+- ``twist``: the corner twists do not add up (one corner is twisted)
+- ``flip``: an odd number of edges is flipped
+- ``parity``: two pieces are swapped (corner and edge permutation parities
+  differ)
+"""
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import numpy as np
+
+from core.cubie import (
+    CENTER_FACELET,
+    CORNER_FACELET,
+    CORNER_LOOKUP,
+    CORNERS,
+    EDGE_FACELET,
+    EDGE_LOOKUP,
+    EDGES,
+    FACE_ORDER,
+)
+
+ISSUE_CODES = (
+    "length",
+    "stickers",
+    "centers",
+    "corners",
+    "edges",
+    "twist",
+    "flip",
+    "parity",
+)
+
+# Bit of each code in the masks of ``validate_many``
+ISSUE_BITS = {code: 1 << i for i, code in enumerate(ISSUE_CODES)}
+
+
+class Issue(NamedTuple):
+    """One reason a facelet string is not a solvable cube."""
+
+    code: str  # one of ISSUE_CODES
+    message: str
+    where: str | None = None  # face or piece slot concerned, if any
+
+
+_CENTERS = "".join(FACE_ORDER)
+
+
+def validate(cube_string: str) -> list[Issue]:
+    """
+    Return the problems of a facelet string; an empty list means solvable.
+
+    :param cube_string: 54 face letters in URFDLB order, like ``toString()``
+    """
+    if len(cube_string) != 54:
+        return [Issue("length", f"Expected 54 stickers, got {len(cube_string)}.")]
+
+    issues = []
+    counts = [cube_string.count(face) for face in FACE_ORDER]
+    for face, count in zip(FACE_ORDER, counts):
+        if count != 9:
+            issues.append(
+                Issue("stickers", f"{face} is on {count} stickers, not 9.", face)
+            )
+    if sum(counts) != 54:
+        issues.append(Issue("stickers", "Some stickers are not one of URFDLB."))
+    if cube_string[4::9] != _CENTERS:
+        for face, center in zip(FACE_ORDER, cube_string[4::9]):
+            if face != center:
+                issues.append(
+                    Issue("centers", f"The {face} center is {center!r}.", face)
+                )
+    if issues:
+        return issues
+
+    cp, co = [], []
+    for slot, (a, b, c) in zip(CORNERS, CORNER_FACELET):
+        piece = CORNER_LOOKUP.get(cube_string[a] + cube_string[b] + cube_string[c])
+        if piece is None:
+            issues.append(
+                Issue("corners", f"Corner {slot} has impossible colors.", slot)
+            )
+        else:
+            cp.append(piece[0])
+            co.append(piece[1])
+    ep, eo = [], []
+    for slot, (a, b) in zip(EDGES, EDGE_FACELET):
+        piece = EDGE_LOOKUP.get(cube_string[a] + cube_string[b])
+        if piece is None:
+            issues.append(Issue("edges", f"Edge {slot} has impossible colors.", slot))
+        else:
+            ep.append(piece[0])
+            eo.append(piece[1])
+    if issues:
+        return issues
+    for names, perm, code in ((CORNERS, cp, "corners"), (EDGES, ep, "edges")):
+        if len(set(perm)) != len(perm):
+            for cubie in sorted(set(perm)):
+                if perm.count(cubie) > 1:
+                    issues.append(
+                        Issue(
+                            code, f"Piece {names[cubie]} appears twice.", names[cubie]
+                        )
+                    )
+    if issues:
+        return issues
+
+    if sum(co) % 3:
+        issues.append(Issue("twist", "A corner is twisted."))
+    if sum(eo) % 2:
+        issues.append(Issue("flip", "An edge is flipped."))
+    if parity(cp) != parity(ep):
+        issues.append(Issue("parity", "Two pieces are swapped."))
+    return issues
+
+
+def is_valid(cube_string: str) -> bool:
+    """Return True if the facelet string is a solvable cube."""
+    return not validate(cube_string)
+
+
+def check(cube_string: str):
+    """
+    Raise if the facelet string is not a solvable cube.
+
+    :raises ValueError: with every problem found in its message
+    """
+    issues = validate(cube_string)
+    if issues:
+        raise ValueError("Invalid cube: " + " ".join(issue.message for issue in issues))
+
+
+# -------- Bulk validation --------
+# Sticker byte -> color index (0..5), 6 for anything else
+_COLOR_INDEX = np.full(256, 6, dtype=np.uint8)
+for _i, _face in enumerate(FACE_ORDER):
+    _COLOR_INDEX[ord(_face)] = _i
+
+# Colors of a slot as a base-7 number -> cubie * n + orientation, or -1
+_CORNER_TABLE = np.full(7**3, -1, dtype=np.int8)
+for _colors, (_cubie, _ori) in CORNER_LOOKUP.items():
+    _a, _b, _c = (FACE_ORDER.index(face) for face in _colors)
+    _CORNER_TABLE[(_a * 7 + _b) * 7 + _c] = _cubie * 3 + _ori
+_EDGE_TABLE = np.full(7**2, -1, dtype=np.int8)
+for _colors, (_cubie, _ori) in EDGE_LOOKUP.items():
+    _a, _b = (FACE_ORDER.index(face) for face in _colors)
+    _EDGE_TABLE[_a * 7 + _b] = _cubie * 2 + _ori
+
+_CORNER_INDEX = np.array(CORNER_FACELET)
+_EDGE_INDEX = np.array(EDGE_FACELET)
+
+
+def validate_many(
+    cube_strings: Iterable[str] | np.ndarray, chunk: int = 65536
+) -> np.ndarray:
+    """
+    Validate many facelet strings at once.
+
+    :param cube_strings: Facelet strings, or a ``(count, 54)`` uint8 array of
+        their bytes (as ``CubeBatch.facelets``)
+    :param chunk: Strings checked per NumPy pass, bounding temporary memory
+    :return: One ``uint16`` mask per string, 0 if it is solvable, else the
+        ``ISSUE_BITS`` of the problems found (see ``describe``)
+    """
+    if isinstance(cube_strings, np.ndarray):
+        stickers = np.asarray(cube_strings, dtype=np.uint8)
+        if stickers.ndim != 2 or stickers.shape[1] != 54:
+            raise ValueError("Expected an array of shape (count, 54).")
+        masks = np.zeros(len(stickers), dtype=np.uint16)
+    else:
+        encoded = [text.encode("ascii", "replace") for text in cube_strings]
+        masks = np.array(
+            [0 if len(text) == 54 else ISSUE_BITS["length"] for text in encoded],
+            dtype=np.uint16,
+        )
+        padding = b"?" * 54
+        stickers = np.frombuffer(
+            b"".join(text if len(text) == 54 else padding for text in encoded),
+            dtype=np.uint8,
+        ).reshape(-1, 54)
+
+    for start in range(0, len(stickers), chunk):
+        part = slice(start, start + chunk)
+        masks[part] |= _validate_chunk(stickers[part])
+    masks[masks & ISSUE_BITS["length"] != 0] = ISSUE_BITS["length"]
+    return masks
+
+
+def decode_pieces(stickers: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Identify the piece in every slot of a ``(count, 54)`` sticker byte array.
+
+    :return: ``(corners, edges)`` of shapes ``(count, 8)`` and ``(count, 12)``
+        holding ``cubie * 3 + twist`` and ``cubie * 2 + flip`` (the
+        ``CubieCube`` arrays), or -1 where a slot's colors are impossible
+    """
+    return _pieces(_COLOR_INDEX[stickers])
+
+
+def describe(mask: int) -> list[str]:
+    """Return the issue codes set in a mask from ``validate_many``."""
+    return [code for code, bit in ISSUE_BITS.items() if mask & bit]
+
+
+def parity(perm: list[int]) -> int:
+    """Return 0 for an even permutation and 1 for an odd one (by cycles)."""
+    seen = [False] * len(perm)
+    odd = 0
+    for i in range(len(perm)):
+        if not seen[i]:
+            j = perm[i]
+            while j != i:
+                seen[j] = True
+                j = perm[j]
+                odd ^= 1
+            seen[i] = True
+    return odd
+
+
+def parities(perms: np.ndarray) -> np.ndarray:
+    """Parity of each row of a ``(count, n)`` permutation array (by inversions)."""
+    n = perms.shape[1]
+    upper = np.triu(np.ones((n, n), dtype=bool), 1)
+    inversions = (perms[:, :, None] > perms[:, None, :]) & upper
+    return inversions.sum(axis=(1, 2)) % 2
+
+
+# -------- Helper Functions --------
+def _validate_chunk(stickers: np.ndarray) -> np.ndarray:
+    """Return the masks (without ``length``) of a ``(count, 54)`` byte array."""
+    colors = _COLOR_INDEX[stickers]
+    masks = np.zeros(len(colors), dtype=np.uint16)
+
+    counts = np.stack([(colors == i).sum(axis=1) for i in range(6)], axis=1)
+    masks[(counts != 9).any(axis=1)] |= ISSUE_BITS["stickers"]
+    centers = colors[:, CENTER_FACELET] != np.arange(6)
+    masks[centers.any(axis=1)] |= ISSUE_BITS["centers"]
+
+    corners, edges = _pieces(colors)
+    cp, co = corners // 3, corners % 3
+    ep, eo = edges // 2, edges % 2
+
+    # Like ``validate``, each stage is only checked where the earlier ones pass
+    known = masks == 0
+    masks[known & (corners < 0).any(axis=1)] |= ISSUE_BITS["corners"]
+    masks[known & (edges < 0).any(axis=1)] |= ISSUE_BITS["edges"]
+    known = masks == 0
+    repeated = (np.sort(cp, axis=1) != np.arange(8)).any(axis=1)
+    masks[known & repeated] |= ISSUE_BITS["corners"]
+    repeated = (np.sort(ep, axis=1) != np.arange(12)).any(axis=1)
+    masks[known & repeated] |= ISSUE_BITS["edges"]
+
+    known = masks == 0
+    masks[known & (co.sum(axis=1) % 3 != 0)] |= ISSUE_BITS["twist"]
+    masks[known & (eo.sum(axis=1) % 2 != 0)] |= ISSUE_BITS["flip"]
+    masks[known & (parities(cp) != parities(ep))] |= ISSUE_BITS["parity"]
+    return masks
+
+
+def _pieces(colors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    corner_colors = colors[:, _CORNER_INDEX].astype(np.int16)
+    corners = _CORNER_TABLE[
+        (corner_colors[..., 0] * 7 + corner_colors[..., 1]) * 7 + corner_colors[..., 2]
+    ]
+    edge_colors = colors[:, _EDGE_INDEX].astype(np.int16)
+    edges = _EDGE_TABLE[edge_colors[..., 0] * 7 + edge_colors[..., 1]]
+    return corners, edges
@@ -0,0 +1,122 @@
+# core/zobrist.py
+
+"""
+64-bit Zobrist hashing of cube states.
+
+Every (facelet, color) pair has a fixed random key and a state hashes to the
+XOR of the keys of its 54 stickers. A corner or edge in a slot covers a fixed
+set of stickers, so the XOR of their keys is precomputed per (slot, cubie,
+orientation): a cubie state hashes with 20 lookups and, because a move only
+moves the pieces of one face, the hash can be updated by XOR-ing out the keys
+of those pieces before the move and XOR-ing them back in after it.
+
+Both engines hash to the same value for the same state, and the keys are
+seeded, so hashes are stable across processes and runs.
+"""
+
+import random
+
+from core.cubie import (
+    CENTER_FACELET,
+    CORNER_FACELET,
+    CORNERS,
+    EDGE_FACELET,
+    EDGES,
+    FACE_ORDER,
+    MOVE_TABLE,
+    CubieCube,
+)
+from core.facelet import FACELET_PERMUTATIONS, FaceletCube
+
+_SEED = 0x5EED_CAFE
+
+_random = random.Random(_SEED)
+
+# Key of each color (face letter) on each of the 54 facelets
+STICKER_KEYS = [
+    {face: _random.getrandbits(64) for face in FACE_ORDER} for _ in range(54)
+]
+
+# Keys of the six centers, which never move
+CENTER_KEY = 0
+for _index in CENTER_FACELET:
+    CENTER_KEY ^= STICKER_KEYS[_index][FACE_ORDER[CENTER_FACELET.index(_index)]]
+
+
+def _piece_keys(slots: list[tuple], names: list[str]) -> list[list[int]]:
+    """Return ``keys[slot][cubie * n + ori]`` for pieces with ``n`` stickers."""
+    n = len(slots[0])
+    keys = []
+    for slot in slots:
+        row = []
+        for name in names:
+            for ori in range(n):
+                key = 0
+                for k in range(n):
+                    key ^= STICKER_KEYS[slot[(k + ori) % n]][name[k]]
+                row.append(key)
+        keys.append(row)
+    return keys
+
+
+CORNER_KEYS = _piece_keys(CORNER_FACELET, CORNERS)
+EDGE_KEYS = _piece_keys(EDGE_FACELET, EDGES)
+
+# Keys of the facelet engine, indexed by sticker byte
+_BYTE_KEYS = [
+    {face.encode("ascii")[0]: key for face, key in keys.items()}
+    for keys in STICKER_KEYS
+]
+
+# Corner slots, edge slots and facelets each move changes
+MOVE_CORNER_SLOTS = {
+    name: [i for i in range(8) if move.cp[i] != i or move.co[i]]
+    for name, move in MOVE_TABLE.items()
+}
+MOVE_EDGE_SLOTS = {
+    name: [i for i in range(12) if move.ep[i] != i or move.eo[i]]
+    for name, move in MOVE_TABLE.items()
+}
+MOVE_FACELETS = {
+    name: [i for i, j in enumerate(perm) if i != j]
+    for name, perm in FACELET_PERMUTATIONS.items()
+}
+
+
+def state_hash(state) -> int:
+    """Return the 64-bit hash of a ``CubieCube`` or ``FaceletCube``."""
+    if isinstance(state, FaceletCube):
+        key = 0
+        for keys, sticker in zip(_BYTE_KEYS, state.facelets):
+            key ^= keys[sticker]
+        return key
+
+    key = CENTER_KEY
+    for slot, (cubie, ori) in enumerate(zip(state.cp, state.co)):
+        key ^= CORNER_KEYS[slot][cubie * 3 + ori]
+    for slot, (cubie, ori) in enumerate(zip(state.ep, state.eo)):
+        key ^= EDGE_KEYS[slot][cubie * 2 + ori]
+    return key
+
+
+def move_hash(state, move: str) -> int:
+    """
+    Return the XOR of the keys of the pieces ``move`` turns.
+
+    ``state_hash`` after the move is the hash before it XOR this value taken
+    before the move XOR this value taken after it.
+    """
+    if type(state) is CubieCube:
+        cp, co, ep, eo = state.cp, state.co, state.ep, state.eo
+        key = 0
+        for slot in MOVE_CORNER_SLOTS[move]:
+            key ^= CORNER_KEYS[slot][cp[slot] * 3 + co[slot]]
+        for slot in MOVE_EDGE_SLOTS[move]:
+            key ^= EDGE_KEYS[slot][ep[slot] * 2 + eo[slot]]
+        return key
+
+    facelets = state.facelets
+    key = 0
+    for index in MOVE_FACELETS[move]:
+        key ^= _BYTE_KEYS[index][facelets[index]]
+    return key
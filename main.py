@@ -1,12 +1,98 @@
 # main.py
 
-"""Entry point to run the Rubik's Cube solver."""
+"""
+Entry point to run the Rubik's Cube solver.
+
+Without arguments the visualizer opens. ``python main.py solve [FILE]`` solves
+scrambles or facelet strings read line by line from FILE (default: stdin) and
+writes one solution per line to stdout, with a summary on stderr.
+"""
+
+import argparse
+import sys
 
 from core.cube import RubiksCube
 from core.scramble import Scrambler
-from visualizer.UI import display_cube
+from solver.kociemba import BACKENDS
+from solver.stream import FORMATS, StreamStats, solve_stream, write_record
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    commands = parser.add_subparsers(dest="command")
+
+    solve = commands.add_parser(
+        "solve", help="solve scrambles or facelet strings line by line"
+    )
+    solve.add_argument(
+        "input", nargs="?", default="-", help="input file (default: stdin)"
+    )
+    solve.add_argument(
+        "--format", choices=FORMATS, default="plain", help="input and output format"
+    )
+    solve.add_argument(
+        "--workers", type=int, default=1, help="solver processes (default: 1)"
+    )
+    solve.add_argument(
+        "--chunksize", type=int, default=16, help="lines sent to a worker at a time"
+    )
+    solve.add_argument(
+        "--unordered",
+        action="store_true",
+        help="write each solution as soon as it is ready",
+    )
+    solve.add_argument("--backend", choices=list(BACKENDS), default="kociemba")
+    solve.add_argument(
+        "--quiet", action="store_true", help="do not print the summary to stderr"
+    )
+    return parser
+
+
+def parse_args(argv=None):
+    return build_parser().parse_args(argv)
+
+
+def run_solve(args, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr) -> int:
+    """Run the ``solve`` command; return 1 if any line failed, else 0."""
+    stats = StreamStats()
+    if args.input == "-":
+        _solve_lines(args, stdin, stdout, stats)
+    else:
+        try:
+            with open(args.input, encoding="utf-8") as lines:
+                _solve_lines(args, lines, stdout, stats)
+        except OSError as error:
+            if error.filename != args.input:
+                raise  # e.g. a closed stdout, not the input file
+            build_parser().error(f"cannot read {args.input!r}: {error.strerror}")
+    if not args.quiet:
+        print(stats.summary(), file=stderr)
+    return 1 if stats.failed else 0
+
+
+def _solve_lines(args, lines, stdout, stats: StreamStats):
+    records = solve_stream(
+        lines,
+        fmt=args.format,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        ordered=not args.unordered,
+        backend=args.backend,
+        stats=stats,
+    )
+    for record in records:
+        write_record(record, stdout, args.format)
+
 
 if __name__ == "__main__":
+    args = parse_args()
+    if args.command == "solve":
+        sys.exit(run_solve(args))
+
+    # Imported here: the visualizer opens a window on import, which the
+    # solver's worker processes (that re-import this module) must not do
+    from visualizer.UI import display_cube
+
     scrambler = Scrambler()
     cube = RubiksCube()
 
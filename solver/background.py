@@ -0,0 +1,105 @@
+# solver/background.py
+
+"""Solve a cube in a worker process without blocking the caller."""
+
+import multiprocessing
+import threading
+import time
+
+from core.cube import RubiksCube
+from solver.kociemba import BACKENDS, Kociemba_Solver
+from solver.parallel import SolveResult, solve_one
+
+
+class BackgroundSolver:
+    """
+    Runs one solve at a time in a separate process.
+
+    ``start`` returns immediately; call ``poll`` (e.g. once per frame) to pick
+    up the result. A solve that is cancelled or exceeds ``timeout`` seconds
+    has its worker process terminated, so a hung solver never blocks the
+    caller; the terminated pool is reaped in a background thread (or by
+    ``close``). Results go through the backend's cache in
+    ``Kociemba_Solver.caches``.
+    """
+
+    def __init__(self, backend: str = "kociemba", timeout: float | None = 10.0):
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown backend {backend!r}, must be one of {list(BACKENDS)}."
+            )
+        self.backend = backend
+        self.timeout = timeout
+        self._pool = None
+        self._job = None
+        self._ready = None  # result available without a worker (cache hit)
+        self._cube_string = None
+        self._started = 0.0
+        self._reapers = []  # threads shutting down cancelled pools
+
+    @property
+    def busy(self) -> bool:
+        """True while a solve is running in the worker."""
+        return self._job is not None
+
+    def start(self, cube: RubiksCube):
+        """Start solving ``cube``, cancelling any solve still running."""
+        self.cancel()
+        cube_string = cube.toString()
+        cache = Kociemba_Solver.caches.get(self.backend)
+        solution = cache.get(cube_string) if cache is not None else None
+        if solution is not None:
+            self._ready = SolveResult(0, cube_string, solution, None)
+            return
+
+        if self._pool is None:
+            # spawn: never fork a process that has a display open
+            self._pool = multiprocessing.get_context("spawn").Pool(1)
+        self._cube_string = cube_string
+        self._started = time.monotonic()
+        self._job = self._pool.apply_async(solve_one, (cube_string, self.backend))
+
+    def poll(self) -> SolveResult | None:
+        """Return the finished result once (None while running or idle)."""
+        if self._ready is not None:
+            result, self._ready = self._ready, None
+            return result
+        if self._job is None:
+            return None
+
+        if self._job.ready():
+            result = self._job.get()
+            self._job = None
+            cache = Kociemba_Solver.caches.get(self.backend)
+            if result.ok and cache is not None:
+                cache.put(result.cube_string, result.solution)
+            return result
+
+        if self.timeout is not None and time.monotonic() - self._started > self.timeout:
+            cube_string = self._cube_string
+            self.cancel()
+            message = f"TimeoutError: no solution within {self.timeout} seconds"
+            return SolveResult(0, cube_string, None, message)
+        return None
+
+    def cancel(self):
+        """Stop the running solve (if any) without waiting for its worker to exit."""
+        self._ready = None
+        if self._job is not None:
+            self._job = None
+            pool, self._pool = self._pool, None
+            # Pool.terminate joins the workers, so it runs off the caller's thread
+            reaper = threading.Thread(target=pool.terminate, daemon=True)
+            reaper.start()
+            self._reapers = [t for t in self._reapers if t.is_alive()] + [reaper]
+
+    def close(self):
+        """Cancel any running solve and shut the workers down."""
+        self.cancel()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for reaper in self._reapers:
+            reaper.join()
+        self._reapers = []
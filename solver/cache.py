@@ -0,0 +1,131 @@
+# solver/cache.py
+
+"""Bounded LRU cache of solutions, keyed by facelet string."""
+
+import os
+import threading
+from collections import OrderedDict
+
+from core.symmetry import canonical, map_moves, translate_moves
+
+
+class SolutionCache:
+    """
+    Least-recently-used map of facelet string -> solution moves.
+
+    With a ``path`` every new solution is appended to that file and the file is
+    read back on construction, so the cache survives restarts. The file is
+    rewritten with only the live entries once it grows past twice ``maxsize``
+    lines.
+
+    With ``symmetric`` entries are keyed by the canonical state under the 48
+    cube symmetries (see ``core.symmetry``): a state that is a rotation or
+    mirror image of a cached one hits, and gets the cached solution with its
+    moves renamed to match.
+    """
+
+    def __init__(
+        self, maxsize: int = 4096, path: str | None = None, symmetric: bool = False
+    ):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self.maxsize = maxsize
+        self.path = path
+        self.symmetric = symmetric
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._logged = 0  # lines in the backing file
+        if path is not None and os.path.exists(path):
+            self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, cube_string: str):
+        if self.symmetric:
+            cube_string = canonical(cube_string)[0]
+        return cube_string in self._entries
+
+    def get(self, cube_string: str) -> list[str] | None:
+        """Return the cached solution, or None (counted as a miss)."""
+        symmetry = 0
+        if self.symmetric:
+            cube_string, symmetry = canonical(cube_string)
+        with self._lock:
+            solution = self._entries.get(cube_string)
+            if solution is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cube_string)
+            self.hits += 1
+        return translate_moves(solution, symmetry) if symmetry else list(solution)
+
+    def put(self, cube_string: str, solution: list[str]):
+        """Store a solution, evicting the least recently used one if full."""
+        if self.symmetric:
+            cube_string, symmetry = canonical(cube_string)
+            solution = map_moves(solution, symmetry)
+        with self._lock:
+            self._store(cube_string, tuple(solution))
+            if self.path is not None:
+                if self._logged >= 2 * self.maxsize:
+                    self._rewrite()
+                else:
+                    with open(self.path, "a", encoding="ascii") as file:
+                        file.write(_format_line(cube_string, solution))
+                    self._logged += 1
+
+    def clear(self):
+        """Drop every entry (and the backing file) and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if self.path is not None and os.path.exists(self.path):
+                os.remove(self.path)
+            self._logged = 0
+
+    def stats(self) -> dict:
+        """Return the hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    # -------- Helper Functions --------
+    def _store(self, cube_string: str, solution: tuple):
+        self._entries[cube_string] = solution
+        self._entries.move_to_end(cube_string)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(self):
+        with open(self.path, encoding="ascii") as file:
+            for line in file:
+                fields = line.split()
+                if fields and len(fields[0]) == 54:
+                    cube_string, solution = fields[0], fields[1:]
+                    if self.symmetric:
+                        # Also accepts files written without symmetry
+                        cube_string, symmetry = canonical(cube_string)
+                        solution = map_moves(solution, symmetry)
+                    self._store(cube_string, tuple(solution))
+                    self._logged += 1
+
+    def _rewrite(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="ascii") as file:
+            file.writelines(
+                _format_line(cube_string, solution)
+                for cube_string, solution in self._entries.items()
+            )
+        os.replace(temp_path, self.path)
+        self._logged = len(self._entries)
+
+
+def _format_line(cube_string: str, solution) -> str:
+    return " ".join([cube_string, *solution]) + "\n"
@@ -1,12 +1,155 @@
 # solver/kociemba.py
 
+import multiprocessing
+import os
+import threading
+import time
+from typing import ClassVar
+
 import kociemba
 from core.cube import RubiksCube
+from core.symmetry import orientation_variants, variant_moves
+from core.validate import check
+from solver import optimal, twophase
+from solver.cache import SolutionCache
+
+# Solver backends: (facelet string, timeout=...) -> list of moves; the kociemba
+# package has no time limit, so it ignores the timeout
+BACKENDS = {
+    "kociemba": lambda cube_string, timeout=None: kociemba.solve(cube_string).split(),
+    "twophase": twophase.solve,
+    "optimal": optimal.solve,
+}
 
 
 class Kociemba_Solver:
-    def __init__(self, cube: RubiksCube):
+    # Solutions shared by every solver, one cache per backend (their answers
+    # differ); replace an entry to resize it, add a backing file or key it up
+    # to rotation and mirroring (symmetric=True), or set it to None to disable
+    # caching
+    caches: ClassVar[dict[str, SolutionCache | None]] = {
+        backend: SolutionCache(maxsize=4096) for backend in BACKENDS
+    }
+
+    def __init__(self, cube: RubiksCube, backend: str = "kociemba"):
+        """
+        :param cube: The cube to solve
+        :param backend: "kociemba" uses the kociemba package, "twophase" the
+            in-project solver of solver/twophase.py, "optimal" the shortest
+            solutions of solver/optimal.py (short scrambles only)
+        """
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown backend {backend!r}, must be one of {list(BACKENDS)}."
+            )
         self.cube_string = cube.toString()
+        self.backend = backend
+
+    @property
+    def cache(self) -> SolutionCache | None:
+        """The cache of this solver's backend (None if caching is disabled)."""
+        return self.caches.get(self.backend)
 
     def get_solution(self):
-        return kociemba.solve(self.cube_string).split()
+        cache = self.cache
+        if cache is not None:
+            solution = cache.get(self.cube_string)
+            if solution is not None:
+                return solution
+
+        check(self.cube_string)  # fail fast, with the reason, before solving
+        solution = BACKENDS[self.backend](self.cube_string)
+        if cache is not None:
+            cache.put(self.cube_string, solution)
+        return solution
+
+    def get_shortest_solution(
+        self, timeout: float = 10.0, workers: int | None = None
+    ) -> list[str]:
+        """
+        Solve the cube seen along each of its three axes and as the inverse of
+        each (``core.symmetry.orientation_variants``), six searches at once,
+        and return the shortest solution.
+
+        :param timeout: Wall-clock budget in seconds for the whole call; each
+            search gets what is left of it when it starts, searches that fail
+            or finish too late are ignored
+        :param workers: Processes of the shared pool (default: one per
+            search, at most one per core); 1 runs the searches one after
+            another in this process
+        :raises ValueError: if the cube is not solvable
+        :raises TimeoutError: if no search finished within ``timeout``
+        """
+        deadline = time.monotonic() + timeout
+        check(self.cube_string)
+        variants = orientation_variants(self.cube_string)
+        workers = workers or min(len(variants), os.cpu_count() or 1)
+        jobs = [
+            (i, facelets, self.backend, deadline)
+            for i, (facelets, _, _) in enumerate(variants)
+        ]
+
+        if workers == 1:
+            results = [_solve_variant(job) for job in jobs]
+        else:
+            results = []
+            pending = _get_pool(min(workers, len(jobs))).imap_unordered(
+                _solve_variant, jobs
+            )
+            for _ in jobs:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    results.append(pending.next(remaining))
+                except multiprocessing.TimeoutError:
+                    break
+
+        # A variant that failed (e.g. timed out in its backend) is skipped
+        solutions = [(i, moves) for i, moves in results if moves is not None]
+        if not solutions:
+            raise TimeoutError(f"No solution found within {timeout} seconds.")
+        best = min(
+            (variant_moves(moves, *variants[i][1:]) for i, moves in solutions),
+            key=len,
+        )
+        cache = self.cache
+        if cache is not None:
+            cache.put(self.cube_string, best)
+        return best
+
+
+# Pool of get_shortest_solution, kept between calls (see ``_get_pool``)
+_pool = None
+_pool_size = 0
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(size: int):
+    """Return the shared pool of ``size`` processes, starting it on first use."""
+    global _pool, _pool_size, _pool_pid
+    with _pool_lock:
+        # A forked child inherits the parent's pool object but not its workers
+        if _pool is None or _pool_size != size or _pool_pid != os.getpid():
+            if _pool is not None and _pool_pid == os.getpid():
+                _pool.terminate()
+            _pool = multiprocessing.Pool(size)
+            _pool_size, _pool_pid = size, os.getpid()
+        return _pool
+
+
+def _solve_variant(job: tuple) -> tuple[int, list[str] | None]:
+    """
+    Solve one ``(index, facelets, backend, deadline)`` job (in a pool worker)
+    with the time left until ``deadline`` (``time.monotonic()``); the moves
+    are None if the backend failed or no time was left.
+    """
+    index, facelets, backend, deadline = job
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return index, None
+    try:
+        return index, BACKENDS[backend](facelets, timeout=remaining)
+    except (ValueError, TimeoutError):
+        return index, None
@@ -0,0 +1,632 @@
+# solver/optimal.py
+
+"""
+Optimal solver: IDA* over Korf-style pattern databases.
+
+Three pattern databases give a lower bound on the moves a state still needs:
+
+- ``corners``: the position and twist of the eight corners (8! * 3^7 entries)
+- ``edges_low``: the positions and flips of the edges UR, UF, UL, UB, DR, DF
+- ``edges_high``: the same for DL, DB, FR, FL, BL, BR (12!/6! * 2^6 entries
+  each)
+
+The largest of the three never overestimates, so the first solution IDA*
+finds is a shortest one. Each database is filled by a breadth-first search
+from the solved state spread over worker processes, then stored with 4 bits
+per entry, together with the move tables, in one versioned file that later
+runs memory-map. ``max_depth`` caps that search: entries it does not reach
+hold ``max_depth + 1``, which is still a lower bound, so a capped database
+finds the same solutions with more search.
+
+The search runs in Python: states up to about a dozen moves from solved take
+seconds, deep random states are out of reach. ``workers`` spreads the
+subtrees of each iteration over processes.
+"""
+
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import permutations
+from multiprocessing import Event
+from typing import NamedTuple
+
+import numpy as np
+
+from core.coords import N_CORNERS, N_TWIST, get_corners, get_twist
+from core.cubie import MOVE_TABLE, MOVES, CubieCube
+from core.validate import check
+from solver.tablefile import read_sections, write_sections
+from solver.tables import DEFAULT_TABLE_PATH, N_MOVES
+from solver.twophase import NEXT_MOVES, get_tables
+
+# Bump whenever the layout or meaning of the file changes
+VERSION = 1
+MAGIC = b"RBXOPTDB"
+
+DEFAULT_DATABASE_PATH = os.path.join(
+    os.path.dirname(DEFAULT_TABLE_PATH), f"optimal_v{VERSION}.bin"
+)
+
+# Seconds a search may run by default: enough for about 13 moves from solved
+DEFAULT_TIMEOUT = 60.0
+
+# Deepest breadth-first level; every database is complete by then (corners
+# end at 11 moves, six edges at 10) and ``MAX_DEPTH + 1`` still fits 4 bits
+MAX_DEPTH = 14
+
+LOW_EDGES = (0, 1, 2, 3, 4, 5)
+HIGH_EDGES = (6, 7, 8, 9, 10, 11)
+
+# fmt: off
+N_EDGE_SLOTS   = 12 * 11 * 10 * 9 * 8 * 7  # slots of six given edges, in order
+N_EDGE_SUBSET  = N_EDGE_SLOTS * 2**6       # ... and their flips
+# fmt: on
+
+# Section name -> array typecode (move tables are flattened as coordinate * 18
+# + move; databases hold two 4-bit entries per byte, the even one low)
+# fmt: off
+SECTION_TYPES = {
+    "corners_move": "H",
+    "twist_move":   "H",
+    "edge_move":    "I",
+    "corners":      "B",
+    "edges_low":    "B",
+    "edges_high":   "B",
+}
+# fmt: on
+DATABASES = ("corners", "edges_low", "edges_high")
+
+# Breadth-first entries not reached yet
+_UNKNOWN = 0xFF
+# Entries handed to a breadth-first worker at a time
+_BLOCK = 1 << 21
+# Plies expanded by the caller before subtrees go to the search workers
+_SPLIT_DEPTH = 2
+
+
+def edge_subset_index(cube: CubieCube, edges: tuple) -> int:
+    """
+    Coordinate of six edges of a cube: the rank of their slots (in the order
+    of ``edges``) times 64, plus their flips (bit ``i`` for ``edges[i]``).
+    """
+    slots = [cube.ep.index(edge) for edge in edges]
+    rank = 0
+    for i, slot in enumerate(slots):
+        rank = rank * (12 - i) + slot - sum(s < slot for s in slots[:i])
+    flips = sum(cube.eo[slot] << i for i, slot in enumerate(slots))
+    return rank * 64 + flips
+
+
+def coordinates(cube: CubieCube) -> tuple[int, int, int, int]:
+    """Return the ``(corners, twist, edges_low, edges_high)`` coordinates."""
+    return (
+        get_corners(cube),
+        get_twist(cube),
+        edge_subset_index(cube, LOW_EDGES),
+        edge_subset_index(cube, HIGH_EDGES),
+    )
+
+
+# Database -> (entries, index of the solved state)
+DATABASE_SIZES = {
+    "corners": (N_CORNERS * N_TWIST, 0),
+    "edges_low": (N_EDGE_SUBSET, edge_subset_index(CubieCube(), LOW_EDGES)),
+    "edges_high": (N_EDGE_SUBSET, edge_subset_index(CubieCube(), HIGH_EDGES)),
+}
+
+
+class PatternDatabases:
+    """Read-only view of the tables and databases, one flat ``memoryview`` each."""
+
+    def __init__(self, sections: dict, max_depth: int, path=None, buffer=None):
+        self._buffer = buffer  # keeps the memory map alive
+        self.path = path
+        self.max_depth = max_depth
+        for name in SECTION_TYPES:
+            setattr(self, name, sections[name])
+
+    def distance(self, corners: int, twist: int, low: int, high: int) -> int:
+        """Lower bound on the moves needed from the given coordinates."""
+        return max(
+            _entry(self.corners, corners * N_TWIST + twist),
+            _entry(self.edges_low, low),
+            _entry(self.edges_high, high),
+        )
+
+    def close(self):
+        """Release the memory map backing the tables."""
+        for name in SECTION_TYPES:
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                view.release()
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+
+def _entry(database, index: int) -> int:
+    return (database[index >> 1] >> ((index & 1) << 2)) & 15
+
+
+# -------- Search --------
+class DepthStats(NamedTuple):
+    """Work done by one IDA* iteration."""
+
+    depth: int  # solution length tried
+    nodes: int  # states generated
+    seconds: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+
+class SearchResult(NamedTuple):
+    """A shortest solution and the work it took."""
+
+    moves: list[str]
+    depths: list[DepthStats]  # one per iteration, the last found the solution
+
+    @property
+    def nodes(self) -> int:
+        return sum(stats.nodes for stats in self.depths)
+
+    @property
+    def seconds(self) -> float:
+        return sum(stats.seconds for stats in self.depths)
+
+    @property
+    def nodes_per_second(self) -> float:
+        seconds = self.seconds
+        return self.nodes / seconds if seconds > 0 else 0.0
+
+
+class _Stop(Exception):
+    """Raised inside the search to unwind once it is cancelled or out of time."""
+
+
+class _Search:
+    """Depth-first search below one state, within a bound on the moves left."""
+
+    def __init__(self, databases: PatternDatabases, stop=None):
+        self.databases = databases
+        self.stop = stop  # multiprocessing.Event shared by the workers, if any
+        self.deadline = None
+        self.nodes = 0
+        self.path = []
+
+    def children(self, state: tuple, togo: int, last: int):
+        """Yield ``(move, child)`` for the children that may lie on a solution."""
+        db = self.databases
+        corners, twist, low, high = state
+        for m in NEXT_MOVES[last]:
+            child = (
+                db.corners_move[corners * N_MOVES + m],
+                db.twist_move[twist * N_MOVES + m],
+                db.edge_move[(low >> 6) * N_MOVES + m] ^ (low & 63),
+                db.edge_move[(high >> 6) * N_MOVES + m] ^ (high & 63),
+            )
+            self.nodes += 1
+            if db.distance(*child) < togo:
+                yield m, child
+
+    def run(self, state: tuple, togo: int, last: int) -> bool:
+        """
+        Look for a solution of exactly ``togo`` moves; on success ``path``
+        holds its move indices.
+
+        :raises _Stop: once the deadline passes or the stop event is set
+        """
+        self.path = []
+        if togo == 0:
+            return self.databases.distance(*state) == 0
+        return self._search(*state, togo, last)
+
+    def _search(self, corners, twist, low, high, togo, last) -> bool:
+        if togo > 3:
+            if self.deadline is not None and time.monotonic() > self.deadline:
+                raise _Stop
+            if self.stop is not None and self.stop.is_set():
+                raise _Stop
+
+        db = self.databases
+        corners_move, twist_move, edge_move = (
+            db.corners_move,
+            db.twist_move,
+            db.edge_move,
+        )
+        corners_db, low_db, high_db = db.corners, db.edges_low, db.edges_high
+        path = self.path
+        togo -= 1
+        moves = NEXT_MOVES[last]
+        self.nodes += len(moves)
+        for m in moves:
+            c = corners_move[corners * N_MOVES + m]
+            t = twist_move[twist * N_MOVES + m]
+            i = c * N_TWIST + t
+            if (corners_db[i >> 1] >> ((i & 1) << 2)) & 15 > togo:
+                continue
+            lo = edge_move[(low >> 6) * N_MOVES + m] ^ (low & 63)
+            if (low_db[lo >> 1] >> ((lo & 1) << 2)) & 15 > togo:
+                continue
+            hi = edge_move[(high >> 6) * N_MOVES + m] ^ (high & 63)
+            if (high_db[hi >> 1] >> ((hi & 1) << 2)) & 15 > togo:
+                continue
+            # Only the solved state is at distance 0 in every database
+            if togo == 0 or self._search(c, t, lo, hi, togo, m):
+                path.insert(0, m)
+                return True
+        return False
+
+
+class OptimalSolver:
+    """Find shortest solutions with IDA* over memory-mapped pattern databases."""
+
+    def __init__(self, databases: PatternDatabases | None = None, workers: int = 1):
+        """
+        :param databases: Defaults to the process-wide ``get_databases()``
+        :param workers: Processes searching each iteration; 1 searches in the
+            calling process
+        """
+        if workers < 1:
+            raise ValueError("Workers must be at least 1.")
+        self.databases = databases if databases is not None else get_databases()
+        if workers > 1 and self.databases.path is None:
+            raise ValueError("Worker processes need databases read from a file.")
+        self.workers = workers
+
+    def solve(
+        self,
+        facelets: str,
+        max_length: int = 20,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> list[str]:
+        """Return a shortest solution (list of moves) of a facelet string."""
+        return self.search(facelets, max_length, timeout).moves
+
+    def search(
+        self,
+        facelets: str,
+        max_length: int = 20,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        on_depth: Callable[[DepthStats], None] | None = None,
+    ) -> SearchResult:
+        """
+        Find a shortest solution of a facelet string, with per-iteration stats.
+
+        :param max_length: Longest solution to look for (20 covers every cube)
+        :param timeout: Seconds before giving up, or None to search until done
+            (deep states can take hours)
+        :param on_depth: Called with the ``DepthStats`` of every iteration as
+            it finishes, e.g. to print progress
+        :raises ValueError: if the state is not a solvable cube, or needs more
+            than ``max_length`` moves
+        :raises TimeoutError: if the search did not finish in time
+        """
+        check(facelets)
+        state = coordinates(CubieCube.from_facelet_string(facelets))
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        depths = []
+        executor = stop = None
+        if self.workers > 1:
+            stop = Event()
+            executor = ProcessPoolExecutor(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.databases.path, stop),
+            )
+        try:
+            start = self.databases.distance(*state)
+            for depth in range(start, max_length + 1):
+                began = time.monotonic()
+                if executor is None or depth <= _SPLIT_DEPTH:
+                    solution, nodes = _search_subtree(
+                        _Search(self.databases), state, depth, N_MOVES, deadline
+                    )
+                else:
+                    solution, nodes = self._search_parallel(
+                        state, depth, deadline, executor, stop
+                    )
+                stats = DepthStats(depth, nodes, time.monotonic() - began)
+                depths.append(stats)
+                if on_depth is not None:
+                    on_depth(stats)
+                if solution is not None:
+                    return SearchResult([MOVES[m] for m in solution], depths)
+        except _Stop:
+            raise TimeoutError(f"No solution found within {timeout} seconds.") from None
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        raise ValueError(f"No solution of at most {max_length} moves.")
+
+    def _search_parallel(self, state, depth, deadline, executor, stop):
+        """Search one iteration with the subtrees ``_SPLIT_DEPTH`` plies down."""
+        search = _Search(self.databases)
+        nodes = [(state, N_MOVES, [])]
+        for ply in range(_SPLIT_DEPTH):
+            nodes = [
+                (child, m, prefix + [m])
+                for node, last, prefix in nodes
+                for m, child in search.children(node, depth - ply, last)
+            ]
+
+        stop.clear()
+        togo = depth - _SPLIT_DEPTH
+        pending = {
+            executor.submit(_search_task, node, togo, last, deadline): prefix
+            for node, last, prefix in nodes
+        }
+        total, solution, stopped = search.nodes, None, False
+        try:
+            while pending and solution is None and not stopped:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    prefix = pending.pop(future)
+                    found, count, stopped = future.result()
+                    total += count
+                    if found is not None:
+                        solution = prefix + found
+                        break
+        finally:
+            # Any solution of this iteration is a shortest one; drop the rest
+            stop.set()
+            for future in pending:
+                future.cancel()
+        if stopped and solution is None:
+            raise _Stop
+        return solution, total
+
+
+def _search_subtree(search: _Search, state, togo: int, last: int, deadline):
+    """Return ``(solution or None, nodes)`` for one subtree."""
+    search.deadline = deadline
+    found = search.run(state, togo, last)
+    return (search.path if found else None), search.nodes
+
+
+# Search of the worker process (see ``_init_worker``)
+_worker = None
+
+
+def _init_worker(path: str, stop):
+    global _worker
+    _worker = _Search(read_databases(path), stop)
+
+
+def _search_task(state, togo: int, last: int, deadline):
+    """Search one subtree in a worker: ``(solution or None, nodes, stopped)``."""
+    _worker.nodes = 0
+    try:
+        found, nodes = _search_subtree(_worker, state, togo, last, deadline)
+        return found, nodes, False
+    except _Stop:
+        return None, _worker.nodes, True
+
+
+# -------- Generation --------
+def _rank_slots(slots: np.ndarray) -> np.ndarray:
+    """Rank of every row of six distinct slots (lexicographic order)."""
+    rank = np.zeros(len(slots), dtype=np.int64)
+    for i in range(slots.shape[1]):
+        smaller = (slots[:, :i] < slots[:, i : i + 1]).sum(axis=1)
+        rank = rank * (12 - i) + slots[:, i] - smaller
+    return rank
+
+
+def _edge_move_table() -> np.ndarray:
+    """
+    Move table of the six-edge coordinate: ``slots_rank * 64`` of the result
+    plus the flips the move adds, so ``table[index >> 6, m] ^ (index & 63)``
+    is the moved coordinate.
+    """
+    # itertools yields the slot tuples in rank order
+    slots = np.array(list(permutations(range(12), 6)), dtype=np.int64)
+    table = np.empty((N_EDGE_SLOTS, N_MOVES), dtype=np.uint32)
+    bits = 1 << np.arange(6)
+    for m, move in enumerate(MOVES):
+        cube = MOVE_TABLE[move]
+        # The edge in slot ``cube.ep[q]`` goes to slot q
+        moved = np.argsort(cube.ep)[slots]
+        flips = (np.array(cube.eo)[moved] * bits).sum(axis=1)
+        table[:, m] = _rank_slots(moved) * 64 + flips
+    return table
+
+
+def generate_databases(
+    max_depth: int = MAX_DEPTH,
+    workers: int | None = None,
+    directory: str | None = None,
+) -> dict:
+    """
+    Build the move tables and the packed databases as NumPy arrays.
+
+    The full databases take minutes on one core and about 250 MB of scratch
+    files, written to ``directory`` (default: the system temporary one).
+
+    :param max_depth: Last breadth-first level (1..14); see the module docs
+    :param workers: Processes for the breadth-first search (default: every
+        core)
+    """
+    if not 1 <= max_depth <= MAX_DEPTH:
+        raise ValueError(f"Depth cap must be between 1 and {MAX_DEPTH}.")
+    workers = workers or os.cpu_count() or 1
+    tables = get_tables()
+    sections = {
+        "corners_move": np.frombuffer(tables.corners_move, dtype=np.uint16),
+        "twist_move": np.frombuffer(tables.twist_move, dtype=np.uint16),
+        "edge_move": _edge_move_table().ravel(),
+    }
+
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        for name in ("corners_move", "twist_move", "edge_move"):
+            np.save(os.path.join(scratch, name + ".npy"), sections[name])
+        executor = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(workers)
+        try:
+            for name in DATABASES:
+                depths = _breadth_first(name, scratch, max_depth, executor)
+                sections[name] = depths[0::2] | depths[1::2] << 4
+                del depths
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            _bfs_maps.clear()  # release the scratch files before they go
+    return sections
+
+
+def _breadth_first(name: str, scratch: str, max_depth: int, executor) -> np.ndarray:
+    """Distances to solved of every entry of a database, one byte each."""
+    size, solved = DATABASE_SIZES[name]
+    depths = np.memmap(
+        os.path.join(scratch, name + ".u8"), dtype=np.uint8, mode="w+", shape=(size,)
+    )
+    depths[:] = _UNKNOWN
+    depths[solved] = 0
+    depths.flush()
+
+    blocks = [(start, min(start + _BLOCK, size)) for start in range(0, size, _BLOCK)]
+    frontier, known, depth = 1, 1, 0
+    while frontier and depth < max_depth:
+        # Push from a small frontier; pull into the few states left unknown
+        pull = frontier > size - known
+        jobs = [(scratch, name, start, stop, depth, pull) for start, stop in blocks]
+        if executor is None:
+            results = (_expand(*job) for job in jobs)
+        else:
+            results = executor.map(_expand, *zip(*jobs))
+        for reached in results:
+            if reached is not None:
+                depths[reached] = depth + 1
+        depth += 1
+        frontier = int(np.count_nonzero(depths == depth))
+        known += frontier
+
+    depths[depths == _UNKNOWN] = max_depth + 1
+    return np.array(depths)
+
+
+# Memory maps of the breadth-first workers, by scratch file path
+_bfs_maps = {}
+
+
+def _scratch_map(scratch: str, name: str, shape=None) -> np.ndarray:
+    path = os.path.join(scratch, name)
+    if path not in _bfs_maps:
+        if shape is None:
+            _bfs_maps[path] = np.load(path, mmap_mode="r")
+        else:
+            _bfs_maps[path] = np.memmap(path, dtype=np.uint8, mode="r+", shape=shape)
+    return _bfs_maps[path]
+
+
+def _neighbours(scratch: str, name: str, indices: np.ndarray, m: int) -> np.ndarray:
+    if name == "corners":
+        corners_move = _scratch_map(scratch, "corners_move.npy")
+        twist_move = _scratch_map(scratch, "twist_move.npy")
+        corners, twist = np.divmod(indices, N_TWIST)
+        return (
+            corners_move[corners * N_MOVES + m].astype(np.int64) * N_TWIST
+            + twist_move[twist * N_MOVES + m]
+        )
+    edge_move = _scratch_map(scratch, "edge_move.npy")
+    return edge_move[(indices >> 6) * N_MOVES + m].astype(np.int64) ^ (indices & 63)
+
+
+def _expand(scratch: str, name: str, start: int, stop: int, depth: int, pull: bool):
+    """
+    Expand one block of a breadth-first level.
+
+    Pushing returns the unknown neighbours of the block's states at ``depth``,
+    for the caller to mark. Pulling marks the block's unknown states that have
+    a neighbour at ``depth`` in place and returns None; blocks never share
+    entries, and a neighbour being marked by another block reads ``depth + 1``,
+    never ``depth``, so workers can do that at the same time.
+    """
+    depths = _scratch_map(scratch, name + ".u8", (DATABASE_SIZES[name][0],))
+    block = depths[start:stop]
+    if pull:
+        todo = start + np.flatnonzero(block == _UNKNOWN)
+        for m in range(N_MOVES):
+            if not len(todo):
+                break
+            hit = depths[_neighbours(scratch, name, todo, m)] == depth
+            depths[todo[hit]] = depth + 1
+            todo = todo[~hit]
+        return None
+
+    frontier = start + np.flatnonzero(block == depth)
+    reached = [
+        neighbours[depths[neighbours] == _UNKNOWN]
+        for neighbours in (
+            _neighbours(scratch, name, frontier, m) for m in range(N_MOVES)
+        )
+    ]
+    return np.unique(np.concatenate(reached))
+
+
+# -------- Persistence --------
+def write_databases(sections: dict, path: str, max_depth: int):
+    """Write the tables and databases to ``path`` atomically."""
+    write_sections(path, MAGIC, VERSION, sections, SECTION_TYPES, bytes([max_depth]))
+
+
+def read_databases(path: str) -> PatternDatabases:
+    """
+    Memory-map a file written by ``write_databases``.
+
+    :raises ValueError: if the file is not a complete database file of this
+        version
+    """
+    sections, metadata, buffer = read_sections(
+        path, MAGIC, VERSION, SECTION_TYPES, metadata_size=1
+    )
+    return PatternDatabases(sections, metadata[0], path, buffer)
+
+
+def load_databases(
+    path: str = DEFAULT_DATABASE_PATH,
+    max_depth: int = MAX_DEPTH,
+    workers: int | None = None,
+) -> PatternDatabases:
+    """
+    Memory-map the database file, generating and saving it first if needed.
+
+    Generating the default file takes a few minutes and writes about 130 MB
+    (plus about 250 MB of scratch files next to it); call this once ahead
+    of time to keep that out of the first solve. ``max_depth`` and
+    ``workers`` only apply to generation; an existing file is used whatever
+    its cap.
+    """
+    try:
+        return read_databases(path)
+    except (FileNotFoundError, ValueError):
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        sections = generate_databases(max_depth, workers, directory)
+        write_databases(sections, path, max_depth)
+        return read_databases(path)
+
+
+_databases = None
+
+
+def get_databases(path: str = DEFAULT_DATABASE_PATH) -> PatternDatabases:
+    """Return the process-wide databases, loading (or generating) them on first use."""
+    global _databases
+    if _databases is None:
+        _databases = load_databases(path)
+    return _databases
+
+
+def solve(
+    facelets: str,
+    max_length: int = 20,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> list[str]:
+    """Solve a facelet string optimally with the shared databases (see ``OptimalSolver``)."""
+    return OptimalSolver().solve(facelets, max_length, timeout)
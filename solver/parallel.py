@@ -0,0 +1,112 @@
+# solver/parallel.py
+
+"""Solve many cube states across a pool of worker processes."""
+
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import NamedTuple
+
+from core.cube import RubiksCube
+from core.validate import check
+from solver.kociemba import BACKENDS
+
+
+class SolveResult(NamedTuple):
+    """Outcome of solving one state; exactly one of solution/error is set."""
+
+    index: int  # position of the state in the input
+    cube_string: str
+    solution: list[str] | None
+    error: str | None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def solve_one(
+    cube_string: str, backend: str = "kociemba", index: int = 0
+) -> SolveResult:
+    """Solve one facelet string, returning a failure as a result instead of raising."""
+    try:
+        check(cube_string)
+        return SolveResult(index, cube_string, BACKENDS[backend](cube_string), None)
+    except Exception as error:  # report the failure, keep the batch going
+        return SolveResult(index, cube_string, None, f"{type(error).__name__}: {error}")
+
+
+def _solve_chunk(chunk: list[tuple[int, str]], backend: str) -> list[SolveResult]:
+    """Solve a list of (index, cube_string) pairs."""
+    return [solve_one(cube_string, backend, index) for index, cube_string in chunk]
+
+
+def _chunks(states: Iterable[RubiksCube | str], chunksize: int):
+    """Yield lists of (index, cube_string) pairs without reading ahead."""
+    items = (
+        (index, state.toString() if isinstance(state, RubiksCube) else state)
+        for index, state in enumerate(states)
+    )
+    while True:
+        chunk = list(islice(items, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_many(
+    states: Iterable[RubiksCube | str],
+    workers: int | None = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+    backend: str = "kociemba",
+) -> Iterator[SolveResult]:
+    """
+    Solve cubes or facelet strings in parallel, yielding one ``SolveResult`` each.
+
+    :param states: Any iterable; it is consumed lazily, at most a few chunks
+        per worker ahead of the results
+    :param workers: Number of processes (default: every core); 1 solves in the
+        calling process
+    :param chunksize: States sent to a worker at a time
+    :param ordered: Yield in input order, or as soon as each chunk finishes
+    :param backend: Solver backend name, as in ``Kociemba_Solver``
+    """
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {backend!r}, must be one of {list(BACKENDS)}."
+        )
+    if chunksize < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    workers = workers or os.cpu_count() or 1
+    return _solve_chunks(_chunks(states, chunksize), workers, ordered, backend)
+
+
+def _solve_chunks(chunks, workers: int, ordered: bool, backend: str):
+    """Solve the chunks, keeping at most four per worker in flight."""
+    if workers == 1:
+        for chunk in chunks:
+            yield from _solve_chunk(chunk, backend)
+        return
+
+    max_pending = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in islice(chunks, max_pending):
+            pending.append(executor.submit(_solve_chunk, chunk, backend))
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [future for future in pending if future in finished]
+                for future in done:
+                    pending.remove(future)
+
+            for future in done:
+                yield from future.result()
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(_solve_chunk, chunk, backend))
@@ -0,0 +1,78 @@
+# solver/random_state.py
+
+"""Random-state scrambles: solve a uniformly drawn state and invert the solution."""
+
+from collections.abc import Iterator
+from itertools import count as counter
+
+import numpy as np
+
+from core.algorithm import Algorithm
+from core.scramble import Scrambler, random_states
+from solver.parallel import solve_many, solve_one
+
+
+class RandomStateScrambler(Scrambler):
+    """
+    Scrambles that lead to a uniformly random state, as in WCA competitions.
+
+    A random reachable state is drawn (``core.scramble.random_states``) and
+    solved; the inverse of the solution is the scramble. Scrambles use the
+    same 18 moves, so ``apply_scramble`` works as for ``Scrambler``.
+    """
+
+    def __init__(self, seed: int | None = None, backend: str = "kociemba"):
+        """
+        :param seed: Seed of the state generator (None: fresh entropy)
+        :param backend: Solver backend name, as in ``Kociemba_Solver``
+        """
+        super().__init__()
+        self.rng = np.random.default_rng(seed)
+        self.backend = backend
+
+    def generate_scramble(self, length=None) -> list[str]:
+        """
+        Generate a random-state scramble and store it in history.
+
+        :param length: Ignored, kept for compatibility with
+            ``Scrambler.generate_scramble``; the length is that of the solution
+        """
+        state = random_states(1, self.rng)[0]
+        scramble = _scramble_from(solve_one(state.to_facelet_string(), self.backend))
+        self.history.append(scramble)
+        return scramble
+
+    def stream(
+        self,
+        count: int | None = None,
+        workers: int | None = None,
+        chunksize: int = 16,
+        ordered: bool = True,
+    ) -> Iterator[list[str]]:
+        """
+        Yield ``count`` scrambles (forever if None), solving in parallel.
+
+        States are drawn and solved a few chunks ahead of the consumer, so
+        memory stays bounded. Streamed scrambles are not stored in history.
+
+        :param workers: Solver processes, as in ``solve_many``
+        :param ordered: Keep the order of the drawn states (reproducible for
+            a given seed), or yield each scramble as soon as it is ready
+        """
+        states = (state.to_facelet_string() for state in self._states(count))
+        results = solve_many(states, workers, chunksize, ordered, self.backend)
+        return (_scramble_from(result) for result in results)
+
+    def _states(self, count: int | None, block: int = 256):
+        for start in counter(0, block):
+            if count is not None and start >= count:
+                return
+            size = block if count is None else min(block, count - start)
+            yield from random_states(size, self.rng)
+
+
+def _scramble_from(result) -> list[str]:
+    """Invert the solution of a ``SolveResult`` into a scramble."""
+    if not result.ok:
+        raise RuntimeError(f"Could not solve a random state: {result.error}")
+    return list(Algorithm(result.solution).inverse())
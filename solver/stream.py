@@ -0,0 +1,324 @@
+# solver/stream.py
+
+"""Solve a stream of scrambles or facelet strings, one input line at a time."""
+
+import json
+import random
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+from core.cube import RubiksCube
+from core.cubie import CubieCube
+from core.scramble import Scrambler
+from solver.kociemba import BACKENDS, Kociemba_Solver
+from solver.parallel import _solve_chunk
+
+FORMATS = ("plain", "jsonl")
+
+_FACELET_LETTERS = set("URFDLB")
+_MOVES = set(Scrambler.MOVES)
+
+
+class StreamRecord(NamedTuple):
+    """One solved (or failed) input line; exactly one of solution/error is set."""
+
+    line: int  # 1-based line number in the input
+    id: object  # "id" field of a JSONL input, else None
+    cube_string: str | None
+    solution: list[str] | None
+    error: str | None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class StreamStats:
+    """
+    Throughput and latency counters for a stream.
+
+    Latency is measured from reading a line to emitting its record. Percentiles
+    come from a fixed-size random sample, so memory stays bounded however long
+    the stream is.
+    """
+
+    def __init__(self, sample_size: int = 10000):
+        self.sample_size = sample_size
+        self.solved = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self.max_latency = 0.0
+        self._latencies = []
+        self._seen = 0
+
+    @property
+    def count(self) -> int:
+        return self.solved + self.failed
+
+    def add(self, record: StreamRecord, latency: float):
+        """Count one emitted record that took ``latency`` seconds."""
+        if record.ok:
+            self.solved += 1
+        else:
+            self.failed += 1
+        self.max_latency = max(self.max_latency, latency)
+
+        # Reservoir sampling: every latency is kept with equal probability
+        self._seen += 1
+        if len(self._latencies) < self.sample_size:
+            self._latencies.append(latency)
+        else:
+            slot = random.randrange(self._seen)
+            if slot < self.sample_size:
+                self._latencies[slot] = latency
+
+    def percentile(self, percent: float) -> float:
+        """Return the latency (seconds) below which ``percent`` % of records fall."""
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def summary(self) -> str:
+        """Return a one-line report, e.g. for stderr."""
+        elapsed = time.perf_counter() - self.started
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        return (
+            f"{self.solved} solved, {self.failed} failed in {elapsed:.2f} s "
+            f"({rate:.1f} cubes/s); latency ms "
+            f"p50 {self.percentile(50) * 1000:.1f} "
+            f"p95 {self.percentile(95) * 1000:.1f} "
+            f"max {self.max_latency * 1000:.1f}"
+        )
+
+
+def parse_line(text: str, fmt: str = "plain") -> tuple[object, str]:
+    """
+    Return ``(id, cube_string)`` for one input line.
+
+    A plain line is either a 54-letter facelet string or a scramble such as
+    ``"R U2 F'"``. A JSONL line is an object with a ``"facelets"`` or a
+    ``"scramble"`` field (a string or a list of moves) and an optional ``"id"``.
+
+    :raises ValueError: if the line cannot be read
+    :raises TypeError: if a JSONL line is not an object or a field is not a string
+    """
+    if fmt == "plain":
+        return None, _to_cube_string(text.strip())
+    if fmt != "jsonl":
+        raise ValueError(f"Unknown format {fmt!r}, must be one of {list(FORMATS)}.")
+
+    try:
+        item = json.loads(text)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"Invalid JSON: {error}") from None
+    if not isinstance(item, dict):
+        raise TypeError("Each JSONL line must be an object.")
+    if "facelets" in item:
+        return item.get("id"), _to_cube_string(item["facelets"], scramble=False)
+    if "scramble" in item:
+        scramble = item["scramble"]
+        if isinstance(scramble, list):
+            scramble = " ".join(scramble)
+        return item.get("id"), _to_cube_string(scramble, scramble=True)
+    raise ValueError('Expected a "facelets" or a "scramble" field.')
+
+
+def solve_stream(
+    lines: Iterable[str],
+    fmt: str = "plain",
+    workers: int = 1,
+    chunksize: int = 16,
+    ordered: bool = True,
+    backend: str = "kociemba",
+    stats: StreamStats | None = None,
+) -> Iterator[StreamRecord]:
+    """
+    Solve every non-blank input line, yielding one ``StreamRecord`` each.
+
+    Lines are read lazily, so memory does not grow with the input. Blank lines
+    and lines starting with ``#`` are skipped; a line that cannot be parsed or
+    solved yields a record with ``error`` set.
+
+    :param lines: Input lines, e.g. an open file or ``sys.stdin``
+    :param fmt: "plain" or "jsonl" (see ``parse_line``)
+    :param workers: Number of solver processes; 1 solves in the calling process
+        and shares ``Kociemba_Solver.caches``
+    :param chunksize: Lines sent to a worker at a time
+    :param ordered: Yield in input order, or as soon as each line is solved
+    :param backend: Solver backend name, as in ``Kociemba_Solver``
+    :param stats: Optional ``StreamStats`` updated with every record
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}, must be one of {list(FORMATS)}.")
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {backend!r}, must be one of {list(BACKENDS)}."
+        )
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1.")
+    if workers == 1:
+        records = _solve_inline(_read(lines, fmt), backend)
+    else:
+        records = _solve_parallel(
+            _read(lines, fmt), workers, chunksize, ordered, backend
+        )
+    return _measure(records, stats)
+
+
+def write_record(record: StreamRecord, file, fmt: str = "plain"):
+    """Write one record: the solution (or ``error: ...``) line, or a JSON object."""
+    if fmt == "jsonl":
+        item = {"line": record.line}
+        if record.id is not None:
+            item["id"] = record.id
+        item["facelets"] = record.cube_string
+        if record.ok:
+            item["solution"] = " ".join(record.solution)
+            item["length"] = len(record.solution)
+        else:
+            item["error"] = record.error
+        file.write(json.dumps(item) + "\n")
+    elif record.ok:
+        file.write(" ".join(record.solution) + "\n")
+    else:
+        file.write(f"error: {record.error}\n")
+    file.flush()
+
+
+# -------- Helper Functions --------
+class _Line(NamedTuple):
+    """A parsed input line, with the time it was read."""
+
+    line: int
+    id: object
+    cube_string: str | None
+    error: str | None
+    read_at: float
+
+
+def _to_cube_string(text: str, scramble: bool | None = None) -> str:
+    """Turn a facelet string or a scramble into a facelet string."""
+    if not isinstance(text, str):
+        raise TypeError("Expected a string.")
+    is_facelets = len(text) == 54 and set(text) <= _FACELET_LETTERS
+    if scramble is False or (scramble is None and is_facelets):
+        # Reject strings that do not describe a set of real pieces
+        return CubieCube.from_facelet_string(text).to_facelet_string()
+
+    moves = text.split()
+    for move in moves:
+        if move not in _MOVES:
+            raise ValueError(f"Unknown move {move!r}.")
+    cube = RubiksCube()
+    Scrambler().apply_scramble(cube, moves)
+    return cube.toString()
+
+
+def _read(lines: Iterable[str], fmt: str) -> Iterator[_Line]:
+    for number, text in enumerate(lines, start=1):
+        if not text.strip() or text.lstrip().startswith("#"):
+            continue
+        read_at = time.perf_counter()
+        try:
+            id_, cube_string = parse_line(text, fmt)
+        except (ValueError, TypeError) as error:
+            yield _Line(number, _line_id(text, fmt), None, str(error), read_at)
+        else:
+            yield _Line(number, id_, cube_string, None, read_at)
+
+
+def _line_id(text: str, fmt: str):
+    """Return the "id" of a JSONL line that failed to parse, if it has one."""
+    if fmt != "jsonl":
+        return None
+    try:
+        item = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return item.get("id") if isinstance(item, dict) else None
+
+
+def _solve_inline(items: Iterator[_Line], backend: str):
+    for item in items:
+        if item.error is not None:
+            yield _record(item, None, item.error), item.read_at
+            continue
+        try:
+            cube = RubiksCube()
+            cube.state = CubieCube.from_facelet_string(item.cube_string)
+            solution = Kociemba_Solver(cube, backend).get_solution()
+        except Exception as error:  # report it, keep going
+            yield _record(item, None, f"{type(error).__name__}: {error}"), item.read_at
+        else:
+            yield _record(item, solution, None), item.read_at
+
+
+def _solve_parallel(items: Iterator[_Line], workers, chunksize, ordered, backend):
+    """
+    Solve the parsed lines in a pool of processes, ``chunksize`` at a time.
+
+    Only lines that parsed are sent to the workers. At most four entries per
+    worker are in flight; with ``ordered`` a parse error is queued as one of
+    them, behind the lines read before it, so a window full of errors stops
+    reading as well. Otherwise a parse error is emitted as soon as it is read.
+    """
+    max_pending = workers * 4
+    pending = deque()  # (chunk of lines, future), or (parse error, None)
+    chunk = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def submit():
+            if chunk:
+                jobs = [(item.line, item.cube_string) for item in chunk]
+                future = executor.submit(_solve_chunk, jobs, backend)
+                pending.append((chunk.copy(), future))
+                chunk.clear()
+
+        while True:
+            while len(pending) < max_pending:
+                item = next(items, None)
+                if item is None:
+                    break
+                if item.error is None:
+                    chunk.append(item)
+                    if len(chunk) == chunksize:
+                        submit()
+                elif ordered:
+                    submit()  # the lines read before the error go first
+                    pending.append((item, None))
+                else:
+                    yield _record(item, None, item.error), item.read_at
+            submit()  # a partial chunk at the end of the input
+            if not pending:
+                return
+
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                futures = [future for _, future in pending]
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                done = [entry for entry in pending if entry[1] in finished]
+                for entry in done:
+                    pending.remove(entry)
+
+            for lines, future in done:
+                if future is None:
+                    yield _record(lines, None, lines.error), lines.read_at
+                    continue
+                for item, result in zip(lines, future.result()):
+                    yield _record(item, result.solution, result.error), item.read_at
+
+
+def _record(item: _Line, solution, error) -> StreamRecord:
+    return StreamRecord(item.line, item.id, item.cube_string, solution, error)
+
+
+def _measure(records, stats: StreamStats | None) -> Iterator[StreamRecord]:
+    for record, read_at in records:
+        if stats is not None:
+            stats.add(record, time.perf_counter() - read_at)
+        yield record
@@ -0,0 +1,127 @@
+# solver/tablefile.py
+
+"""
+Versioned binary files of named flat arrays, memory-mapped when read.
+
+Layout: a header (magic, version, section count, byte order, then any
+caller-defined metadata bytes), one entry per section (name, typecode,
+offset, size) and the section data, each aligned to 8 bytes. Used for the
+two-phase tables and the optimal solver's pattern databases.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+import numpy as np
+
+_HEADER = struct.Struct("<8sIIB")
+_ENTRY = struct.Struct("<24scQQ")
+
+# Permissions of a written file (mkstemp creates it readable by the owner only)
+FILE_MODE = 0o644
+
+
+def write_sections(
+    path: str,
+    magic: bytes,
+    version: int,
+    sections: dict,
+    typecodes: dict,
+    metadata: bytes = b"",
+):
+    """
+    Write the arrays of ``sections`` to ``path`` atomically (via a temporary file).
+
+    :param typecodes: Section name -> array typecode, in file order
+    :param metadata: Extra header bytes, returned as is by ``read_sections``
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    entries = []
+    offset = _HEADER.size + len(metadata) + _ENTRY.size * len(typecodes)
+    for name, typecode in typecodes.items():
+        data = np.ascontiguousarray(sections[name]).tobytes()
+        offset = (offset + 7) // 8 * 8
+        entries.append((name, typecode, offset, data))
+        offset += len(data)
+
+    byteorder = 0 if sys.byteorder == "little" else 1
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_HEADER.pack(magic, version, len(entries), byteorder))
+            file.write(metadata)
+            for name, typecode, offset, data in entries:
+                file.write(
+                    _ENTRY.pack(name.encode(), typecode.encode(), offset, len(data))
+                )
+            for name, typecode, offset, data in entries:
+                file.write(b"\0" * (offset - file.tell()))
+                file.write(data)
+        os.chmod(temp_path, FILE_MODE)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def read_sections(
+    path: str, magic: bytes, version: int, typecodes: dict, metadata_size: int = 0
+) -> tuple[dict, bytes, mmap.mmap]:
+    """
+    Memory-map a file written by ``write_sections``.
+
+    :return: ``(sections, metadata, buffer)``: one flat ``memoryview`` per
+        section, the extra header bytes and the memory map behind the views
+        (close it after releasing them)
+    :raises ValueError: if the file is not a ``magic`` file of this version,
+        is truncated or lacks a section of ``typecodes``
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError(f"{path} is empty.")
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    sections = {}
+    try:
+        try:
+            file_magic, file_version, count, byteorder = _HEADER.unpack_from(buffer)
+            metadata = buffer[_HEADER.size : _HEADER.size + metadata_size]
+            entries = [
+                _ENTRY.unpack_from(
+                    buffer, _HEADER.size + metadata_size + i * _ENTRY.size
+                )
+                for i in range(count)
+            ]
+        except struct.error:
+            raise ValueError(f"{path} is truncated.") from None
+        if file_magic != magic or file_version != version:
+            raise ValueError(f"{path} is not a version {version} {magic!r} file.")
+        if byteorder != (0 if sys.byteorder == "little" else 1):
+            raise ValueError(f"{path} was written with a different byte order.")
+
+        view = memoryview(buffer)
+        try:
+            for name, typecode, offset, size in entries:
+                name, typecode = name.rstrip(b"\0").decode(), typecode.decode()
+                if offset + size > len(buffer):
+                    raise ValueError(f"{path} is truncated.")
+                if typecodes.get(name, typecode) != typecode:
+                    raise ValueError(f"{path}: section {name} has the wrong type.")
+                try:
+                    sections[name] = view[offset : offset + size].cast(typecode)
+                except TypeError:
+                    raise ValueError(f"{path}: section {name} is damaged.") from None
+        finally:
+            view.release()
+        if not set(typecodes) <= set(sections):
+            raise ValueError(f"{path} does not contain every section.")
+    except ValueError:
+        for section in sections.values():
+            section.release()
+        buffer.close()
+        raise
+    return sections, metadata, buffer
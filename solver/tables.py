@@ -0,0 +1,210 @@
+# solver/tables.py
+
+"""
+Move and pruning tables of the two-phase solver.
+
+The tables are generated once with NumPy, written to a versioned binary
+file and memory-mapped on every later start.
+"""
+
+import os
+from itertools import permutations
+from math import comb
+
+import numpy as np
+
+from core.coords import (
+    N_CORNERS,
+    N_FLIP,
+    N_SLICE_SORTED,
+    N_TWIST,
+    SLICE_EDGE,
+    rank_permutations,
+    set_flip,
+    set_slice_sorted,
+    set_twist,
+)
+from core.cubie import MOVE_TABLE, MOVES, CubieCube
+from solver.tablefile import read_sections, write_sections
+
+# Bump whenever the layout or meaning of a table changes
+VERSION = 1
+MAGIC = b"RBXTWOPH"
+
+DEFAULT_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "tables", f"twophase_v{VERSION}.bin"
+)
+
+N_MOVES = len(MOVES)
+
+# Moves that keep the cube in the phase 2 subgroup <U, D, R2, L2, F2, B2>
+PHASE2_MOVES = [i for i, move in enumerate(MOVES) if move[0] in "UD" or move[1:] == "2"]
+
+# Table name -> array typecode (move tables are flattened as coordinate * 18 + move)
+# fmt: off
+TABLE_TYPES = {
+    "twist_move":           "H",
+    "flip_move":            "H",
+    "slice_move":           "H",
+    "slice_sorted_move":    "H",
+    "corners_move":         "H",
+    "ud_edges_move":        "H",
+    "twist_slice_prune":    "B",
+    "flip_slice_prune":     "B",
+    "corners_slice_prune":  "B",
+    "ud_edges_slice_prune": "B",
+}
+# fmt: on
+
+
+class TwoPhaseTables:
+    """Read-only view of the solver tables, one flat ``memoryview`` per table."""
+
+    def __init__(self, tables: dict, buffer=None):
+        self._buffer = buffer  # keeps the memory map alive
+        for name in TABLE_TYPES:
+            setattr(self, name, tables[name])
+
+    def close(self):
+        """Release the memory map backing the tables."""
+        for name in TABLE_TYPES:
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                view.release()
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+
+# -------- Generation --------
+def _orientation_move_table(count: int, setter, modulus: int, corners: bool):
+    """Move table of the twist (corners) or flip (edges) coordinate."""
+    cube = CubieCube()
+    states = []
+    for index in range(count):
+        setter(cube, index)
+        states.append(list(cube.co if corners else cube.eo))
+    states = np.array(states, dtype=np.int64)
+    weights = modulus ** np.arange(states.shape[1] - 2, -1, -1)
+    table = np.zeros((count, N_MOVES), dtype=np.uint16)
+    for m, move in enumerate(MOVES):
+        perm, ori = (
+            (MOVE_TABLE[move].cp, MOVE_TABLE[move].co)
+            if corners
+            else (MOVE_TABLE[move].ep, MOVE_TABLE[move].eo)
+        )
+        moved = (states[:, perm] + ori) % modulus
+        table[:, m] = moved[:, :-1] @ weights
+    return table
+
+
+def _slice_sorted_move_table() -> np.ndarray:
+    cube = CubieCube()
+    states = []
+    for index in range(N_SLICE_SORTED):
+        set_slice_sorted(cube, index)
+        states.append(list(cube.ep))
+    states = np.array(states, dtype=np.int64)
+    binomial = np.array([[comb(n, k) for k in range(6)] for n in range(12)])
+    table = np.zeros((N_SLICE_SORTED, N_MOVES), dtype=np.uint16)
+    for m, move in enumerate(MOVES):
+        moved = states[:, MOVE_TABLE[move].ep]
+        combination = np.zeros(N_SLICE_SORTED, dtype=np.int64)
+        found = np.zeros(N_SLICE_SORTED, dtype=np.int64)
+        for j in range(11, -1, -1):
+            is_slice = moved[:, j] >= SLICE_EDGE
+            combination += np.where(is_slice, binomial[11 - j, found + 1], 0)
+            found += is_slice
+        order = moved[moved >= SLICE_EDGE].reshape(-1, 4)
+        table[:, m] = 24 * combination + rank_permutations(order)
+    return table
+
+
+def _permutation_move_table(moves: list[int], edges: bool) -> np.ndarray:
+    """Move table of the corner or U/D edge permutation (Lehmer ranked)."""
+    # itertools yields the permutations in Lehmer rank order
+    states = np.array(list(permutations(range(8))), dtype=np.int8)
+    table = np.zeros((N_CORNERS, N_MOVES), dtype=np.uint16)
+    for m in moves:
+        move = MOVE_TABLE[MOVES[m]]
+        perm = move.ep[:SLICE_EDGE] if edges else move.cp
+        table[:, m] = rank_permutations(states[:, perm])
+    return table
+
+
+def _pruning_table(
+    move1: np.ndarray, move2: np.ndarray, moves: list[int]
+) -> np.ndarray:
+    """Breadth-first distances to solved for the coordinate pair (c1, c2)."""
+    n2 = move2.shape[0]
+    size = move1.shape[0] * n2
+    table = np.full(size, 0xFF, dtype=np.uint8)
+    table[0] = 0
+    frontier = np.array([0], dtype=np.int64)
+    depth = 0
+    while frontier.size:
+        depth += 1
+        c1, c2 = np.divmod(frontier, n2)
+        for m in moves:
+            reached = move1[c1, m].astype(np.int64) * n2 + move2[c2, m]
+            reached = reached[table[reached] == 0xFF]
+            table[reached] = depth
+        frontier = np.flatnonzero(table == depth)
+    return table
+
+
+def generate_tables() -> dict:
+    """Build every table as a NumPy array (takes a few seconds)."""
+    twist_move = _orientation_move_table(N_TWIST, set_twist, 3, corners=True)
+    flip_move = _orientation_move_table(N_FLIP, set_flip, 2, corners=False)
+    slice_sorted_move = _slice_sorted_move_table()
+    # The slice coordinate only depends on positions, so take any order
+    slice_move = slice_sorted_move[::24] // 24
+    corners_move = _permutation_move_table(list(range(N_MOVES)), edges=False)
+    ud_edges_move = _permutation_move_table(PHASE2_MOVES, edges=True)
+    # Phase 2 only needs the slice permutation, which lives in the first 24 entries
+    slice_perm_move = slice_sorted_move[:24]
+
+    all_moves = list(range(N_MOVES))
+    tables = {
+        "twist_move": twist_move,
+        "flip_move": flip_move,
+        "slice_move": slice_move,
+        "slice_sorted_move": slice_sorted_move,
+        "corners_move": corners_move,
+        "ud_edges_move": ud_edges_move,
+        "twist_slice_prune": _pruning_table(twist_move, slice_move, all_moves),
+        "flip_slice_prune": _pruning_table(flip_move, slice_move, all_moves),
+        "corners_slice_prune": _pruning_table(
+            corners_move, slice_perm_move, PHASE2_MOVES
+        ),
+        "ud_edges_slice_prune": _pruning_table(
+            ud_edges_move, slice_perm_move, PHASE2_MOVES
+        ),
+    }
+    return tables
+
+
+# -------- Persistence --------
+def write_tables(tables: dict, path: str):
+    """Write the tables to ``path`` atomically (via a temporary file)."""
+    write_sections(path, MAGIC, VERSION, tables, TABLE_TYPES)
+
+
+def read_tables(path: str) -> TwoPhaseTables:
+    """
+    Memory-map a table file written by ``write_tables``.
+
+    :raises ValueError: if the file is not a complete table file of this version
+    """
+    tables, _, buffer = read_sections(path, MAGIC, VERSION, TABLE_TYPES)
+    return TwoPhaseTables(tables, buffer)
+
+
+def load_tables(path: str = DEFAULT_TABLE_PATH) -> TwoPhaseTables:
+    """Memory-map the table file, generating and saving it first if needed."""
+    try:
+        return read_tables(path)
+    except (FileNotFoundError, ValueError):
+        write_tables(generate_tables(), path)
+        return read_tables(path)
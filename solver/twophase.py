@@ -0,0 +1,196 @@
+# solver/twophase.py
+
+"""
+In-process implementation of Kociemba's two-phase algorithm.
+
+Phase 1 brings the cube into the subgroup <U, D, R2, L2, F2, B2> (all
+orientations solved, slice edges in the slice); phase 2 solves it inside that
+subgroup. Both phases are IDA* searches over the coordinates of
+``core.coords`` using the tables of ``solver.tables``.
+"""
+
+import time
+
+from core.coords import (
+    N_SLICE,
+    get_corners,
+    get_flip,
+    get_slice_sorted,
+    get_twist,
+    get_ud_edges,
+)
+from core.cubie import MOVES, CubieCube
+from core.validate import check
+from solver.tables import (
+    DEFAULT_TABLE_PATH,
+    N_MOVES,
+    PHASE2_MOVES,
+    TwoPhaseTables,
+    load_tables,
+)
+
+# Longest solution the search will ever consider
+MAX_SEARCH_LENGTH = 30
+
+_FACE = [m // 3 for m in range(N_MOVES)]
+_PHASE2 = set(PHASE2_MOVES)
+
+
+def _allowed(move: int, last: int) -> bool:
+    """Skip moves of the same face, and fix the order of opposite face moves."""
+    if last < 0:
+        return True
+    face, last_face = _FACE[move], _FACE[last]
+    return face != last_face and not (face // 2 == last_face // 2 and face < last_face)
+
+
+# Next moves worth trying after each move (index 18: no previous move)
+NEXT_MOVES = [
+    [m for m in range(N_MOVES) if _allowed(m, last)] for last in range(N_MOVES)
+] + [list(range(N_MOVES))]
+_NEXT_PHASE2_MOVES = [[m for m in moves if m in _PHASE2] for moves in NEXT_MOVES]
+
+
+class _Stop(Exception):
+    """Raised inside the search to unwind once it is finished."""
+
+
+class TwoPhaseSolver:
+    """Solve cubes with the two-phase algorithm over memory-mapped tables."""
+
+    def __init__(self, tables: TwoPhaseTables | None = None):
+        self.tables = tables if tables is not None else get_tables()
+
+    def solve(
+        self, facelets: str, max_length: int = 21, timeout: float = 10.0
+    ) -> list[str]:
+        """
+        Return a solution (list of moves such as ``"R'"``) for a facelet string.
+
+        The search stops at the first solution of at most ``max_length`` moves;
+        once ``timeout`` seconds have passed it returns the shortest one found.
+
+        :raises ValueError: if the facelet string is not a solvable cube
+        :raises TimeoutError: if no solution at all was found in time
+        """
+        check(facelets)
+        cube = CubieCube.from_facelet_string(facelets)
+
+        self._cube = cube
+        self._target = max_length
+        self._deadline = time.monotonic() + timeout
+        self._best = None
+        self._phase1_moves = []
+        self._phase2_moves = []
+
+        twist, flip = get_twist(cube), get_flip(cube)
+        slice_ = get_slice_sorted(cube) // 24
+        try:
+            start = self._phase1_distance(twist, flip, slice_)
+            for depth in range(start, MAX_SEARCH_LENGTH + 1):
+                if self._best is not None and depth >= len(self._best):
+                    break
+                self._phase1(twist, flip, slice_, depth, N_MOVES)
+        except _Stop:
+            pass
+
+        if self._best is None:
+            raise TimeoutError(f"No solution found within {timeout} seconds.")
+        return [MOVES[m] for m in self._best]
+
+    # -------- Phase 1 --------
+    def _phase1_distance(self, twist: int, flip: int, slice_: int) -> int:
+        t = self.tables
+        return max(
+            t.twist_slice_prune[twist * N_SLICE + slice_],
+            t.flip_slice_prune[flip * N_SLICE + slice_],
+        )
+
+    def _phase1(self, twist: int, flip: int, slice_: int, togo: int, last: int):
+        if togo == 0:
+            # A solution ending in a phase 2 move was already found one level up
+            if last == N_MOVES or last not in _PHASE2:
+                self._start_phase2()
+            return
+
+        t = self.tables
+        twist_move, flip_move, slice_move = t.twist_move, t.flip_move, t.slice_move
+        twist_prune, flip_prune = t.twist_slice_prune, t.flip_slice_prune
+        path = self._phase1_moves
+        for m in NEXT_MOVES[last]:
+            tw = twist_move[twist * N_MOVES + m]
+            fl = flip_move[flip * N_MOVES + m]
+            sl = slice_move[slice_ * N_MOVES + m]
+            if (
+                twist_prune[tw * N_SLICE + sl] >= togo
+                or flip_prune[fl * N_SLICE + sl] >= togo
+            ):
+                continue
+            path.append(m)
+            self._phase1(tw, fl, sl, togo - 1, m)
+            path.pop()
+
+    # -------- Phase 2 --------
+    def _start_phase2(self):
+        if time.monotonic() > self._deadline:
+            raise _Stop
+
+        depth1 = len(self._phase1_moves)
+        limit = (len(self._best) - 1 if self._best else MAX_SEARCH_LENGTH) - depth1
+        if limit < 0:
+            return
+
+        cube = self._cube.copy()
+        for m in self._phase1_moves:
+            cube.apply_move(MOVES[m])
+        corners, edges = get_corners(cube), get_ud_edges(cube)
+        slice_perm = get_slice_sorted(cube)
+
+        t = self.tables
+        distance = max(
+            t.corners_slice_prune[corners * 24 + slice_perm],
+            t.ud_edges_slice_prune[edges * 24 + slice_perm],
+        )
+        last = self._phase1_moves[-1] if self._phase1_moves else N_MOVES
+        for togo in range(distance, limit + 1):
+            if self._phase2(corners, edges, slice_perm, togo, last):
+                self._best = self._phase1_moves + self._phase2_moves
+                self._phase2_moves = []
+                if len(self._best) <= self._target:
+                    raise _Stop
+                return
+
+    def _phase2(self, corners: int, edges: int, slice_perm: int, togo: int, last: int):
+        if togo == 0:
+            return corners == 0 and edges == 0 and slice_perm == 0
+
+        t = self.tables
+        corners_move, edges_move = t.corners_move, t.ud_edges_move
+        slice_move = t.slice_sorted_move
+        corners_prune, edges_prune = t.corners_slice_prune, t.ud_edges_slice_prune
+        for m in _NEXT_PHASE2_MOVES[last]:
+            co = corners_move[corners * N_MOVES + m]
+            ed = edges_move[edges * N_MOVES + m]
+            sl = slice_move[slice_perm * N_MOVES + m]
+            if corners_prune[co * 24 + sl] >= togo or edges_prune[ed * 24 + sl] >= togo:
+                continue
+            if self._phase2(co, ed, sl, togo - 1, m):
+                self._phase2_moves.insert(0, m)
+                return True
+        return False
+
+
+_tables = None
+
+
+def get_tables(path: str = DEFAULT_TABLE_PATH) -> TwoPhaseTables:
+    """Return the process-wide tables, loading (or generating) them on first use."""
+    global _tables
+    if _tables is None:
+        _tables = load_tables(path)
+    return _tables
+
+
+def solve(facelets: str, max_length: int = 21, timeout: float = 10.0) -> list[str]:
+    """Solve a facelet string with the shared tables (see ``TwoPhaseSolver.solve``)."""
+    return TwoPhaseSolver().solve(facelets, max_length, timeout)
@@ -0,0 +1,97 @@
+# tests/test_algorithm.py
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.algorithm import Algorithm, compile_algorithm, parse
+from core.cube import RubiksCube
+from core.cubie import MOVES
+
+
+def _moves(notation, simplify=True):
+    return str(compile_algorithm(notation, simplify))
+
+
+def test_parse_expands_groups_and_turn_counts():
+    assert parse("R U2' F3 (L D)2") == [
+        ("R", 1),
+        ("U", 2),
+        ("F", 3),
+        ("L", 1),
+        ("D", 1),
+        ("L", 1),
+        ("D", 1),
+    ]
+    assert parse("(R U)'") == [("U", 3), ("R", 3)]
+    assert parse("Rw r’ x4") == [("r", 1), ("r", 3)]
+    for notation in ["R Q", "(R U", "R U)"]:
+        with pytest.raises(ValueError):
+            parse(notation)
+
+
+def test_simplification_merges_and_cancels():
+    assert _moves("R R") == "R2"
+    assert _moves("R R'") == ""
+    assert _moves("R U U' R") == "R2"
+    assert _moves("U D U") == "U2 D"
+    assert _moves("D U") == "U D"
+    assert _moves("U D U' D'") == ""
+    assert _moves("R L R") == "R2 L"
+    assert _moves("R R", simplify=False) == "R R"
+
+
+def test_rotations_and_layer_moves_become_face_turns():
+    assert _moves("x U") == "F"
+    assert _moves("y R y'") == "B"
+    assert _moves("M") == "R L'"
+    assert _moves("M2 E2 S2") == "R2 L2 U2 D2 F2 B2"
+    assert _moves("Rw U") == _moves("r U") == "L F"
+
+
+@pytest.mark.parametrize(
+    "slice_notation, face_notation",
+    [
+        ("M2 U M2 U2 M2 U M2", "R2 U2 R U2 R2 U2 R2 U2 R U2 R2"),  # H perm
+        ("M2 U M U2 M' U M2", "R U' R U R U R U' R' U' R2"),  # Ua perm
+    ],
+)
+def test_slice_algorithms_match_face_turn_versions(slice_notation, face_notation):
+    cube1, cube2 = RubiksCube(), RubiksCube()
+    cube1.apply_algorithm(slice_notation)
+    cube2.apply_algorithm(face_notation)
+    assert cube1 == cube2
+
+
+@pytest.mark.parametrize("engine", ["cubie", "facelet"])
+def test_apply_algorithm_matches_single_moves(engine):
+    rng = random.Random(3)
+    for _ in range(50):
+        moves = [rng.choice(MOVES) for _ in range(rng.randint(0, 40))]
+        algorithm = compile_algorithm(moves)
+        cube1, cube2 = RubiksCube(engine), RubiksCube(engine)
+        cube1.apply_algorithm(algorithm)
+        for move in moves:
+            cube2._apply_move(move)
+        assert cube1.toString() == cube2.toString()
+        assert cube1.move_history == list(algorithm.moves)
+
+
+def test_compiled_algorithms_are_cached_and_invertible():
+    algorithm = compile_algorithm("(R U R' U')6")
+    assert compile_algorithm("(R U R' U')6") is algorithm
+    cube = RubiksCube()
+    cube.apply_algorithm(algorithm)
+    assert cube.is_solved()
+    assert len(cube.move_history) == 24
+
+    sune = Algorithm(["R", "U", "R'", "U", "R", "U2", "R'"])
+    cube.apply_algorithm(sune)
+    cube.apply_algorithm(sune.inverse())
+    assert cube.is_solved()
+    with pytest.raises(ValueError):
+        Algorithm(["M"])
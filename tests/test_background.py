@@ -0,0 +1,95 @@
+# tests/test_background.py
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cube import RubiksCube
+from solver import kociemba as kociemba_module
+from solver.background import BackgroundSolver
+from solver.cache import SolutionCache
+from solver.kociemba import Kociemba_Solver
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setitem(Kociemba_Solver.caches, "kociemba", SolutionCache())
+
+
+def _wait_for_result(solver, limit=30.0):
+    deadline = time.monotonic() + limit
+    while time.monotonic() < deadline:
+        result = solver.poll()
+        if result is not None:
+            return result
+        time.sleep(0.01)
+    raise AssertionError("background solve did not finish")
+
+
+def test_background_solve_returns_without_blocking():
+    cube = RubiksCube()
+    cube.R()
+    cube.U()
+    solver = BackgroundSolver()
+    try:
+        solver.start(cube)
+        assert solver.busy
+        result = _wait_for_result(solver)
+        assert result.ok
+        assert result.cube_string == cube.toString()
+        assert not solver.busy
+        assert solver.poll() is None
+        assert (
+            Kociemba_Solver.caches["kociemba"].get(cube.toString()) == result.solution
+        )
+    finally:
+        solver.close()
+
+
+def test_cached_solution_needs_no_worker(monkeypatch):
+    monkeypatch.setitem(kociemba_module.BACKENDS, "kociemba", None)
+    cube = RubiksCube()
+    cube.F()
+    Kociemba_Solver.caches["kociemba"].put(cube.toString(), ["F'"])
+
+    solver = BackgroundSolver()
+    solver.start(cube)
+    assert not solver.busy
+    assert solver.poll().solution == ["F'"]
+    solver.close()
+
+
+def test_invalid_state_reports_error():
+    cube = RubiksCube()
+    cube.state.eo[0] = 1  # single flipped edge
+    solver = BackgroundSolver()
+    try:
+        solver.start(cube)
+        result = _wait_for_result(solver)
+        assert not result.ok
+        assert "ValueError" in result.error
+    finally:
+        solver.close()
+
+
+def test_cancel_and_timeout():
+    cube = RubiksCube()
+    cube.L()
+    solver = BackgroundSolver(timeout=0.0)
+    try:
+        solver.start(cube)
+        solver.cancel()
+        assert not solver.busy
+        assert solver.poll() is None
+
+        solver.start(cube)
+        time.sleep(0.01)
+        result = solver.poll()
+        assert result is not None and "TimeoutError" in result.error
+        assert not solver.busy
+    finally:
+        solver.close()
@@ -0,0 +1,88 @@
+# tests/test_batch.py
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch import CubeBatch
+from core.cube import RubiksCube
+from core.scramble import Scrambler, decode_scramble, generate_scrambles
+
+
+def test_solved_batch():
+    batch = CubeBatch.solved(4)
+    assert len(batch) == 4
+    assert batch.is_solved().tolist() == [True] * 4
+    assert batch.to_strings() == [RubiksCube().toString()] * 4
+
+
+def test_apply_move_matches_cube():
+    batch = CubeBatch.solved(2)
+    cube = RubiksCube()
+    for move in ["R", "U'", "F2"]:
+        batch.apply_move(move)
+    cube.R()
+    cube.U_prime()
+    cube.F2()
+    assert batch.to_strings() == [cube.toString()] * 2
+    assert not batch.is_solved().any()
+
+
+def test_apply_moves_per_row():
+    scrambler = Scrambler()
+    scrambles = [scrambler.generate_scramble(10) for _ in range(5)]
+    batch = CubeBatch.solved(5)
+    for step in range(10):
+        batch.apply_moves([scramble[step] for scramble in scrambles])
+
+    for string, scramble in zip(batch.to_strings(), scrambles):
+        cube = RubiksCube()
+        scrambler.apply_scramble(cube, scramble)
+        assert string == cube.toString()
+
+
+def test_apply_moves_requires_one_move_per_cube():
+    batch = CubeBatch.solved(3)
+    with pytest.raises(ValueError):
+        batch.apply_moves(np.zeros(2, dtype=int))
+
+
+def test_apply_sequence_and_inverse():
+    batch = CubeBatch.solved(3)
+    batch.apply_sequence(["R", "U", "R'", "U'"])
+    assert not batch.is_solved().any()
+    batch.apply_sequence(["U", "R", "U'", "R'"])
+    assert batch.is_solved().all()
+
+
+def test_round_trip_with_cubes():
+    cubes = [RubiksCube(), RubiksCube()]
+    cubes[1].L2()
+    cubes[1].B()
+    batch = CubeBatch.from_cubes(cubes)
+    assert batch.is_solved().tolist() == [True, False]
+
+    for engine in ("cubie", "facelet"):
+        restored = batch.to_cubes(engine)
+        assert [cube.toString() for cube in restored] == [
+            cube.toString() for cube in cubes
+        ]
+        assert restored[1].engine == engine
+
+
+def test_apply_scrambles_matches_cubes():
+    scrambles = generate_scrambles(20, 15, rng=4)
+    batch = CubeBatch.solved(20)
+    batch.apply_scrambles(scrambles)
+
+    for row, string in zip(scrambles, batch.to_strings()):
+        cube = RubiksCube()
+        Scrambler().apply_scramble(cube, decode_scramble(row))
+        assert cube.toString() == string
+
+    with pytest.raises(ValueError):
+        batch.apply_scrambles(scrambles[:5])
@@ -0,0 +1,89 @@
+# tests/test_bench.py
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks import bench
+
+
+def test_percentiles_and_summary():
+    samples = [float(i) for i in range(1, 101)]
+    assert bench.percentile(samples, 50) == pytest.approx(50.5)
+    assert bench.percentile(samples, 99) == pytest.approx(99.01)
+    assert bench.percentile([3.0], 95) == 3.0
+
+    summary = bench.summarize([0.5, 0.5, 0.5], batch=10)
+    assert summary["p50"] == summary["p99"] == 0.5
+    assert summary["batch"] == 10
+    assert summary["ops_per_sec"] == 2.0
+
+
+def test_every_move_has_a_benchmark():
+    names = {benchmark.name for benchmark in bench.BENCHMARKS}
+    assert {f"move.{move}" for move in bench.MOVE_METHODS} <= names
+    assert len(bench.MOVE_METHODS) == 18
+
+
+@pytest.mark.parametrize("engine", ["cubie", "facelet"])
+def test_run_benchmarks_report(engine):
+    report = bench.run_benchmarks("move.R*", engine=engine, scale=0.01)
+    assert set(report["results"]) == {"move.R", "move.R'", "move.R2"}
+    assert report["environment"]["engine"] == engine
+    assert report["memory"]["bytes_per_cube"] > 0
+    json.dumps(report)
+
+
+def test_warmup_can_be_disabled():
+    calls = []
+
+    def run(number, engine, backend):
+        calls.append(number)
+        return 1.0
+
+    bench.measure(bench.Benchmark("x", run, number=1, repeat=3, warmup=False))
+    assert calls == [1, 1, 1]
+    bench.measure(bench.Benchmark("x", run, number=1, repeat=3))
+    assert len(calls) == 7
+
+
+def test_cold_solve_runs_in_a_fresh_process():
+    benchmark = next(b for b in bench.BENCHMARKS if b.name == "solve.cold")
+    assert (benchmark.number, benchmark.warmup) == (1, False)
+    assert benchmark.run(1, "cubie", "kociemba") > 0
+
+
+def test_compare_reports_regressions():
+    baseline = {
+        "results": {"a": {"p50": 1.0}, "b": {"p50": 1.0}},
+        "memory": {"bytes_per_cube": 1000},
+    }
+    report = {
+        "results": {"a": {"p50": 1.05}, "b": {"p50": 1.5}, "c": {"p50": 9.0}},
+        "memory": {"bytes_per_cube": 2000},
+    }
+    regressions = bench.compare(report, baseline, threshold=0.1)
+    assert [r["name"] for r in regressions] == ["b.p50", "memory.bytes_per_cube"]
+    assert regressions[0]["ratio"] == pytest.approx(1.5)
+    assert bench.compare(report, baseline, threshold=1.5) == []
+
+
+def test_main_exit_status(tmp_path, capsys):
+    output = tmp_path / "base.json"
+    args = ["--only", "is_solved", "--scale", "0.01", "--output", str(output)]
+    assert bench.main(args) == 0
+
+    baseline = json.loads(output.read_text())
+    baseline["results"]["is_solved"]["p50"] /= 1000
+    output.write_text(json.dumps(baseline))
+    assert bench.main(args[:4] + ["--baseline", str(output)]) == 1
+    assert "REGRESSION is_solved.p50" in capsys.readouterr().err
+
+
+def test_unknown_engine_raises_value_error():
+    with pytest.raises(ValueError):
+        bench.run_benchmarks(engine="INVALID")
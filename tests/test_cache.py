@@ -0,0 +1,103 @@
+# tests/test_cache.py
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cube import RubiksCube
+from core.facelet import FaceletCube
+from core.symmetry import conjugate
+from solver import kociemba as kociemba_module
+from solver.cache import SolutionCache
+from solver.kociemba import Kociemba_Solver
+
+STATE_A = "A" * 54
+STATE_B = "B" * 54
+STATE_C = "C" * 54
+
+
+def test_hits_and_misses():
+    cache = SolutionCache(maxsize=2)
+    assert cache.get(STATE_A) is None
+    cache.put(STATE_A, ["R", "U"])
+    assert cache.get(STATE_A) == ["R", "U"]
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+
+def test_least_recently_used_is_evicted():
+    cache = SolutionCache(maxsize=2)
+    cache.put(STATE_A, ["R"])
+    cache.put(STATE_B, ["U"])
+    cache.get(STATE_A)  # A is now more recent than B
+    cache.put(STATE_C, ["F"])
+    assert STATE_A in cache
+    assert STATE_B not in cache
+    assert len(cache) == 2
+
+
+def test_returned_solution_is_a_copy():
+    cache = SolutionCache()
+    cache.put(STATE_A, ["R"])
+    cache.get(STATE_A).clear()
+    assert cache.get(STATE_A) == ["R"]
+
+
+def test_backing_file_survives_restart(tmp_path):
+    path = str(tmp_path / "solutions.txt")
+    cache = SolutionCache(maxsize=2, path=path)
+    for state in (STATE_A, STATE_B, STATE_C, STATE_A, STATE_B):
+        cache.put(state, ["D2"])
+
+    restored = SolutionCache(maxsize=2, path=path)
+    assert len(restored) == 2
+    assert restored.get(STATE_B) == ["D2"]
+    assert STATE_C not in restored
+
+
+def test_invalid_size_raises_value_error():
+    with pytest.raises(ValueError):
+        SolutionCache(maxsize=0)
+
+
+def test_solver_uses_cache(monkeypatch):
+    calls = []
+
+    def fake_backend(cube_string):
+        calls.append(cube_string)
+        return ["R'"]
+
+    monkeypatch.setitem(kociemba_module.BACKENDS, "kociemba", fake_backend)
+    monkeypatch.setitem(Kociemba_Solver.caches, "kociemba", SolutionCache())
+    cube = RubiksCube()
+    cube.R()
+
+    assert Kociemba_Solver(cube).get_solution() == ["R'"]
+    assert Kociemba_Solver(cube).get_solution() == ["R'"]
+    assert len(calls) == 1
+    assert Kociemba_Solver.caches["kociemba"].hits == 1
+
+
+def test_symmetric_cache_hits_rotated_and_mirrored_states():
+    cache = SolutionCache(symmetric=True)
+    cube = RubiksCube()
+    cube.R()
+    cube.U()
+    cache.put(cube.toString(), ["U'", "R'"])
+
+    for symmetry in (5, 30):
+        image = conjugate(cube.toString(), symmetry)
+        solution = cache.get(image)
+        assert len(solution) == 2
+        other = RubiksCube(engine="facelet")
+        other.state = FaceletCube.from_facelet_string(image)
+        other.apply_algorithm(solution)
+        assert other.is_solved()
+    assert len(cache) == 1
+
+
+def test_default_solver_caches_are_not_symmetric():
+    # canonical() on every lookup costs more than most hits save
+    assert not any(cache.symmetric for cache in Kociemba_Solver.caches.values())
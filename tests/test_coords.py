@@ -0,0 +1,60 @@
+# tests/test_coords.py
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from core import coords
+from core.cubie import CubieCube
+
+
+def test_solved_cube_coordinates_are_zero():
+    cube = CubieCube()
+    assert coords.get_twist(cube) == 0
+    assert coords.get_flip(cube) == 0
+    assert coords.get_slice_sorted(cube) == 0
+    assert coords.get_corners(cube) == 0
+    assert coords.get_ud_edges(cube) == 0
+
+
+def test_permutation_rank_round_trip():
+    for rank in range(0, 40320, 997):
+        perm = coords.unrank_permutation(rank, 8)
+        assert sorted(perm) == list(range(8))
+        assert coords.rank_permutation(perm) == rank
+
+    ranks = list(range(0, 40320, 997))
+    perms = np.array([coords.unrank_permutation(rank, 8) for rank in ranks], np.int8)
+    assert coords.rank_permutations(perms).tolist() == ranks
+
+
+def test_coordinate_setters_round_trip():
+    cube = CubieCube()
+    for getter, setter, count in [
+        (coords.get_twist, coords.set_twist, coords.N_TWIST),
+        (coords.get_flip, coords.set_flip, coords.N_FLIP),
+        (coords.get_slice_sorted, coords.set_slice_sorted, coords.N_SLICE_SORTED),
+        (coords.get_corners, coords.set_corners, coords.N_CORNERS),
+    ]:
+        for index in range(0, count, 37):
+            setter(cube, index)
+            assert getter(cube) == index
+
+
+def test_slice_coordinate_after_phase_two_move():
+    cube = CubieCube()
+    cube.apply_move("R2")
+    # R2 keeps the slice edges in the slice, so only their order changes
+    assert coords.get_slice_sorted(cube) < 24
+    cube.apply_move("R")
+    assert coords.get_slice_sorted(cube) >= 24
+
+
+def test_edge_permutation_round_trip():
+    cube = CubieCube()
+    for index in range(0, coords.N_EDGES, 9_999_991):
+        coords.set_edges(cube, index)
+        assert coords.get_edges(cube) == index
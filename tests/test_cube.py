@@ -1,5 +1,6 @@
 # tests/test_cube.py
 
+import copy
 import sys
 import os
 
@@ -7,7 +8,7 @@ import pytest
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from core.cube import RubiksCube
+from core.cube import ENGINES, RubiksCube
 from utils.faces import Face
 from utils.colors import Color
 
@@ -101,19 +102,6 @@ def test_find_piece_by_colors():
     assert set(piece.get_faces().keys()) == {Color.YELLOW, Color.BLUE, Color.RED}
 
 
-def test_invalid_piece_in_fetch_components():
-    cube = RubiksCube()
-    with pytest.raises(ValueError):
-        cube._fetch_components(["XXX"])
-
-
-def test_rotate_components_invalid_face():
-    cube = RubiksCube()
-    comps = cube._fetch_components(["UF", "UR", "UB", "UL"])
-    with pytest.raises(ValueError):
-        cube._rotate_components(comps, "Z")
-
-
 def test_print_matrix_runs():
     cube = RubiksCube()
     cube.print_matrix()  # Should not crash
@@ -124,14 +112,6 @@ def test_display_runs():
     cube.display()  # Should not crash
 
 
-def test_apply_and_fetch_components_consistency():
-    cube = RubiksCube()
-    keys = ["DF", "DL", "DB", "DR"]
-    comps = cube._fetch_components(keys)
-    cube._apply_components(keys, comps)  # Should not raise
-    assert cube._fetch_components(keys) == comps
-
-
 def test_centers_created():
     cube = RubiksCube()
 
@@ -157,3 +137,256 @@ def test_corners_created():
         piece for piece in cube.pieces.values() if piece.__class__.__name__ == "Corner"
     ]
     assert len(corners) == 8, f"Expected 8 corners, got {len(corners)}"
+
+
+def test_pieces_follow_moves():
+    cube = RubiksCube()
+    cube.U()
+    # The Up-Front edge moves into the Up-Left slot
+    piece = cube.pieces["UL"]
+    assert piece.get_faces() == {Color.YELLOW: Face.U, Color.BLUE: Face.L}
+    assert cube.get_piece_at_position(0, 2, 1) is piece
+
+
+def test_to_string_after_moves():
+    cube = RubiksCube()
+    cube.U()
+    assert cube.toString() == (
+        "UUUUUUUUU" "BBBRRRRRR" "RRRFFFFFF" "DDDDDDDDD" "FFFLLLLLL" "LLLBBBBBB"
+    )
+
+
+def test_prime_and_double_moves_record_once():
+    cube = RubiksCube()
+    cube.R_prime()
+    cube.D2()
+    assert cube.move_history == ["R'", "D2"]
+    cube.D2()
+    cube.R()
+    assert cube.is_solved()
+
+
+def test_views_are_cached_until_the_next_move():
+    cube = RubiksCube()
+    face = cube.get_face(Face.F)
+    assert cube.get_face(Face.F) is face
+    assert cube.toString() is cube.toString()
+    pieces = cube.pieces
+
+    version = cube.version
+    cube.U()
+    assert cube.version == version + 1
+    assert cube.get_face(Face.F) is not face
+    assert cube.get_face(Face.F)[0] == ["RED", "RED", "RED"]
+    assert cube.pieces is not pieces
+
+
+def test_assigning_state_or_reset_drops_cached_views():
+    cube = RubiksCube()
+    cube.R()
+    scrambled = cube.toString()
+    version = cube.version
+
+    cube.reset()
+    assert cube.version > version
+    assert cube.toString() != scrambled
+    assert cube.is_solved()
+
+    other = RubiksCube()
+    other.R()
+    cube.state = other.state.copy()
+    assert cube.toString() == scrambled
+
+
+def test_equal_states_are_equal_and_hash_alike():
+    cube1 = RubiksCube()
+    cube2 = RubiksCube(engine="facelet")
+    assert cube1 == cube2
+    assert hash(cube1) == hash(cube2)
+
+    cube1.R()
+    cube1.U()
+    assert cube1 != cube2
+    cube2.R()
+    cube2.U()
+    assert cube1 == cube2 and cube1.state_hash() == cube2.state_hash()
+
+    # Same state through a different history
+    cube3 = RubiksCube()
+    cube3.R()
+    cube3.D()
+    cube3.D_prime()
+    cube3.U()
+    assert cube3 == cube1
+    assert len({cube1, cube2, cube3}) == 1
+
+
+def test_state_hash_follows_moves_and_resets():
+    cube = RubiksCube()
+    solved = cube.state_hash()
+    cube.F()
+    turned = cube.state_hash()
+    cube.F_prime()
+    assert cube.state_hash() == solved != turned
+    cube.F()
+    cube.reset()
+    assert cube.state_hash() == solved
+
+
+def test_undo_and_redo_restore_states():
+    cube = RubiksCube()
+    cube.F()
+    cube.R()
+    cube.U2()
+    after = cube.toString()
+
+    assert cube.undo() == "U2"
+    assert cube.undo() == "R"
+    assert cube.move_history == ["F"]
+    assert cube.redo() == "R"
+    assert cube.redo() == "U2"
+    assert cube.redo() is None
+    assert cube.toString() == after
+
+    while cube.undo():
+        pass
+    assert cube.is_solved()
+    assert cube.undo() is None
+
+    # A new move drops what could have been redone
+    cube.redo()
+    cube.L()
+    assert cube.redo() is None
+    assert cube.move_history == ["F", "L"]
+
+
+def test_undo_keeps_state_hash_current():
+    cube = RubiksCube()
+    solved = cube.state_hash()
+    cube.apply_algorithm("R U R' U'")
+    for _ in range(4):
+        cube.undo()
+    assert cube.state_hash() == solved
+
+
+def test_seek_moves_along_the_history():
+    cube = RubiksCube()
+    cube.checkpoint_interval = 4
+    moves = ["R", "U", "F'", "D2", "L", "B", "R2", "U'", "F", "D"]
+    cube.apply_algorithm(" ".join(moves))
+    after = cube.toString()
+
+    cube.seek(3)
+    partial = RubiksCube()
+    partial.apply_algorithm(" ".join(moves[:3]))
+    assert cube == partial
+    assert cube.move_history == moves[:3]
+    assert cube.redo() == "D2"
+
+    cube.seek(10)
+    assert cube.toString() == after
+    cube.seek(0)
+    assert cube.is_solved()
+    with pytest.raises(IndexError):
+        cube.seek(11)
+
+    # New moves after a seek replace the rest of the timeline
+    cube.U()
+    cube.seek(0)
+    cube.seek(1)
+    assert cube.move_history == ["U"]
+    single = RubiksCube()
+    single.U()
+    assert cube == single
+
+
+def test_seek_after_state_is_replaced():
+    cube = RubiksCube()
+    cube.R()
+    cube.seek(0)
+    cube.seek(1)
+    other = RubiksCube()
+    other.F()
+    cube.state = other.state.copy()
+    # The timeline is rebuilt from the new state, taking R as its last move
+    cube.seek(0)
+    other.R_prime()
+    assert cube == other
+    cube.seek(1)
+    other.R()
+    assert cube == other
+
+
+def test_clone_is_independent():
+    cube = RubiksCube()
+    cube.R()
+    cube.toString()
+    clone = cube.clone()
+    assert clone == cube
+    assert clone.move_history == ["R"]
+
+    clone.U()
+    assert cube.move_history == ["R"]
+    assert cube != clone
+    assert clone.toString() != cube.toString()
+    assert cube.clone(history=False).move_history == []
+    assert copy.deepcopy(cube) == cube
+
+
+def test_clone_keeps_the_subclass():
+    class TrackedCube(RubiksCube):
+        pass
+
+    cube = TrackedCube()
+    cube.F()
+    clone = cube.clone()
+    assert type(clone) is TrackedCube
+    assert clone == cube
+
+
+def test_snapshot_restore_and_reset_use_solved_template():
+    for engine in ENGINES:
+        cube = RubiksCube(engine)
+        assert cube.snapshot() == RubiksCube.SOLVED_STATES[engine]
+        cube.F()
+        saved = cube.snapshot()
+        cube.U()
+        cube.restore(saved)
+        other = RubiksCube(engine)
+        other.F()
+        assert cube == other
+
+        cube.reset()
+        assert cube.is_solved()
+        assert cube.move_history == []
+        with pytest.raises(ValueError):
+            cube.restore(b"\x00")
+    with pytest.raises(TypeError):
+        RubiksCube.SOLVED_STATES["cubie"] = b""
+
+
+def test_from_string_and_from_cubies_invert_to_string():
+    cube = RubiksCube()
+    cube.apply_algorithm("R U F2 L' D B")
+    state = cube.toString()
+    for engine in ENGINES:
+        loaded = RubiksCube.from_string(state, engine)
+        assert loaded == cube
+        assert loaded.toString() == state
+        assert loaded.move_history == []
+        s = cube.state
+        assert RubiksCube.from_cubies(s.cp, s.co, s.ep, s.eo, engine) == cube
+
+    flipped = state[:5] + state[10] + state[6:10] + state[5] + state[11:]
+    with pytest.raises(ValueError, match="flipped"):
+        RubiksCube.from_string(flipped)
+    assert RubiksCube.from_string(flipped, validate=False).toString() == flipped
+    # Without validation the string must still be 54 face letters
+    for engine in ENGINES:
+        for text in (state[:53], state + "U", "x" + state[1:]):
+            with pytest.raises(ValueError):
+                RubiksCube.from_string(text, engine, validate=False)
+    with pytest.raises(ValueError):
+        RubiksCube.from_cubies([0] * 8, [0] * 8, list(range(12)), [0] * 12)
+    with pytest.raises(ValueError, match="twisted"):
+        RubiksCube.from_cubies(range(8), [1] + [0] * 7, range(12), [0] * 12)
@@ -0,0 +1,88 @@
+# tests/test_cubie.py
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cubie import MOVE_CUBES, MOVE_TABLE, MOVES, CubieCube
+from core.scramble import Scrambler
+
+SOLVED_STRING = "UUUUUUUUURRRRRRRRRFFFFFFFFFDDDDDDDDDLLLLLLLLLBBBBBBBBB"
+
+
+def test_solved_state():
+    cube = CubieCube()
+    assert cube.is_solved()
+    assert cube.to_facelet_string() == SOLVED_STRING
+
+
+def test_four_quarter_turns_are_identity():
+    for face, move in MOVE_CUBES.items():
+        cube = CubieCube()
+        for _ in range(4):
+            cube.multiply(move)
+        assert cube.is_solved(), f"{face}4 did not restore the cube"
+
+
+def test_quarter_turn_facelets():
+    cube = CubieCube()
+    cube.multiply(MOVE_CUBES["R"])
+    assert cube.to_facelet_string() == (
+        "UUFUUFUUF" "RRRRRRRRR" "FFDFFDFFD" "DDBDDBDDB" "LLLLLLLLL" "UBBUBBUBB"
+    )
+
+
+def test_orientation_sums_are_preserved():
+    cube = CubieCube()
+    for face in "RUFLDBRF":
+        cube.multiply(MOVE_CUBES[face])
+    assert sum(cube.co) % 3 == 0
+    assert sum(cube.eo) % 2 == 0
+    assert sorted(cube.cp) == list(range(8))
+    assert sorted(cube.ep) == list(range(12))
+
+
+def test_copy_is_independent():
+    cube = CubieCube()
+    clone = cube.copy()
+    cube.multiply(MOVE_CUBES["F"])
+    assert clone.is_solved()
+    assert clone != cube
+
+
+def test_inverse_undoes_the_state():
+    scramble = ["R", "U'", "F2", "L", "D", "B'"]
+    cube = CubieCube.compose(scramble)
+    inverse = cube.inverse()
+    undone = cube.copy()
+    undone.multiply(inverse)
+    assert undone.is_solved()
+    inverse.multiply(cube)
+    assert inverse.is_solved()
+
+    # The reversed, inverted scramble gives the inverse state
+    inverted = [move[0] + {"": "'", "'": "", "2": "2"}[move[1:]] for move in scramble]
+    assert CubieCube.compose(inverted[::-1]) == cube.inverse()
+
+
+def test_move_table_matches_repeated_quarter_turns():
+    for face, quarter in MOVE_CUBES.items():
+        expected = CubieCube()
+        for suffix in ["", "2", "'"]:
+            expected.multiply(quarter)
+            cube = CubieCube()
+            cube.multiply(MOVE_TABLE[face + suffix])
+            assert cube == expected, f"{face + suffix} table is wrong"
+
+
+def test_move_table_covers_scrambler_moves():
+    assert MOVES == Scrambler.MOVES
+    assert set(MOVE_TABLE) == set(MOVES)
+
+
+def test_from_facelet_string_round_trip():
+    cube = CubieCube()
+    for move in ["R", "U'", "F2", "B", "L'", "D2"]:
+        cube.apply_move(move)
+    assert CubieCube.from_facelet_string(cube.to_facelet_string()) == cube
@@ -0,0 +1,55 @@
+# tests/test_facelet.py
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cube import RubiksCube
+from core.cubie import MOVES, CubieCube
+from core.facelet import SOLVED_FACELETS, FaceletCube
+from utils.faces import Face
+
+
+def test_solved_state():
+    cube = FaceletCube()
+    assert cube.is_solved()
+    assert cube.facelets == SOLVED_FACELETS
+
+
+def test_invalid_length_raises_value_error():
+    with pytest.raises(ValueError):
+        FaceletCube(b"U" * 53)
+
+
+def test_moves_match_cubie_engine():
+    facelet_cube = FaceletCube()
+    cubie_cube = CubieCube()
+    for move in MOVES + ["R", "U'", "F2", "L", "B'", "D"]:
+        facelet_cube.apply_move(move)
+        cubie_cube.apply_move(move)
+        assert facelet_cube.to_facelet_string() == cubie_cube.to_facelet_string()
+
+
+def test_rubiks_cube_facelet_engine():
+    cube = RubiksCube(engine="facelet")
+    reference = RubiksCube()
+    for cube_ in (cube, reference):
+        cube_.R()
+        cube_.U_prime()
+        cube_.F2()
+    assert cube.toString() == reference.toString()
+    for face in Face:
+        assert cube.get_face(face) == reference.get_face(face)
+    assert cube.move_history == ["R", "U'", "F2"]
+
+    cube.reset()
+    assert cube.engine == "facelet"
+    assert cube.is_solved()
+
+
+def test_unknown_engine_raises_value_error():
+    with pytest.raises(ValueError):
+        RubiksCube(engine="INVALID")
@@ -0,0 +1,67 @@
+# tests/test_history.py
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cubie import MOVES
+from core.history import INVERSE_MOVES, MOVE_CODES, MoveHistory
+
+
+def test_history_reads_like_a_list():
+    history = MoveHistory(["F", "R"])
+    history.append("U2")
+    assert history == ["F", "R", "U2"]
+    assert history == MoveHistory(["F", "R", "U2"])
+    assert history != ["F", "R"]
+    assert list(history) == ["F", "R", "U2"]
+    assert history[-1] == "U2"
+    assert history[1:] == ["R", "U2"]
+    assert len(history) == 3
+    assert history.codes == bytes([MOVES.index(m) for m in ["F", "R", "U2"]])
+
+
+def test_undo_redo_and_new_moves():
+    history = MoveHistory(["F", "R'"])
+    assert history.undo() == "R'"
+    assert history == ["F"] and history.can_redo
+    assert history.redo() == "R'"
+    assert history.redo() is None
+    assert history == ["F", "R'"]
+
+    history.undo()
+    history.append("U")
+    assert not history.can_redo
+    history.clear()
+    assert history.undo() is None
+    assert not history.can_undo
+
+
+def test_inverse_moves():
+    assert INVERSE_MOVES["R"] == "R'"
+    assert INVERSE_MOVES["R'"] == "R"
+    assert INVERSE_MOVES["R2"] == "R2"
+    assert sorted(INVERSE_MOVES.values()) == sorted(MOVES)
+
+
+def test_unknown_move_raises_key_error():
+    with pytest.raises(KeyError):
+        MoveHistory().append("M")
+
+
+def test_seek_splits_moves_into_history_and_redo():
+    history = MoveHistory(["F", "R", "U2"])
+    history.undo()
+    assert history.all_codes == bytes(MOVE_CODES[m] for m in ["F", "R", "U2"])
+
+    history.seek(1)
+    assert history == ["F"]
+    assert history.undone == ["R", "U2"]
+    history.seek(3)
+    assert history == ["F", "R", "U2"]
+    assert not history.can_redo
+    with pytest.raises(IndexError):
+        history.seek(4)
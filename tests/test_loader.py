@@ -0,0 +1,56 @@
+# tests/test_loader.py
+
+import io
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch import CubeBatch
+from core.cube import RubiksCube
+from core.loader import load_batches, load_cubes, read_cube_strings, save_cubes
+from core.scramble import generate_scrambles
+
+
+def _batch(count: int) -> CubeBatch:
+    batch = CubeBatch.solved(count)
+    batch.apply_scrambles(generate_scrambles(count, 20, rng=7))
+    return batch
+
+
+def test_round_trip_through_a_file(tmp_path):
+    batch = _batch(50)
+    path = str(tmp_path / "states.txt")
+    assert save_cubes(batch, path) == 50
+
+    cubes = list(load_cubes(path))
+    assert [cube.toString() for cube in cubes] == batch.to_strings()
+    blocks = list(load_batches(path, batch_size=16))
+    assert [len(block) for block in blocks] == [16, 16, 16, 2]
+    assert np.array_equal(np.concatenate([b.facelets for b in blocks]), batch.facelets)
+
+    out = io.StringIO()
+    save_cubes(cubes[:3], out)
+    assert out.getvalue().split() == batch.to_strings()[:3]
+
+
+def test_blank_and_comment_lines_are_skipped():
+    state = RubiksCube().toString()
+    lines = ["# header\n", "\n", state + "\n", "  " + state + "  \n"]
+    assert list(read_cube_strings(lines)) == [(3, state), (4, state)]
+
+
+def test_bad_lines_report_their_line_number():
+    state = RubiksCube().toString()
+    twisted = state[:8] + "RFU" + state[11:]
+    with pytest.raises(ValueError, match="Line 2: Invalid cube"):
+        list(load_cubes([state, "U" * 54]))
+    with pytest.raises(ValueError, match=r"Line 3: invalid cube \(stickers\)"):
+        list(load_batches([state, state, twisted]))
+    with pytest.raises(ValueError, match="Line 1"):
+        list(load_batches(["UUU"], validate=False))
+    with pytest.raises(ValueError):
+        list(load_batches([state], batch_size=0))
@@ -0,0 +1,175 @@
+# tests/test_optimal.py
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cube import RubiksCube
+from core.cubie import MOVES, CubieCube
+from core.scramble import Scrambler
+from solver import optimal
+from solver.cache import SolutionCache
+from solver.kociemba import Kociemba_Solver
+from solver.optimal import (
+    SECTION_TYPES,
+    OptimalSolver,
+    coordinates,
+    load_databases,
+    read_databases,
+)
+
+# A low cap keeps generation to seconds; the solutions stay optimal
+MAX_DEPTH = 4
+
+
+@pytest.fixture(scope="module")
+def database_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("databases") / "optimal.bin")
+    load_databases(path, max_depth=MAX_DEPTH, workers=1).close()
+    return path
+
+
+@pytest.fixture(scope="module")
+def databases(database_path):
+    databases = read_databases(database_path)
+    yield databases
+    databases.close()
+
+
+def _scrambled(length: int) -> str:
+    cube = RubiksCube()
+    scrambler = Scrambler()
+    scrambler.apply_scramble(cube, scrambler.generate_scramble(length))
+    return cube.toString()
+
+
+def _is_solution(cube_string, moves):
+    cube = RubiksCube()
+    cube.state = CubieCube.from_facelet_string(cube_string)
+    Scrambler().apply_scramble(cube, moves)
+    return cube.is_solved()
+
+
+def test_databases_are_memory_mapped(databases):
+    for name, typecode in SECTION_TYPES.items():
+        view = getattr(databases, name)
+        assert isinstance(view, memoryview)
+        assert view.format == typecode
+    assert databases.max_depth == MAX_DEPTH
+    assert databases.distance(*coordinates(CubieCube())) == 0
+    # Two 4-bit entries per byte
+    size = optimal.DATABASE_SIZES["corners"][0]
+    assert len(databases.corners) == size // 2
+
+
+def test_move_tables_follow_the_cube(databases):
+    random.seed(7)
+    cube = CubieCube.from_facelet_string(_scrambled(20))
+    for _ in range(50):
+        m = random.randrange(len(MOVES))
+        corners, twist, low, high = coordinates(cube)
+        cube.apply_move(MOVES[m])
+        assert coordinates(cube) == (
+            databases.corners_move[corners * 18 + m],
+            databases.twist_move[twist * 18 + m],
+            databases.edge_move[(low >> 6) * 18 + m] ^ (low & 63),
+            databases.edge_move[(high >> 6) * 18 + m] ^ (high & 63),
+        )
+
+
+def test_distance_is_a_lower_bound(databases):
+    for move in MOVES:
+        cube = CubieCube()
+        cube.apply_move(move)
+        assert databases.distance(*coordinates(cube)) == 1
+    # Entries past the cap hold cap + 1
+    random.seed(1)
+    deep = CubieCube.from_facelet_string(_scrambled(30))
+    assert databases.distance(*coordinates(deep)) == MAX_DEPTH + 1
+
+
+def test_solutions_are_shortest(databases):
+    solver = OptimalSolver(databases)
+    assert solver.solve(RubiksCube().toString()) == []
+    cube = RubiksCube()
+    cube.R()
+    cube.U_prime()
+    cube.R_prime()
+    assert len(solver.solve(cube.toString())) == 3
+
+    random.seed(11)
+    for length in (2, 4, 6):
+        cube_string = _scrambled(length)
+        result = solver.search(cube_string)
+        assert len(result.moves) <= length
+        assert _is_solution(cube_string, result.moves)
+        # The last iteration found it
+        assert [stats.depth for stats in result.depths][-1] == len(result.moves)
+
+
+def test_search_reports_each_depth(databases):
+    random.seed(3)
+    reported = []
+    result = OptimalSolver(databases).search(_scrambled(6), on_depth=reported.append)
+    assert reported == result.depths
+    assert result.nodes == sum(stats.nodes for stats in reported) > 0
+    assert result.nodes_per_second > 0
+
+
+def test_parallel_search_matches_serial(database_path, databases):
+    random.seed(5)
+    cube_string = _scrambled(6)
+    serial = OptimalSolver(databases).search(cube_string)
+    parallel = OptimalSolver(read_databases(database_path), workers=2).search(
+        cube_string
+    )
+    assert len(parallel.moves) == len(serial.moves)
+    assert _is_solution(cube_string, parallel.moves)
+
+
+def test_timeout_and_bad_states(databases):
+    solver = OptimalSolver(databases)
+    random.seed(9)
+    cube_string = _scrambled(20)
+    with pytest.raises(TimeoutError):
+        solver.solve(cube_string, timeout=0.0)
+    with pytest.raises(ValueError):
+        solver.solve(cube_string, max_length=3)
+
+    cube = CubieCube()
+    cube.co[0] = 1  # single twisted corner
+    with pytest.raises(ValueError):
+        solver.solve(cube.to_facelet_string())
+    with pytest.raises(ValueError):
+        OptimalSolver(databases, workers=0)
+
+
+def test_wrong_version_is_regenerated(tmp_path, database_path):
+    path = tmp_path / "old.bin"
+    with open(database_path, "rb") as source:
+        data = bytearray(source.read())
+    data[8] += 1  # version field
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        read_databases(str(path))
+    databases = load_databases(str(path), max_depth=1, workers=1)
+    assert databases.max_depth == 1
+    databases.close()
+
+
+def test_kociemba_solver_optimal_backend(databases, monkeypatch):
+    monkeypatch.setattr(optimal, "_databases", databases)
+    monkeypatch.setitem(Kociemba_Solver.caches, "optimal", SolutionCache())
+    cube = RubiksCube()
+    cube.F()
+    cube.D2()
+    # Each backend has its own cache, so another backend's answer is not reused
+    monkeypatch.setitem(Kociemba_Solver.caches, "kociemba", SolutionCache())
+    Kociemba_Solver.caches["kociemba"].put(cube.toString(), ["F", "F2", "D2"])
+    assert Kociemba_Solver(cube, backend="optimal").get_solution() == ["D2", "F'"]
+    assert Kociemba_Solver.caches["optimal"].get(cube.toString()) == ["D2", "F'"]
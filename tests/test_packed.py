@@ -0,0 +1,87 @@
+# tests/test_packed.py
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch import CubeBatch
+from core.cube import RubiksCube
+from core.cubie import CubieCube
+from core.packed import (
+    RECORD_DTYPE,
+    RECORD_SIZE,
+    open_states,
+    pack,
+    pack_batch,
+    unpack,
+    unpack_batch,
+    unpack_cube,
+    write_states,
+)
+from core.scramble import generate_scrambles
+
+
+def _batch(count: int, seed: int = 3) -> CubeBatch:
+    batch = CubeBatch.solved(count)
+    batch.apply_scrambles(generate_scrambles(count, 25, rng=seed))
+    return batch
+
+
+def test_records_are_nine_bytes_and_round_trip():
+    assert RECORD_SIZE == 9
+    assert pack(RubiksCube()) == bytes(9)
+
+    batch = _batch(300)
+    records = pack_batch(batch)
+    assert records.dtype == RECORD_DTYPE
+    assert unpack_batch(records).to_strings() == batch.to_strings()
+    for cube_string, record in zip(batch.to_strings()[:50], records[:50]):
+        cube = RubiksCube.from_string(cube_string)
+        assert pack(cube) == record.tobytes()
+        assert unpack(record.tobytes()) == CubieCube.from_facelet_string(cube_string)
+        assert unpack_cube(record.tobytes(), engine="facelet") == cube
+
+
+def test_invalid_records_and_batches_raise():
+    with pytest.raises(ValueError):
+        unpack(b"\xff" * 9)
+    with pytest.raises(ValueError):
+        unpack(bytes(8))
+    with pytest.raises(ValueError):
+        unpack_batch(np.frombuffer(b"\xff" * 9, dtype=RECORD_DTYPE))
+    with pytest.raises(ValueError):
+        pack_batch(CubeBatch.from_strings(["U" * 54]))
+
+    # Real pieces, but a twisted corner: the record would drop the twist
+    twisted = CubieCube()
+    twisted.co[0] = 1
+    batch = CubeBatch.from_strings(
+        [RubiksCube().toString(), twisted.to_facelet_string()]
+    )
+    with pytest.raises(ValueError, match="Row 1 .*twist"):
+        pack_batch(batch)
+
+
+def test_state_files_are_memory_mapped(tmp_path):
+    path = str(tmp_path / "states.bin")
+    batch = _batch(100)
+    assert write_states(path, batch) == 100
+    assert os.path.getsize(path) == 8 + 100 * RECORD_SIZE
+
+    cubes = unpack_batch(pack_batch(_batch(10, seed=4))).to_cubes()
+    assert write_states(path, iter(cubes), append=True, chunk=4) == 10
+    records = open_states(path)
+    assert isinstance(records, np.memmap) and len(records) == 110
+    expected = batch.to_strings() + [cube.toString() for cube in cubes]
+    assert unpack_batch(records).to_strings() == expected
+
+    del records
+    write_states(path, np.empty(0, dtype=RECORD_DTYPE))
+    assert len(open_states(path)) == 0
+    (tmp_path / "other.bin").write_bytes(b"not a state file")
+    with pytest.raises(ValueError):
+        open_states(str(tmp_path / "other.bin"))
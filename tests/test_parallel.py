@@ -0,0 +1,141 @@
+# tests/test_parallel.py
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cube import RubiksCube
+from core.cubie import CubieCube
+from core.scramble import Scrambler
+from solver import kociemba as kociemba_module
+from solver.cache import SolutionCache
+from solver.kociemba import Kociemba_Solver
+from solver.parallel import solve_many, solve_one
+
+
+def _scrambled_cubes(count):
+    scrambler = Scrambler()
+    cubes = []
+    for _ in range(count):
+        cube = RubiksCube()
+        scrambler.apply_scramble(cube, scrambler.generate_scramble())
+        cubes.append(cube)
+    return cubes
+
+
+def _check(result):
+    cube = RubiksCube()
+    cube.state = CubieCube.from_facelet_string(result.cube_string)
+    Scrambler().apply_scramble(cube, result.solution)
+    assert cube.is_solved()
+
+
+def test_solve_many_in_process_reports_errors():
+    cubes = _scrambled_cubes(3)
+    states = [cubes[0], "U" * 54, cubes[1].toString(), cubes[2]]
+    results = list(solve_many(states, workers=1, chunksize=2))
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert not results[1].ok
+    assert results[1].solution is None
+    assert "ValueError" in results[1].error
+    for result in results[:1] + results[2:]:
+        assert result.ok
+        _check(result)
+
+
+def test_solve_one_reports_any_backend_failure(monkeypatch):
+    def broken_backend(cube_string):
+        raise RuntimeError("backend crashed")
+
+    monkeypatch.setitem(kociemba_module.BACKENDS, "kociemba", broken_backend)
+    result = solve_one(RubiksCube().toString())
+    assert not result.ok
+    assert result.error == "RuntimeError: backend crashed"
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_solve_many_with_process_pool(ordered):
+    cubes = _scrambled_cubes(6)
+    results = list(solve_many(cubes, workers=2, chunksize=2, ordered=ordered))
+
+    assert sorted(result.index for result in results) == list(range(6))
+    if ordered:
+        assert [result.index for result in results] == list(range(6))
+    for result in results:
+        assert result.cube_string == cubes[result.index].toString()
+        _check(result)
+
+
+def test_invalid_arguments_raise_value_error():
+    with pytest.raises(ValueError):
+        solve_many([], backend="INVALID")
+    with pytest.raises(ValueError):
+        solve_many([], chunksize=0)
+
+
+def test_shortest_solution_over_orientations(monkeypatch):
+    monkeypatch.setitem(Kociemba_Solver.caches, "kociemba", SolutionCache())
+    cube = _scrambled_cubes(1)[0]
+    single = Kociemba_Solver(cube).get_solution()
+    Kociemba_Solver.caches["kociemba"].clear()
+
+    for workers in (1, 3):
+        solver = Kociemba_Solver(cube)
+        solution = solver.get_shortest_solution(timeout=30.0, workers=workers)
+        # The first orientation is the plain solve, so this is never longer
+        assert len(solution) <= len(single)
+        solved = cube.clone()
+        Scrambler().apply_scramble(solved, solution)
+        assert solved.is_solved()
+    assert Kociemba_Solver.caches["kociemba"].get(cube.toString()) == solution
+
+    with pytest.raises(TimeoutError):
+        Kociemba_Solver(cube).get_shortest_solution(timeout=0.0)
+    twisted = RubiksCube.from_cubies(
+        range(8), [1] + [0] * 7, range(12), [0] * 12, validate=False
+    )
+    with pytest.raises(ValueError):
+        Kociemba_Solver(twisted).get_shortest_solution()
+
+
+def test_shortest_solution_skips_failed_searches(monkeypatch):
+    monkeypatch.setitem(Kociemba_Solver.caches, "kociemba", None)
+    cube = _scrambled_cubes(1)[0]
+    solve = kociemba_module.BACKENDS["kociemba"]
+    timeouts = []
+
+    def flaky_backend(cube_string, timeout=None):
+        timeouts.append(timeout)
+        if len(timeouts) % 2 == 0:
+            raise TimeoutError("out of time")
+        return solve(cube_string)
+
+    monkeypatch.setitem(kociemba_module.BACKENDS, "kociemba", flaky_backend)
+    solution = Kociemba_Solver(cube).get_shortest_solution(timeout=30.0, workers=1)
+    solved = cube.clone()
+    Scrambler().apply_scramble(solved, solution)
+    assert solved.is_solved()
+    # Every search ran, each with what was left of the budget
+    assert len(timeouts) == 6
+    assert all(0 < timeout <= 30.0 for timeout in timeouts)
+    assert timeouts == sorted(timeouts, reverse=True)
+
+
+def test_shortest_solution_reuses_one_pool(monkeypatch):
+    monkeypatch.setitem(Kociemba_Solver.caches, "kociemba", None)
+    cube = _scrambled_cubes(1)[0]
+    lengths = []
+    pools = []
+    for _ in range(2):
+        solution = Kociemba_Solver(cube).get_shortest_solution(workers=2)
+        solved = cube.clone()
+        Scrambler().apply_scramble(solved, solution)
+        assert solved.is_solved()
+        lengths.append(len(solution))
+        pools.append(kociemba_module._pool)
+    assert lengths[0] == lengths[1]
+    assert pools[0] is pools[1] is not None
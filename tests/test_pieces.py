@@ -6,7 +6,7 @@ import pytest
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from core.pieces import Piece, Center, Edge, Corner
+from core.pieces import ORIENTATIONS, Piece, Center, Edge, Corner
 from utils.colors import Color
 from utils.faces import Face
 
@@ -101,3 +101,33 @@ def test_corner_initialization():
         ValueError, match="Corner piece must have exactly 3 colors and 3 faces."
     ):
         Corner({Color.YELLOW: Face.U, Color.BLUE: Face.F}, "invalid", (0, 0, 0))
+
+
+def test_pieces_are_slotted_with_integer_orientation():
+    corner = Corner(
+        {Color.YELLOW: Face.U, Color.BLUE: Face.F, Color.RED: Face.R}, "UFR", (2, 2, 2)
+    )
+    other = Corner(
+        {Color.YELLOW: Face.F, Color.BLUE: Face.R, Color.RED: Face.U}, "UFR", (2, 2, 2)
+    )
+    assert not hasattr(corner, "__dict__")
+    assert isinstance(corner.orientation, int)
+    assert corner.identity is other.identity  # shared, immutable
+    assert other.colors == {Color.YELLOW: Face.F, Color.BLUE: Face.R, Color.RED: Face.U}
+    assert ORIENTATIONS[other.orientation] == other.faces == (Face.F, Face.R, Face.U)
+
+    corner.set_faces(other.get_faces())
+    assert corner.orientation == other.orientation
+    assert corner.get_color(Face.U) is Color.RED
+    assert corner.get_color(Face.D) is None
+
+    # Fewer faces than colors only reassign the first colors
+    corner.set_faces({Color.WHITE: Face.L})
+    assert corner.faces == (Face.L, Face.R, Face.U)
+
+    # Two colors can never share a face
+    with pytest.raises(ValueError):
+        corner.set_faces({Color.WHITE: Face.R})
+    with pytest.raises(ValueError):
+        Edge({Color.BLUE: Face.F, Color.RED: Face.F}, "FR", (2, 1, 2))
+    assert corner.faces == (Face.L, Face.R, Face.U)
@@ -0,0 +1,37 @@
+# tests/test_random_state.py
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pytest
+
+from core.cube import RubiksCube
+from core.scramble import Scrambler, random_states
+from solver.random_state import RandomStateScrambler
+
+
+def test_random_state_scramble_reaches_the_drawn_state():
+    scrambler = RandomStateScrambler(seed=1)
+    expected = random_states(1, np.random.default_rng(1))[0]
+    scramble = scrambler.generate_scramble()
+    assert scrambler.history == [scramble]
+
+    cube = RubiksCube()
+    scrambler.apply_scramble(cube, scramble)
+    assert cube.state == expected
+    # Usable wherever a Scrambler is; the length is ignored
+    assert len(scrambler.generate_scramble(5)) > 5
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_random_state_stream(workers):
+    scrambles = list(RandomStateScrambler(seed=2).stream(4, workers=workers))
+    states = random_states(4, np.random.default_rng(2))
+    assert len(scrambles) == 4
+    for scramble, state in zip(scrambles, states):
+        cube = RubiksCube()
+        Scrambler().apply_scramble(cube, scramble)
+        assert cube.state == state
@@ -6,7 +6,18 @@ from unittest.mock import MagicMock
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from core.scramble import Scrambler
+import numpy as np
+import pytest
+
+from core.scramble import (
+    Scrambler,
+    decode_scramble,
+    generate_scrambles,
+    random_states,
+    rng_streams,
+    scramble_blocks,
+)
+from core.validate import parity
 
 
 def test_scrambler_initialization():
@@ -62,3 +73,65 @@ def test_scramble_history():
     assert len(scrambler.history) == 2
     assert scramble1 in scrambler.history
     assert scramble2 in scrambler.history
+
+
+def test_generate_scrambles_shape_and_faces():
+    scrambles = generate_scrambles(5000, 25, rng=1)
+    assert scrambles.shape == (5000, 25)
+    assert scrambles.dtype == np.uint8
+    assert scrambles.max() < 18
+    faces = scrambles // 3
+    assert (faces[:, 1:] != faces[:, :-1]).all()
+    # Every move shows up
+    assert len(np.unique(scrambles)) == 18
+
+
+def test_generate_scrambles_without_opposite_triples():
+    scrambles = generate_scrambles(5000, 25, rng=2, no_opposite_triples=True)
+    faces = scrambles // 3
+    axes = faces // 2
+    assert (faces[:, 1:] != faces[:, :-1]).all()
+    assert not ((axes[:, 2:] == axes[:, 1:-1]) & (axes[:, 1:-1] == axes[:, :-2])).any()
+
+
+def test_seeded_generation_is_reproducible():
+    assert (
+        generate_scrambles(10, 20, rng=5) == generate_scrambles(10, 20, rng=5)
+    ).all()
+    first, second = rng_streams(7, 2)
+    again = rng_streams(7, 2)[0]
+    a = generate_scrambles(100, 20, first)
+    assert (a == generate_scrambles(100, 20, again)).all()
+    assert (a != generate_scrambles(100, 20, second)).any()
+
+    blocks = list(scramble_blocks(1000, 20, seed=3, block_size=300))
+    assert [len(block) for block in blocks] == [300, 300, 300, 100]
+    again = list(scramble_blocks(1000, 20, seed=3, block_size=300))
+    assert all((x == y).all() for x, y in zip(blocks, again))
+
+
+def test_decode_scramble_and_invalid_arguments():
+    row = generate_scrambles(1, 20, rng=0)[0]
+    moves = decode_scramble(row)
+    assert len(moves) == 20
+    assert all(move in Scrambler.MOVES for move in moves)
+    assert generate_scrambles(3, 0).shape == (3, 0)
+    with pytest.raises(ValueError):
+        generate_scrambles(-1)
+    with pytest.raises(ValueError):
+        next(scramble_blocks(10, block_size=0))
+
+
+def test_random_states_are_valid_and_spread():
+    states = random_states(3000, rng=8)
+    for state in states:
+        assert sorted(state.cp) == list(range(8))
+        assert sorted(state.ep) == list(range(12))
+        assert sum(state.co) % 3 == 0
+        assert sum(state.eo) % 2 == 0
+        assert parity(state.cp) == parity(state.ep)
+    # Each corner shows up in the first slot about equally often
+    counts = np.bincount([state.cp[0] for state in states], minlength=8)
+    assert counts.min() > 300
+    # Both permutation parities occur
+    assert len({parity(state.cp) for state in states}) == 2
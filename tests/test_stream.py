@@ -0,0 +1,167 @@
+# tests/test_stream.py
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import main
+from core.cube import RubiksCube
+from core.cubie import CubieCube
+from core.scramble import Scrambler
+from solver import kociemba as kociemba_module
+from solver.kociemba import Kociemba_Solver
+from solver.stream import StreamStats, parse_line, solve_stream, write_record
+
+
+def _check(record):
+    cube = RubiksCube()
+    cube.state = CubieCube.from_facelet_string(record.cube_string)
+    Scrambler().apply_scramble(cube, record.solution)
+    assert cube.is_solved()
+
+
+def test_parse_line_plain_and_jsonl():
+    cube = RubiksCube()
+    cube.R()
+    cube.U_prime()
+    expected = cube.toString()
+
+    assert parse_line("R U'\n") == (None, expected)
+    assert parse_line(expected + "\n") == (None, expected)
+    assert parse_line('{"id": "a", "scramble": "R U\'"}', "jsonl") == ("a", expected)
+    assert parse_line('{"scramble": ["R", "U\'"]}', "jsonl") == (None, expected)
+    assert parse_line(json.dumps({"facelets": expected}), "jsonl") == (None, expected)
+
+    for text, fmt in [
+        ("R X", "plain"),
+        ("{", "jsonl"),
+        ("{}", "jsonl"),
+    ]:
+        with pytest.raises(ValueError):
+            parse_line(text, fmt)
+    for text in ["[1]", '{"facelets": 5}']:
+        with pytest.raises(TypeError):
+            parse_line(text, "jsonl")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_stream_keeps_input_order(workers):
+    lines = ["R U R' U'\n", "\n", "# comment\n", "R Q\n", "F2 L\n", "D B'\n"]
+    stats = StreamStats()
+    records = list(solve_stream(lines, workers=workers, chunksize=1, stats=stats))
+
+    assert [record.line for record in records] == [1, 4, 5, 6]
+    assert records[1].error == "Unknown move 'Q'."
+    for record in records[:1] + records[2:]:
+        assert record.ok
+        _check(record)
+    assert (stats.solved, stats.failed) == (3, 1)
+    assert "3 solved, 1 failed" in stats.summary()
+
+
+def test_solve_stream_unordered_and_solver_errors():
+    twisted = CubieCube()
+    twisted.co[0] = 1  # single twisted corner
+    lines = [
+        json.dumps({"id": 1, "facelets": "U" * 54}),
+        json.dumps({"id": 2, "scramble": "R"}),
+        json.dumps({"id": 3, "facelets": twisted.to_facelet_string()}),
+    ]
+    records = list(solve_stream(lines, fmt="jsonl", workers=2, ordered=False))
+
+    by_id = {record.id: record for record in records}
+    assert sorted(by_id) == [1, 2, 3]
+    assert by_id[1].cube_string is None and not by_id[1].ok
+    assert by_id[2].solution == ["R'"]
+    assert by_id[3].cube_string == twisted.to_facelet_string()
+    assert by_id[3].error.startswith("ValueError")
+
+
+def test_solve_stream_reports_any_backend_failure(monkeypatch):
+    def broken_backend(cube_string):
+        raise RuntimeError("backend crashed")
+
+    monkeypatch.setitem(kociemba_module.BACKENDS, "kociemba", broken_backend)
+    monkeypatch.setitem(Kociemba_Solver.caches, "kociemba", None)
+    records = list(solve_stream(["R\n", "U\n"]))
+    assert [record.error for record in records] == ["RuntimeError: backend crashed"] * 2
+
+
+def test_solve_stream_is_lazy():
+    def lines():
+        yield "R\n"
+        raise AssertionError("read past the first result")
+
+    records = solve_stream(lines())
+    assert next(records).solution == ["R'"]
+
+
+def test_unordered_stream_emits_parse_errors_at_once():
+    def lines():
+        yield "R Q\n"
+        raise AssertionError("read past the parse error")
+
+    records = solve_stream(lines(), workers=2, ordered=False)
+    assert next(records).error == "Unknown move 'Q'."
+
+
+def test_ordered_stream_holds_a_bounded_number_of_parse_errors():
+    read = []
+
+    def lines():
+        for number in range(1000):
+            read.append(number)
+            yield "R Q\n"
+
+    records = solve_stream(lines(), workers=2)
+    assert next(records).line == 1
+    # At most four entries per worker were in flight
+    assert len(read) <= 2 * 4
+    assert sum(1 for _ in records) == 999
+
+
+def test_invalid_arguments_raise_value_error():
+    with pytest.raises(ValueError):
+        solve_stream([], fmt="csv")
+    with pytest.raises(ValueError):
+        solve_stream([], backend="INVALID")
+    with pytest.raises(ValueError):
+        solve_stream([], workers=0)
+
+
+def test_write_record_formats():
+    record = next(solve_stream(['{"id": "x", "scramble": "U"}'], fmt="jsonl"))
+    plain, jsonl = io.StringIO(), io.StringIO()
+    write_record(record, plain)
+    write_record(record, jsonl, "jsonl")
+    assert plain.getvalue() == "U'\n"
+    assert json.loads(jsonl.getvalue()) == {
+        "line": 1,
+        "id": "x",
+        "facelets": record.cube_string,
+        "solution": "U'",
+        "length": 1,
+    }
+
+
+def test_main_solve_command():
+    args = main.parse_args(["solve"])
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = main.run_solve(args, io.StringIO("F\nF X\n"), stdout, stderr)
+
+    assert status == 1
+    assert stdout.getvalue().splitlines() == ["F'", "error: Unknown move 'X'."]
+    assert "1 solved, 1 failed" in stderr.getvalue()
+
+
+def test_main_solve_missing_file(tmp_path, capsys):
+    args = main.parse_args(["solve", str(tmp_path / "missing.txt")])
+    with pytest.raises(SystemExit) as info:
+        main.run_solve(args)
+    assert info.value.code == 2
+    assert "cannot read" in capsys.readouterr().err
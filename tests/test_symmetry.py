@@ -0,0 +1,102 @@
+# tests/test_symmetry.py
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cubie import MOVES, CubieCube
+from core.facelet import FaceletCube
+from core.symmetry import (
+    AXIS_ROTATIONS,
+    INVERSE_SYMMETRY,
+    N_SYMMETRIES,
+    ROTATIONS,
+    canonical,
+    conjugate,
+    map_moves,
+    orientation_variants,
+    translate_moves,
+    variant_moves,
+)
+
+SOLVED = FaceletCube().to_facelet_string()
+
+
+def _apply(cube_string, moves):
+    state = FaceletCube.from_facelet_string(cube_string)
+    for move in moves:
+        state.apply_move(move)
+    return state.to_facelet_string()
+
+
+def _scrambled(seed):
+    rng = random.Random(seed)
+    return _apply(SOLVED, [rng.choice(MOVES) for _ in range(25)])
+
+
+def test_symmetries_are_valid_and_invertible():
+    state = _scrambled(1)
+    images = {conjugate(state, symmetry) for symmetry in range(N_SYMMETRIES)}
+    assert len(images) == 48
+    assert conjugate(state, 0) == state
+    for symmetry in range(N_SYMMETRIES):
+        image = conjugate(state, symmetry)
+        CubieCube.from_facelet_string(image)  # raises if not a cube
+        assert conjugate(image, INVERSE_SYMMETRY[symmetry]) == state
+        assert conjugate(SOLVED, symmetry) == SOLVED
+
+
+def test_moves_commute_with_symmetries():
+    state = _scrambled(2)
+    for symmetry in range(N_SYMMETRIES):
+        image = conjugate(state, symmetry)
+        for move in MOVES:
+            assert conjugate(_apply(state, [move]), symmetry) == _apply(
+                image, map_moves([move], symmetry)
+            )
+
+
+def test_canonical_is_shared_and_solutions_translate_back():
+    state = _scrambled(3)
+    key, symmetry = canonical(state)
+    assert conjugate(state, symmetry) == key
+    for other in range(N_SYMMETRIES):
+        assert canonical(conjugate(state, other))[0] == key
+    assert canonical(state, ROTATIONS)[1] < 24
+
+    # A solution of the canonical state, translated, solves the original
+    scramble = ["R", "U'", "F2", "L", "D"]
+    state = _apply(SOLVED, scramble)
+    key, symmetry = canonical(state)
+    inverse = [move[0] + {"": "'", "'": "", "2": "2"}[move[1:]] for move in scramble]
+    solution = map_moves(inverse[::-1], symmetry)
+    assert _apply(key, solution) == SOLVED
+    assert _apply(state, translate_moves(solution, symmetry)) == SOLVED
+
+    with pytest.raises(ValueError):
+        canonical("UUU")
+
+
+def test_orientation_variants_map_solutions_back():
+    scramble = ["R", "U'", "F2", "L", "D", "B'", "U2"]
+    state = _apply(SOLVED, scramble)
+    inverse = [move[0] + {"": "'", "'": "", "2": "2"}[move[1:]] for move in scramble]
+    variants = orientation_variants(state)
+    assert [variant[1:] for variant in variants] == [
+        (symmetry, inverted)
+        for symmetry in AXIS_ROTATIONS
+        for inverted in (False, True)
+    ]
+    assert variants[0][0] == state
+
+    for facelets, symmetry, inverted in variants:
+        # The inverse state is solved by the scramble itself
+        solution = map_moves(scramble if inverted else inverse[::-1], symmetry)
+        assert _apply(facelets, solution) == SOLVED
+        assert _apply(state, variant_moves(solution, symmetry, inverted)) == SOLVED
+    # The three axes are different views of the state
+    assert len({facelets for facelets, _, _ in variants}) == 6
@@ -0,0 +1,58 @@
+# tests/test_tablefile.py
+
+import os
+import stat
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from solver.tablefile import FILE_MODE, read_sections, write_sections
+
+MAGIC = b"RBXTESTS"
+TYPES = {"small": "H", "large": "I"}
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "sections.bin")
+    sections = {
+        "small": np.arange(5, dtype=np.uint16),
+        "large": np.arange(3, dtype=np.uint32) * 70000,
+    }
+    write_sections(path, MAGIC, 2, sections, TYPES, metadata=b"\x07")
+    return path
+
+
+def test_round_trip(path):
+    sections, metadata, buffer = read_sections(path, MAGIC, 2, TYPES, 1)
+    assert metadata == b"\x07"
+    assert sections["small"].tolist() == [0, 1, 2, 3, 4]
+    assert sections["large"].tolist() == [0, 70000, 140000]
+    assert sections["large"].format == "I"
+    for view in sections.values():
+        view.release()
+    buffer.close()
+    assert stat.S_IMODE(os.stat(path).st_mode) == FILE_MODE
+
+
+def test_bad_files_raise_value_error(path, tmp_path):
+    with pytest.raises(ValueError):
+        read_sections(path, b"RBXOTHER", 2, TYPES, 1)
+    with pytest.raises(ValueError):
+        read_sections(path, MAGIC, 3, TYPES, 1)
+    with pytest.raises(ValueError):
+        read_sections(path, MAGIC, 2, {**TYPES, "missing": "B"}, 1)
+    with pytest.raises(ValueError):
+        read_sections(path, MAGIC, 2, {"small": "B"}, 1)
+
+    with open(path, "rb") as file:
+        data = file.read()
+    damaged = tmp_path / "damaged.bin"
+    # Cut inside the header, inside the entries and inside the last section
+    for size in (0, 10, 40, len(data) - 1):
+        damaged.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            read_sections(str(damaged), MAGIC, 2, TYPES, 1)
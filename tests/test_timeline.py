@@ -0,0 +1,59 @@
+# tests/test_timeline.py
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cubie import MOVES, CubieCube
+from core.facelet import FaceletCube
+from core.timeline import Timeline
+
+
+def _replay(start, codes):
+    state = start.copy()
+    for code in codes:
+        state.apply_move(MOVES[code])
+    return state
+
+
+@pytest.mark.parametrize("engine", [CubieCube, FaceletCube])
+def test_state_at_matches_replay(engine):
+    rng = random.Random(4)
+    start = engine()
+    start.apply_move("F")
+    codes = bytes(rng.randrange(18) for _ in range(200))
+    timeline = Timeline(start, codes, interval=16)
+
+    for index in [0, 1, 15, 16, 17, 100, 199, 200]:
+        assert timeline.state_at(index) == _replay(start, codes[:index])
+    assert timeline.checkpoints == 200 // 16 + 1
+    with pytest.raises(IndexError):
+        timeline.state_at(201)
+
+
+def test_update_keeps_unchanged_snapshots():
+    rng = random.Random(5)
+    codes = bytes(rng.randrange(18) for _ in range(100))
+    timeline = Timeline(CubieCube(), codes, interval=10)
+    timeline.state_at(100)
+    assert timeline.checkpoints == 11
+
+    changed = codes[:55] + bytes([0, 1, 2])
+    timeline.update(changed)
+    assert timeline.checkpoints == 6
+    assert timeline.state_at(58) == _replay(CubieCube(), changed)
+
+
+def test_snapshots_round_trip():
+    cube = CubieCube()
+    cube.apply_move("R")
+    assert len(cube.to_bytes()) == 40
+    assert CubieCube.from_bytes(cube.to_bytes()) == cube
+    facelets = FaceletCube.from_facelet_string(cube.to_facelet_string())
+    assert FaceletCube.from_bytes(facelets.to_bytes()) == facelets
+    with pytest.raises(ValueError):
+        Timeline(cube, interval=0)
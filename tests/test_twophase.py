@@ -0,0 +1,115 @@
+# tests/test_twophase.py
+
+import os
+import random
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cube import RubiksCube
+from core.cubie import CubieCube
+from core.scramble import Scrambler
+from solver import twophase
+from solver.kociemba import Kociemba_Solver
+from solver.tables import TABLE_TYPES, load_tables, read_tables
+from solver.twophase import TwoPhaseSolver
+
+TIMEOUT = 10.0
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("tables") / "twophase.bin")
+    load_tables(path).close()
+    return path
+
+
+@pytest.fixture(scope="module")
+def tables(table_path):
+    tables = read_tables(table_path)
+    yield tables
+    tables.close()
+
+
+def _is_solution(cube_string, moves):
+    cube = RubiksCube()
+    cube.state = CubieCube.from_facelet_string(cube_string)
+    Scrambler().apply_scramble(cube, moves)
+    return cube.is_solved()
+
+
+def test_tables_are_memory_mapped(tables):
+    for name, typecode in TABLE_TYPES.items():
+        table = getattr(tables, name)
+        assert isinstance(table, memoryview)
+        assert table.format == typecode
+    # Solved state is at distance 0 in every pruning table
+    assert tables.twist_slice_prune[0] == 0
+    assert tables.corners_slice_prune[0] == 0
+
+
+def test_wrong_version_is_regenerated(tmp_path, table_path):
+    path = tmp_path / "old.bin"
+    with open(table_path, "rb") as source:
+        data = bytearray(source.read())
+    data[8] += 1  # version field
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        read_tables(str(path))
+    load_tables(str(path)).close()
+    read_tables(str(path)).close()
+
+
+def test_solve_scrambles(tables):
+    solver = TwoPhaseSolver(tables)
+    scrambler = Scrambler()
+    for _ in range(3):
+        cube = RubiksCube()
+        scrambler.apply_scramble(cube, scrambler.generate_scramble(25))
+        start = time.monotonic()
+        solution = solver.solve(cube.toString(), timeout=TIMEOUT)
+        assert _is_solution(cube.toString(), solution)
+        # Longer solutions are only returned once the timeout has run out
+        if len(solution) > 21:
+            assert time.monotonic() - start >= TIMEOUT
+
+
+def test_timeout_returns_shortest_found(tables):
+    random.seed(2024)
+    cube = RubiksCube()
+    scrambler = Scrambler()
+    scrambler.apply_scramble(cube, scrambler.generate_scramble(25))
+    # No solution reaches max_length=1, so the search runs to the timeout
+    start = time.monotonic()
+    solution = TwoPhaseSolver(tables).solve(cube.toString(), max_length=1, timeout=0.5)
+    assert time.monotonic() - start >= 0.5
+    assert 1 < len(solution) <= twophase.MAX_SEARCH_LENGTH
+    assert _is_solution(cube.toString(), solution)
+
+
+def test_solve_solved_cube(tables):
+    assert TwoPhaseSolver(tables).solve(RubiksCube().toString()) == []
+
+
+def test_unsolvable_cube_raises_value_error(tables):
+    cube = CubieCube()
+    cube.eo[0] = 1  # single flipped edge
+    with pytest.raises(ValueError):
+        TwoPhaseSolver(tables).solve(cube.to_facelet_string())
+
+
+def test_kociemba_solver_twophase_backend(tables, monkeypatch):
+    monkeypatch.setattr(twophase, "_tables", tables)
+    cube = RubiksCube()
+    cube.R()
+    cube.U_prime()
+    cube.F2()
+    solution = Kociemba_Solver(cube, backend="twophase").get_solution()
+    assert _is_solution(cube.toString(), solution)
+
+    with pytest.raises(ValueError):
+        Kociemba_Solver(cube, backend="INVALID")
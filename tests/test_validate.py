@@ -0,0 +1,90 @@
+# tests/test_validate.py
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cube import RubiksCube
+from core.cubie import CubieCube
+from core.validate import ISSUE_BITS, check, describe, is_valid, validate, validate_many
+from solver.kociemba import Kociemba_Solver
+
+
+def _scrambled() -> str:
+    cube = RubiksCube()
+    cube.apply_algorithm("R U2 F' L D B2 R' U")
+    return cube.toString()
+
+
+def _swap(cube_string: str, i: int, j: int) -> str:
+    stickers = list(cube_string)
+    stickers[i], stickers[j] = stickers[j], stickers[i]
+    return "".join(stickers)
+
+
+def _broken() -> dict:
+    state = _scrambled()
+    cube = CubieCube.from_facelet_string(state)
+    cube.cp[0], cube.cp[1] = cube.cp[1], cube.cp[0]
+    swapped = cube.to_facelet_string()
+    cube = CubieCube.from_facelet_string(state)
+    cube.co[0] = (cube.co[0] + 1) % 3
+    twisted = cube.to_facelet_string()
+    cube = CubieCube.from_facelet_string(state)
+    cube.eo[0] ^= 1
+    flipped = cube.to_facelet_string()
+    return {
+        "length": state[:53],
+        "stickers": "X" + state[1:],
+        "centers": _swap(state, 4, 13),
+        "corners": _swap(state, 8, 9),  # URF shows two stickers of one color
+        "twist": twisted,
+        "flip": flipped,
+        "parity": swapped,
+    }
+
+
+def test_valid_states_pass():
+    assert validate(_scrambled()) == []
+    assert is_valid(RubiksCube().toString())
+    check(_scrambled())
+
+
+def test_each_problem_is_reported_with_its_code():
+    for code, state in _broken().items():
+        issues = validate(state)
+        assert code in {issue.code for issue in issues}, code
+        assert not is_valid(state)
+    issue = validate(_broken()["stickers"])[0]
+    assert issue.code == "stickers" and issue.where == _scrambled()[0]
+    with pytest.raises(ValueError, match="Invalid cube: A corner is twisted."):
+        check(_broken()["twist"])
+
+
+def test_bulk_matches_single_validation():
+    states = [_scrambled(), *_broken().values()]
+    masks = validate_many(states)
+    for state, mask in zip(states, masks):
+        assert describe(mask) == sorted(
+            {issue.code for issue in validate(state)}, key=list(ISSUE_BITS).index
+        )
+
+    stickers = np.frombuffer(_scrambled().encode() * 4, dtype=np.uint8).reshape(4, 54)
+    assert validate_many(stickers, chunk=3).tolist() == [0] * 4
+    with pytest.raises(ValueError):
+        validate_many(np.zeros((2, 53), dtype=np.uint8))
+
+
+def test_solver_rejects_invalid_state_before_solving(monkeypatch):
+    def fail(cube_string):
+        raise AssertionError("the backend must not be called")
+
+    monkeypatch.setitem(sys.modules["solver.kociemba"].BACKENDS, "kociemba", fail)
+    cube = RubiksCube()
+    cube.state = CubieCube.from_facelet_string(_broken()["flip"])
+    with pytest.raises(ValueError, match="An edge is flipped"):
+        Kociemba_Solver(cube).get_solution()
@@ -0,0 +1,45 @@
+# tests/test_zobrist.py
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.cubie import MOVES, CubieCube
+from core.facelet import FaceletCube
+from core.zobrist import move_hash, state_hash
+
+
+def test_engines_hash_alike():
+    assert state_hash(CubieCube()) == state_hash(FaceletCube())
+    cube = CubieCube()
+    cube.apply_move("R")
+    assert state_hash(cube) == state_hash(
+        FaceletCube.from_facelet_string(cube.to_facelet_string())
+    )
+    assert state_hash(cube) != state_hash(CubieCube())
+
+
+def test_incremental_updates_match_full_hash():
+    rng = random.Random(7)
+    for state in (CubieCube(), FaceletCube()):
+        key = state_hash(state)
+        for _ in range(300):
+            move = rng.choice(MOVES)
+            key ^= move_hash(state, move)
+            state.apply_move(move)
+            key ^= move_hash(state, move)
+            assert key == state_hash(state)
+
+
+def test_hash_fits_64_bits_and_separates_states():
+    rng = random.Random(11)
+    seen = {}
+    cube = CubieCube()
+    for _ in range(2000):
+        cube.apply_move(rng.choice(MOVES))
+        key = state_hash(cube)
+        assert 0 <= key < 2**64
+        facelets = cube.to_facelet_string()
+        assert seen.setdefault(key, facelets) == facelets
@@ -4,7 +4,7 @@ import pygame
 from utils.faces import Face
 from core.cube import RubiksCube
 from core.scramble import Scrambler
-from solver.kociemba import Kociemba_Solver
+from solver.background import BackgroundSolver
 from visualizer.buttons import Button, RotatingColorButton
 
 
@@ -52,6 +52,12 @@ FACE_POSITIONS = {
 
 FACE_SIZE = 150
 
+# Seconds a solve may run in the background before it is abandoned
+SOLVE_TIMEOUT = 10.0
+
+# Frame rate cap for the main loop
+FPS = 60
+
 
 # Displays Solution Steps (just like move history)
 def draw_solution(screen, solution_moves, font, rect, offset):
@@ -70,6 +76,13 @@ def draw_solution(screen, solution_moves, font, rect, offset):
         y_offset += line_height
 
 
+# Displays what the background solver is doing above the solution panel
+def draw_solve_status(screen, status, font, rect):
+    if status:
+        status_text = font.render(status, True, (255, 255, 255))
+        screen.blit(status_text, (rect.left, rect.top - font.get_height() - 5))
+
+
 # Function to draw a 3x3 face with different colors
 def draw_face(x, y, colors):
     """Draw a 3x3 face of the Rubik's Cube."""
@@ -100,21 +113,36 @@ def draw_face(x, y, colors):
             )
 
 
-# Displays Moves as they are used
+# Displays Moves as they are used; undone moves (still redoable) are grayed
 def draw_move_history(screen, history, font, rect, offset):
     pygame.draw.rect(screen, (30, 30, 30), rect)  # dark background
     pygame.draw.rect(screen, (255, 255, 255), rect, 2)  # White border
 
     padding = 10
-    y_offset = rect.top + padding + offset
     line_height = font.get_height() + 5
-
-    for i, move in enumerate(history[-len(history) :]):
-        move_text = font.render(f"{i+1}. {move}", True, (255, 255, 255))
+    moves = list(history) + history.undone
+
+    # Only render the lines inside the panel, however long the history is
+    first = max(0, -offset // line_height)
+    last = min(len(moves), first + rect.height // line_height + 1)
+    for i in range(first, last):
+        color = (255, 255, 255) if i < len(history) else (120, 120, 120)
+        move_text = font.render(f"{i+1}. {moves[i]}", True, color)
+        y_offset = rect.top + padding + offset + i * line_height
         text_rect = move_text.get_rect(topleft=(rect.left + padding, y_offset))
         if rect.top <= text_rect.top <= rect.bottom:
             screen.blit(move_text, text_rect)
-        y_offset += line_height
+
+
+# Index of the history line at a click position, or None
+def history_index_at(pos, history, font, rect, offset):
+    if not rect.collidepoint(pos):
+        return None
+    line_height = font.get_height() + 5
+    index = (pos[1] - rect.top - 10 - offset) // line_height
+    if 0 <= index < len(history) + len(history.undone):
+        return index
+    return None
 
 
 # Brief Flash for Resetting State
@@ -167,6 +195,24 @@ reset_button = RotatingColorButton(
     text="RESET",
 )
 
+# Undo / Redo Buttons (also Ctrl+Z and Ctrl+Y)
+undo_button = Button(
+    50 + (button_width + button_spacing) * 10,
+    button_area_height + 150,
+    button_width,
+    button_height,
+    (255, 255, 255),
+    "UNDO",
+)
+redo_button = Button(
+    200 + (button_width + button_spacing) * 10,
+    button_area_height + 150,
+    button_width,
+    button_height,
+    (255, 255, 255),
+    "REDO",
+)
+
 clear_button = Button(
     history_rect.x, history_rect.bottom, history_rect.width, 30, (200, 0, 0), "CLEAR"
 )
@@ -215,6 +261,8 @@ buttons.append(clear_button)
 buttons.append(scramble_button)
 buttons.append(reset_button)
 buttons.append(solve_button)
+buttons.append(undo_button)
+buttons.append(redo_button)
 
 
 # Main display function (UI logic)
@@ -226,13 +274,33 @@ def display_cube(cube: RubiksCube, scrambler: Scrambler):
     solution_offset = 0
     scroll_offset = 0
     SCROLL_STEP = 20  # pixels to scroll per wheel event
+    clock = pygame.time.Clock()
+
+    # Solving runs in a worker process so the window keeps responding
+    solver = BackgroundSolver(timeout=SOLVE_TIMEOUT)
+    solve_status = ""
 
     while running:
+        clock.tick(FPS)
         screen.fill((100, 100, 100))  # grey background
 
+        # Pick up a finished solve; drop it if the cube changed meanwhile
+        result = solver.poll()
+        if result is not None:
+            solve_button.text = "SOLVE"
+            if result.cube_string != cube.toString():
+                solve_status = "Cube changed, solution discarded"
+            elif result.ok:
+                solution_moves = result.solution
+                solution_offset = 0
+                solve_status = f"Solved in {len(solution_moves)} moves"
+            else:
+                solve_status = result.error
+
         # Draw Move History window
         draw_move_history(screen, cube.move_history, font, history_rect, scroll_offset)
         draw_solution(screen, solution_moves, font, solution_rect, solution_offset)
+        draw_solve_status(screen, solve_status, font, solution_rect)
 
         # Draw the Rubik's Cube faces
         for face, (x, y) in FACE_POSITIONS.items():
@@ -246,6 +314,22 @@ def display_cube(cube: RubiksCube, scrambler: Scrambler):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if (
+                event.type == pygame.KEYDOWN
+                and event.key == pygame.K_ESCAPE
+                and solver.busy
+            ):
+                solver.cancel()
+                solve_button.text = "SOLVE"
+                solve_status = "Solve cancelled"
+            if event.type == pygame.KEYDOWN and event.mod & pygame.KMOD_CTRL:
+                # Ctrl+Z undoes, Ctrl+Y or Ctrl+Shift+Z redoes
+                if event.key == pygame.K_y or (
+                    event.key == pygame.K_z and event.mod & pygame.KMOD_SHIFT
+                ):
+                    cube.redo()
+                elif event.key == pygame.K_z:
+                    cube.undo()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 # Scroll wheel up
                 if event.button == 4:
@@ -261,6 +345,14 @@ def display_cube(cube: RubiksCube, scrambler: Scrambler):
                 scroll_offset = min(scroll_offset, 0)
                 solution_offset = min(solution_offset, 0)
 
+                # Clicking a history line jumps to the state after that move
+                if event.button == 1:
+                    index = history_index_at(
+                        event.pos, cube.move_history, font, history_rect, scroll_offset
+                    )
+                    if index is not None:
+                        cube.seek(index + 1)
+
                 for button in buttons:
                     if button.is_clicked(event.pos):
                         if button.text == "CLEAR":
@@ -270,13 +362,21 @@ def display_cube(cube: RubiksCube, scrambler: Scrambler):
                         elif button.text == "SCRAMBLE":
                             scramble = scrambler.generate_scramble()
                             scrambler.apply_scramble(cube, scramble)
+                        elif button.text == "UNDO":
+                            cube.undo()
+                        elif button.text == "REDO":
+                            cube.redo()
                         elif button.text == "RESET":
                             flash_screen()
                             cube = RubiksCube()
                         elif button.text == "SOLVE":
-                            solver = Kociemba_Solver(cube)
-                            solution_moves = solver.get_solution()
-                            solution_offset = 0
+                            solver.start(cube)
+                            solve_button.text = "CANCEL"
+                            solve_status = "Solving..."
+                        elif button.text == "CANCEL":
+                            solver.cancel()
+                            solve_button.text = "SOLVE"
+                            solve_status = "Solve cancelled"
                         else:
                             move = button.text
                             rotation_method = {
@@ -304,4 +404,5 @@ def display_cube(cube: RubiksCube, scrambler: Scrambler):
 
         # Update the display after each move
         pygame.display.update()
+    solver.close()
     pygame.quit()